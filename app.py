@@ -3,164 +3,68 @@
 #  - v5.0 (엑셀 기반) + v6.0 (크롤링) 통합 버전
 #  - 엑셀 히스토리 + 웹 크롤링(당일/전일) 병합
 #  - 환율 / REC / SMP / 유가 / LNG / 금리 실시간 업데이트
+#  - 데이터/분석 로직은 ifam 패키지(Streamlit 비의존), 이 파일은 화면만 담당
+#  - plotly는 차트를 그리는 탭 함수 안에서 import (첫 화면인 사용 메뉴얼 탭만 보는 세션은 로딩하지 않음)
 # =============================================================================
 
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
 from datetime import datetime, timedelta
-from scipy import stats
-from sklearn.linear_model import LinearRegression
-from sklearn.preprocessing import StandardScaler
-from sklearn.metrics import r2_score, mean_absolute_error
-import requests
-from bs4 import BeautifulSoup
+import json
+import os
 import warnings
 
-warnings.filterwarnings("ignore")
-
-# =============================================================================
-# 설정
-# =============================================================================
+from ifam.analytics import interpret_correlation
+from ifam.cache import cache_stats
+from ifam.causality import granger_table
+from ifam.config import (
+    ALERT_MODE,
+    CHART_PERIODS,
+    COLUMN_FREQ,
+    DATA_PATH,
+    INDICATORS,
+    KEY_INDICATORS,
+    RISK_PERIODS,
+    RISK_VAR_ALPHA,
+    RISK_VOL_WINDOW,
+    SCENARIO_HORIZON,
+    SCENARIO_LOOKBACK,
+    SCENARIO_PRESETS,
+)
+from ifam.crawlers import CRAWL_SOURCES
+from ifam.export import EXPORT_FORMATS, available_formats, export_filename, open_export
+from ifam.formatting import (
+    DASHBOARD_CSS,
+    create_alert_item,
+    create_metric_card,
+    format_value,
+    get_change_html,
+)
+from ifam.grid import GRID_PAGE_SIZES, RESAMPLE_HOW, RESAMPLE_RULES, grid_page, page_count
+from ifam.loader import load_store, refresh_sources
+from ifam.perf import PERF_ENV_ENABLED, perf_begin, perf_stage
+from ifam.regimes import latest_break
+from ifam.service import (
+    cached_alert_scan,
+    cached_chart_series,
+    cached_correlation_matrix,
+    cached_lagged_correlation,
+    cached_market_summary,
+    cached_overview,
+    cached_regimes,
+    cached_regression,
+    cached_resample,
+    cached_risk_table,
+    cached_rolling_vol,
+    cached_scenario,
+    cached_signals,
+    cached_var,
+)
+from ifam.simulation import calculate_renewable_revenue
+from ifam.validate import recent_quarantine
 
-DATA_PATH = "data/데일리_클리핑_자료.xlsm"
-
-DATA_COLUMNS = [
-    "날짜",
-    "달러환율",
-    "엔환율",
-    "유로환율",
-    "위안화환율",
-    "육지 가격",
-    "육지 거래량",
-    "제주 가격",
-    "제주 거래량",
-    "육지 SMP",
-    "제주 SMP",
-    "두바이유",
-    "브렌트유",
-    "WTI",
-    "탱크로리용",
-    "연료전지용",
-    "콜금리(1일)",
-    "CD (91일)",
-    "CP (91일)",
-    "국고채 (3년)",
-    "국고채 (5년)",
-    "국고채 (10년)",
-    "산금채 (1년)",
-    "회사채 (3년)(AA-)",
-    "회사채 (3년)(BBB-)",
-    "IRS (3년)",
-    "IRS (5년)",
-    "IRS (10년)",
-    "CRS (1년)",
-    "CRS (3년)",
-]
-
-INDICATORS = {
-    "환율": {
-        "icon": "💱",
-        "color": "#3498db",
-        "columns": {
-            "달러환율": {"unit": "원", "format": "{:,.1f}"},
-            "엔환율": {"unit": "원/100엔", "format": "{:,.2f}"},
-            "유로환율": {"unit": "원", "format": "{:,.2f}"},
-            "위안화환율": {"unit": "원", "format": "{:,.2f}"},
-        },
-    },
-    "REC": {
-        "icon": "📗",
-        "color": "#27ae60",
-        "columns": {
-            "육지 가격": {"unit": "원/REC", "format": "{:,.0f}"},
-            "육지 거래량": {"unit": "REC", "format": "{:,.0f}"},
-            "제주 가격": {"unit": "원/REC", "format": "{:,.0f}"},
-            "제주 거래량": {"unit": "REC", "format": "{:,.0f}"},
-        },
-    },
-    "SMP": {
-        "icon": "⚡",
-        "color": "#f39c12",
-        "columns": {
-            "육지 SMP": {"unit": "원/kWh", "format": "{:,.2f}"},
-            "제주 SMP": {"unit": "원/kWh", "format": "{:,.2f}"},
-        },
-    },
-    "유가": {
-        "icon": "🛢️",
-        "color": "#e74c3c",
-        "columns": {
-            "두바이유": {"unit": "$/배럴", "format": "{:,.2f}"},
-            "브렌트유": {"unit": "$/배럴", "format": "{:,.2f}"},
-            "WTI": {"unit": "$/배럴", "format": "{:,.2f}"},
-        },
-    },
-    "LNG": {
-        "icon": "🔥",
-        "color": "#9b59b6",
-        "columns": {
-            "탱크로리용": {"unit": "원/MJ", "format": "{:,.4f}"},
-            "연료전지용": {"unit": "원/MJ", "format": "{:,.4f}"},
-        },
-    },
-    "금리": {
-        "icon": "📊",
-        "color": "#1abc9c",
-        "columns": {
-            "콜금리(1일)": {"unit": "%", "format": "{:,.3f}"},
-            "CD (91일)": {"unit": "%", "format": "{:,.2f}"},
-            "CP (91일)": {"unit": "%", "format": "{:,.2f}"},
-            "국고채 (3년)": {"unit": "%", "format": "{:,.3f}"},
-            "국고채 (5년)": {"unit": "%", "format": "{:,.3f}"},
-            "국고채 (10년)": {"unit": "%", "format": "{:,.3f}"},
-            "산금채 (1년)": {"unit": "%", "format": "{:,.3f}"},
-            "회사채 (3년)(AA-)": {"unit": "%", "format": "{:,.3f}"},
-            "회사채 (3년)(BBB-)": {"unit": "%", "format": "{:,.3f}"},
-        },
-    },
-    "스왑": {
-        "icon": "🔄",
-        "color": "#34495e",
-        "columns": {
-            "IRS (3년)": {"unit": "%", "format": "{:,.4f}"},
-            "IRS (5년)": {"unit": "%", "format": "{:,.4f}"},
-            "IRS (10년)": {"unit": "%", "format": "{:,.4f}"},
-            "CRS (1년)": {"unit": "%", "format": "{:,.2f}"},
-            "CRS (3년)": {"unit": "%", "format": "{:,.2f}"},
-        },
-    },
-}
-
-CHART_PERIODS = {"1개월": 30, "3개월": 90, "6개월": 180, "1년": 365, "전체": None}
-
-ALERT_THRESHOLDS = {
-    "환율": 1.0,
-    "REC": 3.0,
-    "SMP": 5.0,
-    "유가": 3.0,
-    "LNG": 5.0,
-    "금리": 0.1,
-    "스왑": 0.1,
-}
-
-KEY_INDICATORS = [
-    "달러환율",
-    "유로환율",
-    "위안화환율",
-    "육지 SMP",
-    "제주 SMP",
-    "두바이유",
-    "브렌트유",
-    "WTI",
-    "국고채 (3년)",
-    "국고채 (5년)",
-    "국고채 (10년)",
-    "IRS (3년)",
-    "IRS (5년)",
-]
+warnings.filterwarnings("ignore")
 
 # =============================================================================
 # 페이지 설정
@@ -173,1215 +77,1003 @@ st.set_page_config(
     initial_sidebar_state="expanded",
 )
 
+# ECOS API 키는 코어 크롤러가 환경변수로 읽으므로 secrets 값을 넘겨준다
+try:
+    if st.secrets.get("ECOS_API_KEY"):
+        os.environ.setdefault("ECOS_API_KEY", st.secrets["ECOS_API_KEY"])
+except Exception:
+    # secrets.toml이 없는 환경에서는 기존 환경변수 그대로 사용
+    pass
+
+# IFAM_API_PORT가 있으면 같은 프로세스에서 읽기 전용 API도 제공 (load_store / 분석 캐시 공유)
+if os.environ.get("IFAM_API_PORT"):
+    from ifam.api import start_background
+
+    try:
+        start_background(
+            os.environ.get("IFAM_API_HOST", "127.0.0.1"), int(os.environ["IFAM_API_PORT"])
+        )
+    except (OSError, ValueError) as e:
+        warnings.warn(f"API 서버를 시작하지 못했습니다: {e}")
+
 # =============================================================================
 # CSS 스타일
 # =============================================================================
 
-st.markdown(
-    """
-<style>
-    .main-header {
-        background: linear-gradient(90deg, #0f3460 0%, #1a1a2e 100%);
-        padding: 1.5rem 2rem;
-        border-radius: 15px;
-        margin-bottom: 2rem;
-        border: 1px solid #27ae60;
-    }
-    .main-header h1 { color: #ffffff; font-size: 2rem; margin: 0; }
-    .main-header p { color: #aaaaaa; margin: 0.5rem 0 0 0; font-size: 0.9rem; }
-    .metric-card {
-        background: linear-gradient(145deg, #16213e 0%, #1a1a2e 100%);
-        border-radius: 12px;
-        padding: 1.2rem;
-        border: 1px solid #0f3460;
-        margin-bottom: 1rem;
-    }
-    .metric-card:hover { border-color: #27ae60; }
-    .metric-title { color: #888888; font-size: 0.85rem; margin-bottom: 0.5rem; }
-    .metric-value { color: #ffffff; font-size: 1.5rem; font-weight: 700; margin-bottom: 0.3rem; }
-    .metric-change-up { color: #00d26a; font-size: 0.9rem; font-weight: 600; }
-    .metric-change-down { color: #ff6b6b; font-size: 0.9rem; font-weight: 600; }
-    .metric-change-neutral { color: #888888; font-size: 0.9rem; }
-    .category-header {
-        display: flex;
-        align-items: center;
-        gap: 0.5rem;
-        padding: 0.8rem 1rem;
-        background: linear-gradient(90deg, #0f3460 0%, transparent 100%);
-        border-radius: 8px;
-        margin: 1.5rem 0 1rem 0;
-        border-left: 4px solid;
-    }
-    .category-header h3 { color: #ffffff; margin: 0; font-size: 1.1rem; }
-    .alert-box {
-        background: linear-gradient(90deg, rgba(233, 69, 96, 0.2) 0%, transparent 100%);
-        border-left: 4px solid #e94560;
-        padding: 1rem 1.5rem;
-        border-radius: 0 8px 8px 0;
-        margin-bottom: 1rem;
-    }
-    .alert-box h4 { color: #e94560; margin: 0 0 0.5rem 0; }
-    .alert-item {
-        background: rgba(233,69,96,0.1);
-        padding: 0.8rem;
-        border-radius: 8px;
-        border: 1px solid;
-        margin-bottom: 0.5rem;
-    }
-    .insight-box {
-        background: linear-gradient(145deg, #1a3a5c 0%, #16213e 100%);
-        border-radius: 12px;
-        padding: 1.5rem;
-        border: 1px solid #3498db;
-        margin: 1rem 0;
-    }
-    .insight-box h4 { color: #3498db; margin: 0 0 0.8rem 0; }
-    .insight-box p { color: #ffffff; margin: 0.3rem 0; line-height: 1.6; }
-    .prediction-box {
-        background: linear-gradient(145deg, #1a4a3c 0%, #16213e 100%);
-        border-radius: 12px;
-        padding: 1.5rem;
-        border: 1px solid #27ae60;
-        margin: 1rem 0;
-    }
-    .prediction-box h4 { color: #27ae60; margin: 0 0 0.8rem 0; }
-    .signal-buy {
-        background: linear-gradient(145deg, #1a4a3c 0%, #16213e 100%);
-        border: 2px solid #00d26a;
-        border-radius: 12px;
-        padding: 1rem;
-        text-align: center;
-    }
-    .signal-sell {
-        background: linear-gradient(145deg, #4a1a1a 0%, #16213e 100%);
-        border: 2px solid #ff6b6b;
-        border-radius: 12px;
-        padding: 1rem;
-        text-align: center;
-    }
-    .signal-hold {
-        background: linear-gradient(145deg, #3a3a1a 0%, #16213e 100%);
-        border: 2px solid #f39c12;
-        border-radius: 12px;
-        padding: 1rem;
-        text-align: center;
-    }
-    .summary-card {
-        background: linear-gradient(145deg, #1a2a4a 0%, #16213e 100%);
-        border-radius: 12px;
-        padding: 1.5rem;
-        border: 1px solid #3498db;
-        margin: 0.5rem 0;
-    }
-    .manual-section {
-        background: linear-gradient(145deg, #1a2a3a 0%, #16213e 100%);
-        border-radius: 12px;
-        padding: 1.5rem;
-        border: 1px solid #3498db;
-        margin: 1rem 0;
-    }
-    .manual-section h4 { color: #3498db; margin: 0 0 1rem 0; }
-    .example-box {
-        background: rgba(39, 174, 96, 0.1);
-        border-left: 4px solid #27ae60;
-        padding: 1rem;
-        margin: 0.5rem 0;
-        border-radius: 0 8px 8px 0;
-    }
-    .tip-box {
-        background: rgba(241, 196, 15, 0.1);
-        border-left: 4px solid #f1c40f;
-        padding: 1rem;
-        margin: 0.5rem 0;
-        border-radius: 0 8px 8px 0;
-    }
-    .correlation-strong { color: #00d26a; font-weight: bold; }
-    .correlation-moderate { color: #f39c12; font-weight: bold; }
-    .correlation-weak { color: #888888; }
-</style>
-""",
-    unsafe_allow_html=True,
-)
+st.markdown(f"<style>{DASHBOARD_CSS}</style>", unsafe_allow_html=True)
 
 # =============================================================================
-# 크롤링 함수들 (실제 HTML 구조에 맞게 selector는 한 번씩 확인 필요)
+# 성능 패널 (IFAM_PERF=1 환경변수 또는 URL ?perf=1 일 때만 표시)
 # =============================================================================
 
 
-@st.cache_data(ttl=1800, show_spinner=False)
-def fetch_fx_smbs(target_date):
-    """
-    환율 - 서울외국환중개 (smbs.biz)
-    URL: http://www.smbs.biz/ExRate/TodayExRate.jsp?tr_date=YYYYMMDD
-
-    반환 예시:
-    {
-      '달러환율': 1473.5,
-      '엔환율': 944.01,
-      '유로환율': 1704.99,
-      '위안화환율': 207.78
-    }
-    """
-    base_url = "http://www.smbs.biz/ExRate/TodayExRate.jsp"
-    params = {"tr_date": target_date.strftime("%Y%m%d")}
-    fx = {}
+def render_perf_panel(run):
+    """사이드바 성능 패널 (계측이 켜진 실행에서만 호출)"""
+    with st.sidebar.expander("⏱️ 성능 패널", expanded=True):
+        if not run or not run["records"]:
+            st.caption("기록된 구간이 없습니다.")
+            return
 
-    try:
-        res = requests.get(base_url, params=params, timeout=10)
-        res.encoding = res.apparent_encoding
-        soup = BeautifulSoup(res.text, "html.parser")
-
-        table = soup.find("table")
-        if not table:
-            return fx
-
-        for row in table.find_all("tr"):
-            tds = row.find_all("td")
-            if len(tds) < 2:
-                continue
-
-            name = tds[0].get_text(strip=True)
-            val_txt = tds[1].get_text(strip=True).replace(",", "")
-
-            try:
-                value = float(val_txt)
-            except ValueError:
-                continue
+        records = pd.DataFrame(run["records"])
+        top_level = records[records["depth"] == 0]["ms"].sum()
+        hits = (records["cache"] == "hit").sum()
+        misses = (records["cache"] == "miss").sum()
+        st.markdown(
+            f"**합계(최상위 구간): {top_level:,.1f} ms** | 캐시 hit {hits} / miss {misses}"
+        )
+        st.dataframe(
+            records[["stage", "ms", "cache", "bytes", "depth"]].assign(
+                stage=lambda d: d["depth"].map(lambda x: "  " * x) + d["stage"]
+            ),
+            hide_index=True,
+            use_container_width=True,
+            height=300,
+        )
+        # 프로세스 공유 캐시 현황 (모든 세션이 같은 결과 1벌을 참조)
+        stats = pd.DataFrame(cache_stats())
+        st.caption(
+            f"공유 캐시 {stats['size'].sum()}개 항목 / 약 {stats['bytes'].sum() / 1e6:,.1f} MB"
+        )
+        st.dataframe(
+            stats[stats["size"] > 0][["name", "size", "maxsize", "bytes"]],
+            hide_index=True,
+            use_container_width=True,
+        )
+        st.download_button(
+            "📥 JSON lines 내보내기",
+            lambda: "\n".join(
+                json.dumps(r, ensure_ascii=False, default=str) for r in run["records"]
+            ),
+            f"perf_{run['id']}.jsonl",
+            "application/x-ndjson",
+        )
 
-            if "미국" in name or "USD" in name:
-                fx["달러환율"] = value
-            elif "일본" in name or "JPY" in name:
-                fx["엔환율"] = value
-            elif "유로" in name or "EUR" in name:
-                fx["유로환율"] = value
-            elif "중국" in name or "CNY" in name:
-                fx["위안화환율"] = value
 
-        return fx
-    except Exception:
-        return fx
+# =============================================================================
+# 탭 화면 (탭마다 fragment → 탭 안의 위젯 조작은 해당 탭만 다시 실행)
+# =============================================================================
 
 
-@st.cache_data(ttl=3600, show_spinner=False)
-def fetch_rec_smp_onerec():
-    """
-    REC + SMP - 에너지공단 ONEREC 포털.
-
-    반환 형식:
-    {
-      '육지 가격': {'current': ..., 'prev': ...},
-      '육지 거래량': {...},
-      '제주 가격': {...},
-      '제주 거래량': {...},
-      '육지 SMP': {...},
-      '제주 SMP': {...}
-    }
-
-    ※ 실제 테이블 헤더/열 순서는 사이트 HTML을 보고 index를 한번 조정해야 함.
+# TAB 0: 간단 메뉴얼
+@st.fragment
+def render_manual_tab():
+    st.markdown("## 📖 대시보드 사용 메뉴얼")
+    st.markdown(
+        """
+    이 대시보드는 **엑셀 히스토리 + 웹 크롤링(당일/전일)** 데이터를 합쳐서  
+    환율, REC, SMP, 유가, LNG, 금리, 스왑 지표를 한 번에 모니터링하기 위한 내부용 도구입니다.
     """
-    result = {}
-
-    # --------------------------
-    # REC
-    # --------------------------
-    try:
-        rec_url = "https://onerec.kmos.kr/portal/rec/reportNewsList.do"
-        params = {"key": "2335"}
-        res = requests.get(rec_url, params=params, timeout=10)
-        res.encoding = res.apparent_encoding
-        soup = BeautifulSoup(res.text, "html.parser")
-
-        table = soup.find("table")
-        if table:
-            rows = table.find_all("tr")
-            rows = [r for r in rows if r.find_all("td") or r.find_all("th")]
-            if len(rows) >= 3:
-                header = [th.get_text(strip=True) for th in rows[0].find_all(["th", "td"])]
-
-                # 대략적인 위치 추정 – 실제 헤더 텍스트 보고 수정
-                idx_land_price = next(
-                    (i for i, h in enumerate(header) if "육지" in h and ("가격" in h or "정산" in h)),
-                    None,
-                )
-                idx_land_vol = next(
-                    (i for i, h in enumerate(header) if "육지" in h and ("거래" in h or "물량" in h)),
-                    None,
-                )
-                idx_jeju_price = next(
-                    (i for i, h in enumerate(header) if "제주" in h and ("가격" in h or "정산" in h)),
-                    None,
-                )
-                idx_jeju_vol = next(
-                    (i for i, h in enumerate(header) if "제주" in h and ("거래" in h or "물량" in h)),
-                    None,
-                )
-
-                def parse_row(row):
-                    vals = []
-                    for td in row.find_all("td"):
-                        txt = (
-                            td.get_text(strip=True)
-                            .replace(",", "")
-                            .replace("원", "")
-                            .replace("REC", "")
-                        )
-                        try:
-                            vals.append(float(txt))
-                        except ValueError:
-                            vals.append(None)
-                    return vals
-
-                data_rows = [r for r in rows[1:] if r.find_all("td")]
-                if len(data_rows) >= 2:
-                    today_vals = parse_row(data_rows[0])
-                    yday_vals = parse_row(data_rows[1])
-
-                    if idx_land_price is not None:
-                        result["육지 가격"] = {
-                            "current": today_vals[idx_land_price],
-                            "prev": yday_vals[idx_land_price],
-                        }
-                    if idx_land_vol is not None:
-                        result["육지 거래량"] = {
-                            "current": today_vals[idx_land_vol],
-                            "prev": yday_vals[idx_land_vol],
-                        }
-                    if idx_jeju_price is not None:
-                        result["제주 가격"] = {
-                            "current": today_vals[idx_jeju_price],
-                            "prev": yday_vals[idx_jeju_price],
-                        }
-                    if idx_jeju_vol is not None:
-                        result["제주 거래량"] = {
-                            "current": today_vals[idx_jeju_vol],
-                            "prev": yday_vals[idx_jeju_vol],
-                        }
-    except Exception:
-        pass
-
-    # --------------------------
-    # SMP
-    # --------------------------
-    try:
-        smp_url = "https://onerec.kmos.kr/portal/rec/selectRecSMPList.do"
-        params = {"key": "1965"}
-        res = requests.get(smp_url, params=params, timeout=10)
-        res.encoding = res.apparent_encoding
-        soup = BeautifulSoup(res.text, "html.parser")
-
-        table = soup.find("table")
-        if table:
-            rows = table.find_all("tr")
-            rows = [r for r in rows if r.find_all("td") or r.find_all("th")]
-            if len(rows) >= 3:
-                header = [th.get_text(strip=True) for th in rows[0].find_all(["th", "td"])]
-
-                idx_main = next(
-                    (i for i, h in enumerate(header) if "육지" in h and "SMP" in h),
-                    None,
-                )
-                idx_jeju = next(
-                    (i for i, h in enumerate(header) if "제주" in h and "SMP" in h),
-                    None,
-                )
-
-                def parse_row(row):
-                    vals = []
-                    for td in row.find_all("td"):
-                        txt = td.get_text(strip=True).replace(",", "")
-                        try:
-                            vals.append(float(txt))
-                        except ValueError:
-                            vals.append(None)
-                    return vals
-
-                data_rows = [r for r in rows[1:] if r.find_all("td")]
-                if len(data_rows) >= 2:
-                    today_vals = parse_row(data_rows[0])
-                    yday_vals = parse_row(data_rows[1])
-
-                    if idx_main is not None:
-                        result["육지 SMP"] = {
-                            "current": today_vals[idx_main],
-                            "prev": yday_vals[idx_main],
-                        }
-                    if idx_jeju is not None:
-                        result["제주 SMP"] = {
-                            "current": today_vals[idx_jeju],
-                            "prev": yday_vals[idx_jeju],
-                        }
-    except Exception:
-        pass
-
-    return result
-
+    )
 
-@st.cache_data(ttl=3600, show_spinner=False)
-def fetch_oil_petronet():
-    """
-    국제유가 - Petronet
-    URL: https://www.petronet.co.kr/v4/sub.jsp?fmuId=KDFQSTAT&smuId=KDFQ01
-
-    반환 예시:
-    {
-      '두바이유': {'current': ..., 'prev': ...},
-      '브렌트유': {'current': ..., 'prev': ...},
-      'WTI': {'current': ..., 'prev': ...}
-    }
+    st.markdown("---")
+    st.markdown("### 1️⃣ 상단 급변동 알림")
+    st.markdown(
+        """
+    - 전일 대비 변동률이 임계값을 넘는 지표만 표시합니다.  
+    - 예시  
+      - 환율: ±1% 이상  
+      - REC: ±3% 이상  
+      - SMP: ±5% 이상  
+      - 금리/스왑: ±10bp 이상  
+    - 아침 회의에서 '무슨 지표가 크게 움직였는지'만 빠르게 확인하는 용도입니다.
     """
-    url = "https://www.petronet.co.kr/v4/sub.jsp"
-    params = {"fmuId": "KDFQSTAT", "smuId": "KDFQ01"}
-    result = {}
-
-    try:
-        res = requests.get(url, params=params, timeout=10)
-        res.encoding = res.apparent_encoding
-        soup = BeautifulSoup(res.text, "html.parser")
-
-        table = soup.find("table")
-        if not table:
-            return result
-
-        rows = [r for r in table.find_all("tr") if r.find_all("td")]
-        if len(rows) < 2:
-            return result
-
-        # 마지막 두 행을 전일/당일로 가정 (실제 구조에 맞게 필요시 조정)
-        prev_row = rows[-2]
-        curr_row = rows[-1]
-
-        def parse_row(row):
-            vals = []
-            for td in row.find_all("td"):
-                txt = td.get_text(strip=True).replace(",", "")
-                try:
-                    vals.append(float(txt))
-                except ValueError:
-                    vals.append(None)
-            return vals
-
-        prev_vals = parse_row(prev_row)
-        curr_vals = parse_row(curr_row)
-
-        # [날짜, 두바이, 브렌트, WTI] 순이라고 가정
-        if len(curr_vals) >= 4 and len(prev_vals) >= 4:
-            result["두바이유"] = {"current": curr_vals[1], "prev": prev_vals[1]}
-            result["브렌트유"] = {"current": curr_vals[2], "prev": prev_vals[2]}
-            result["WTI"] = {"current": curr_vals[3], "prev": prev_vals[3]}
-
-    except Exception:
-        pass
-
-    return result
-
+    )
 
-@st.cache_data(ttl=3600, show_spinner=False)
-def fetch_lng_kogas():
-    """
-    LNG 가격 - 한국가스공사
-    URL: https://www.kogas.or.kr/site/koGas/1040401000000
-
-    반환 예시:
-    {
-      '탱크로리용': {'current': ..., 'prev': ...},
-      '연료전지용': {'current': ..., 'prev': ...}
-    }
+    st.markdown("---")
+    st.markdown("### 2️⃣ 탭 구조 요약")
+    st.markdown(
+        """
+    - **📈 지표 현황**: 카테고리별(환율/REC/SMP/유가/LNG/금리/스왑) 현재값 & 전일대비, 사이드바 차트 기간 추이  
+    - **🔬 상관관계 분석**: 두 지표 간 상관계수, 시차(lag) 분석  
+    - **🎯 예측 분석**: 회귀모형으로 SMP, 금리 등을 다른 지표로 설명/예측  
+    - **🌱 시뮬레이션**: SMP/REC 시나리오에 따른 신재생 발전소 수익성 계산  
+    - **🔔 투자 시그널**: 최근 30일 평균 대비 현재 위치 기반 BUY/SELL/HOLD 자동 생성  
+    - **📋 데이터**: 원본 시계열 데이터 조회 (페이지 단위, 주간/월간 집계) 및 CSV / Parquet / Excel 다운로드
     """
-    url = "https://www.kogas.or.kr/site/koGas/1040401000000"
-    result = {}
-
-    try:
-        res = requests.get(url, timeout=10)
-        res.encoding = res.apparent_encoding
-        soup = BeautifulSoup(res.text, "html.parser")
-
-        table = soup.find("table")
-        if not table:
-            return result
-
-        rows = [r for r in table.find_all("tr") if r.find_all("td")]
-        if len(rows) < 2:
-            return result
-
-        curr_row = rows[0]
-        prev_row = rows[1]
-
-        header_cells = [th.get_text(strip=True) for th in table.find_all("th")]
-        idx_tanker = next(
-            (i for i, h in enumerate(header_cells) if "탱크로리" in h),
-            None,
-        )
-        idx_fuel = next(
-            (i for i, h in enumerate(header_cells) if "연료전지" in h),
-            None,
-        )
-
-        def parse_row(row):
-            vals = []
-            for td in row.find_all("td"):
-                txt = (
-                    td.get_text(strip=True)
-                    .replace(",", "")
-                    .replace("원", "")
-                    .replace("MJ", "")
-                )
-                try:
-                    vals.append(float(txt))
-                except ValueError:
-                    vals.append(None)
-            return vals
-
-        curr_vals = parse_row(curr_row)
-        prev_vals = parse_row(prev_row)
-
-        if idx_tanker is not None and idx_tanker < len(curr_vals):
-            result["탱크로리용"] = {
-                "current": curr_vals[idx_tanker],
-                "prev": prev_vals[idx_tanker]
-                if idx_tanker < len(prev_vals)
-                else curr_vals[idx_tanker],
-            }
-        if idx_fuel is not None and idx_fuel < len(curr_vals):
-            result["연료전지용"] = {
-                "current": curr_vals[idx_fuel],
-                "prev": prev_vals[idx_fuel]
-                if idx_fuel < len(prev_vals)
-                else curr_vals[idx_fuel],
-            }
-    except Exception:
-        pass
-
-    return result
-
+    )
 
-def ecos_request(stat_code, start_date, end_date, item_code=None):
-    """
-    한국은행 ECOS API 템플릿.
-    실제 stat_code / item_code는 ECOS 개발자센터에서 사용하는 코드로 교체 필요.
+    st.markdown("---")
+    st.markdown("### 3️⃣ 데이터 구조")
+    st.markdown(
+        """
+    - 엑셀(`데일리_클리핑_자료.xlsm`)에 2021년 이후 히스토리가 있고,  
+      오늘/전일 값은 **크롤링 데이터로 덮어써서** 사용합니다.  
+    - 엑셀이 없더라도, 크롤링이 되면 최소 2행(전일/당일) 데이터로 대시보드가 동작합니다.
+    - 모든 지표는 **국내 영업일(KRX 휴장일 제외)** 기준으로 정렬되며,
+      주말/휴일에는 직전 영업일이 기준일, 그 전 영업일이 '전일'이 됩니다.
     """
-    api_key = st.secrets.get("ECOS_API_KEY", "")
-    if not api_key:
-        return []
-
-    base_url = (
-        f"https://ecos.bok.or.kr/api/StatisticSearch/{api_key}/json/kr/1/10/"
-        f"{stat_code}/DD/{start_date}/{end_date}"
     )
-    if item_code:
-        base_url += f"/{item_code}"
 
-    try:
-        res = requests.get(base_url, timeout=10)
-        data = res.json()
-        return data.get("StatisticSearch", {}).get("row", [])
-    except Exception:
-        return []
 
-
-@st.cache_data(ttl=3600, show_spinner=False)
-def fetch_rates_ecos(today, yesterday):
+def render_category_chart(store, version, category, days, regimes=None):
     """
-    ECOS에서 콜금리, 국고채3년 등 금리를 가져오는 템플릿.
-
-    실제 stat_code / item_code는 연준님이 쓰는 시리즈로 교체해야 함.
-    현재는 구조만 잡아둔 상태.
+    카테고리 지표 추이 (지표·기간별로 서버에서 다운샘플된 시계열, 단위가 2개면 보조축).
+    regimes(cached_regimes 결과)가 있으면 표시 기간 안의 구조 변화 시점을 점선으로 표시.
     """
-    result = {}
-
-    today_str = today.strftime("%Y%m%d")
-    yday_str = yesterday.strftime("%Y%m%d")
+    import plotly.graph_objects as go
+
+    fig = go.Figure()
+    units = []
+    raw_points = shipped = 0
+    first_date = None
+    for col_name, col_info in INDICATORS[category]["columns"].items():
+        if col_name not in store.offsets:
+            continue
+        series = cached_chart_series(store, version, col_name, days)
+        if len(series["values"]) == 0:
+            continue
+        if col_info["unit"] not in units:
+            units.append(col_info["unit"])
+        raw_points += series["raw_points"]
+        shipped += len(series["values"])
+        if first_date is None or series["dates"][0] < first_date:
+            first_date = series["dates"][0]
+        fig.add_trace(
+            go.Scatter(
+                x=series["dates"],
+                y=series["values"],
+                mode="lines",
+                name=col_name,
+                yaxis="y2" if units.index(col_info["unit"]) == 1 else "y",
+                line=dict(shape="hv" if COLUMN_FREQ.get(col_name, "D") != "D" else "linear"),
+            )
+        )
+    if not fig.data:
+        return
 
-    # 예시 1) 콜금리(1일) - (코드 예시는 placeholder)
-    call_rows = ecos_request("722Y001", yday_str, today_str, item_code="0100000")
-    if call_rows:
-        call_rows = sorted(call_rows, key=lambda r: r.get("TIME", ""))
-        prev_val = float(call_rows[0]["DATA_VALUE"])
-        curr_val = float(call_rows[-1]["DATA_VALUE"])
-        result["콜금리(1일)"] = {"current": curr_val, "prev": prev_val}
+    layout = dict(
+        template="plotly_dark",
+        paper_bgcolor="rgba(22,33,62,0.8)",
+        plot_bgcolor="rgba(22,33,62,0.8)",
+        height=280,
+        margin=dict(l=10, r=10, t=30, b=10),
+        legend=dict(orientation="h", y=1.12),
+        yaxis=dict(title=units[0]),
+    )
+    if len(units) > 1:
+        layout["yaxis2"] = dict(title=units[1], overlaying="y", side="right", showgrid=False)
 
-    # 예시 2) 국고채(3년) - placeholder
-    t3_rows = ecos_request("733Y001", yday_str, today_str, item_code="BBK3Y")
-    if t3_rows:
-        t3_rows = sorted(t3_rows, key=lambda r: r.get("TIME", ""))
-        prev_val = float(t3_rows[0]["DATA_VALUE"])
-        curr_val = float(t3_rows[-1]["DATA_VALUE"])
-        result["국고채 (3년)"] = {"current": curr_val, "prev": prev_val}
+    # 구조 변화 시점: 지표마다 점선 + 캡션에 국면 평균 변화
+    shifts = []
+    for col_name in INDICATORS[category]["columns"]:
+        if not regimes or col_name not in regimes:
+            continue
+        segments = regimes[col_name]["segments"]
+        for before, after in zip(segments[:-1], segments[1:]):
+            if after["start"] < first_date:
+                continue
+            fig.add_vline(
+                x=after["start"], line_dash="dot", line_width=1, line_color="rgba(255,255,255,0.45)"
+            )
+            fmt = INDICATORS[category]["columns"][col_name]["format"]
+            shifts.append(
+                f"{col_name} {after['start']:%Y-%m-%d} "
+                f"(평균 {fmt.format(before['mean'])} → {fmt.format(after['mean'])})"
+            )
 
-    # 나머지 CD, CP, 국고채5/10년, 회사채 AA-/BBB- 등도 위 패턴으로 추가 가능
-    return result
+    fig.update_layout(**layout)
+    st.plotly_chart(fig, use_container_width=True)
+    if shifts:
+        st.caption("구조 변화: " + " · ".join(shifts))
+    if shipped < raw_points:
+        st.caption(f"표시 {shipped:,}점 / 원본 {raw_points:,}점 (다운샘플)")
+
+
+# TAB 1: 지표 현황
+@st.fragment
+def render_indicator_tab(
+    store, df, version, summary, selected_categories, chart_days, show_regimes=True
+):
+    st.markdown("### 📊 주간 시장 트렌드")
+    market_summary = cached_market_summary(df, version, days=7)
+
+    if market_summary:
+        cols = st.columns(5)
+        for i, (col_name, data_m) in enumerate(market_summary.items()):
+            with cols[i % 5]:
+                trend_color = (
+                    "#00d26a"
+                    if data_m["trend"] == "상승"
+                    else ("#ff6b6b" if data_m["trend"] == "하락" else "#888")
+                )
+                trend_arrow = (
+                    "↑"
+                    if data_m["trend"] == "상승"
+                    else ("↓" if data_m["trend"] == "하락" else "→")
+                )
+                st.markdown(
+                    f"""
+                <div class="summary-card">
+                    <div style="color: #888; font-size: 0.8rem;">{data_m['name']}</div>
+                    <div style="color: #fff; font-size: 1.3rem; font-weight: bold;">{data_m['format'].format(data_m['current'])} {data_m['unit']}</div>
+                    <div style="color: {trend_color};">{trend_arrow} {data_m['trend']} ({data_m['change_pct']:+.1f}%)</div>
+                </div>
+                """,
+                    unsafe_allow_html=True,
+                )
 
+    st.markdown("---")
 
-@st.cache_data(ttl=1800, show_spinner=False)
-def fetch_realtime_data_with_history():
-    """
-    크롤링을 통해 '오늘/전일' 데이터를 모두 가져와서 통합 map으로 반환.
-
-    반환 예시:
-    {
-      '달러환율': {'current': 1473.5, 'prev': 1462.7},
-      '육지 SMP': {'current': 110.5, 'prev': 108.2},
-      ...
-    }
-    """
-    today = datetime.today().date()
-    yesterday = today - timedelta(days=1)
+    regimes = cached_regimes(store, version) if show_regimes else None
+    for category in selected_categories:
+        if category not in summary:
+            continue
+        data_c = summary[category]
 
-    data = {}
+        st.markdown(
+            f"""
+        <div class="category-header" style="border-color: {data_c['color']};">
+            <span style="font-size: 1.5rem;">{data_c['icon']}</span>
+            <h3>{category}</h3>
+        </div>
+        """,
+            unsafe_allow_html=True,
+        )
 
-    # 환율
-    fx_today = fetch_fx_smbs(today)
-    fx_yday = fetch_fx_smbs(yesterday)
-    for name in ["달러환율", "엔환율", "유로환율", "위안화환율"]:
-        if name in fx_today and name in fx_yday:
-            data[name] = {"current": fx_today[name], "prev": fx_yday[name]}
+        cols = st.columns(4)
+        is_rate = category in ["금리", "스왑"]
 
-    # REC / SMP
-    rec_smp = fetch_rec_smp_onerec()
-    for k, v in rec_smp.items():
-        data[k] = v
+        for i, (col_name, ind) in enumerate(data_c["indicators"].items()):
+            with cols[i % 4]:
+                value_str = format_value(ind["value"], ind["format"], ind["unit"])
+                is_periodic = ind.get("is_periodic", False)
+                change_html = get_change_html(
+                    ind["change"], ind["change_pct"], ind["direction"], is_rate, is_periodic
+                )
+                note = ind.get("note", "")
+                st.markdown(
+                    create_metric_card(col_name, value_str, change_html, note),
+                    unsafe_allow_html=True,
+                )
 
-    # 유가
-    oil = fetch_oil_petronet()
-    for k, v in oil.items():
-        data[k] = v
+        with perf_stage(f"chart.category.{category}"):
+            render_category_chart(store, version, category, chart_days, regimes)
 
-    # LNG
-    lng = fetch_lng_kogas()
-    for k, v in lng.items():
-        data[k] = v
 
-    # 금리 (ECOS)
-    rates = fetch_rates_ecos(today, yesterday)
-    for k, v in rates.items():
-        data[k] = v
+# TAB 4: 상관관계 분석
+@st.fragment
+def render_correlation_tab(store, df, version):
+    import plotly.express as px
+    import plotly.graph_objects as go
 
-    return data
+    st.markdown("## 🔬 선행/후행 지표 상관관계 분석")
 
+    col1, col2 = st.columns([1, 3])
 
-# =============================================================================
-# 데이터 로딩 (엑셀 히스토리 + 크롤링 병합)
-# =============================================================================
-
-
-@st.cache_data(ttl=600)
-def load_data():
-    """
-    1) DATA_PATH 엑셀 파일에서 히스토리 로드 (가능하면)
-    2) fetch_realtime_data_with_history()로 오늘/전일 데이터 로드
-    3) 히스토리에 오늘/전일 row를 덮어써서 최종 df 반환
-    """
-    base_df = None
-    try:
-        base_df = pd.read_excel(
-            DATA_PATH,
-            sheet_name="Data",
-            skiprows=4,
-            usecols="B:AE",
-            engine="openpyxl",
+    with col1:
+        heatmap_period = st.selectbox(
+            "분석 기간", ["3개월", "6개월", "1년", "전체"], index=2, key="hm_p"
+        )
+        heatmap_indicators = st.multiselect(
+            "분석 지표",
+            KEY_INDICATORS,
+            default=["달러환율", "육지 SMP", "두바이유", "국고채 (3년)"],
+            key="hm_i",
         )
-        base_df.columns = DATA_COLUMNS
-        base_df["날짜"] = pd.to_datetime(base_df["날짜"], errors="coerce")
-        base_df = base_df.dropna(subset=["날짜"])
-        base_df = base_df.sort_values("날짜").reset_index(drop=True)
-
-        numeric_cols = [c for c in base_df.columns if c != "날짜"]
-        for col in numeric_cols:
-            base_df[col] = pd.to_numeric(base_df[col], errors="coerce")
-    except Exception:
-        base_df = None
-
-    realtime_map = fetch_realtime_data_with_history()
-
-    if not realtime_map and base_df is None:
-        st.error("❌ 엑셀 파일도 없고, 실시간 데이터도 불러오지 못했습니다.")
-        return None
-
-    today = datetime.today().date()
-    yesterday = today - timedelta(days=1)
-
-    # 기본 row 템플릿
-    if base_df is not None and len(base_df) > 0:
-        df_hist = base_df.copy()
-        df_hist["date_only"] = df_hist["날짜"].dt.date
-        df_hist = df_hist[df_hist["date_only"] < yesterday].drop(columns="date_only")
-        if len(df_hist) > 0:
-            base_row = df_hist.iloc[-1].copy()
-        else:
-            base_row = pd.Series({col: np.nan for col in DATA_COLUMNS})
-    else:
-        df_hist = None
-        base_row = pd.Series({col: np.nan for col in DATA_COLUMNS})
-
-    def build_row(date_obj, key):
-        row = base_row.copy()
-        row["날짜"] = pd.Timestamp(date_obj)
-        for col in DATA_COLUMNS:
-            if col == "날짜":
-                continue
-            if col in realtime_map and realtime_map[col].get(key) is not None:
-                row[col] = realtime_map[col][key]
-        return row
-
-    new_rows = []
-    if realtime_map:
-        new_rows.append(build_row(yesterday, "prev"))
-        new_rows.append(build_row(today, "current"))
 
-    if df_hist is not None:
-        df_new = pd.concat([df_hist, pd.DataFrame(new_rows)], ignore_index=True)
-    else:
-        df_new = pd.DataFrame(new_rows)
+    with col2:
+        if len(heatmap_indicators) >= 2:
+            days = CHART_PERIODS.get(heatmap_period)
+            corr_matrix = cached_correlation_matrix(df, version, heatmap_indicators, days)
 
-    df_new = df_new.dropna(subset=["날짜"])
-    df_new = df_new.sort_values("날짜")
-    df_new = df_new.drop_duplicates(subset=["날짜"], keep="last").reset_index(drop=True)
+            with perf_stage("chart.correlation_heatmap"):
+                fig = px.imshow(
+                    corr_matrix,
+                    labels=dict(color="상관계수"),
+                    x=heatmap_indicators,
+                    y=heatmap_indicators,
+                    color_continuous_scale="RdBu_r",
+                    zmin=-1,
+                    zmax=1,
+                    text_auto=".2f",
+                )
+                fig.update_layout(
+                    template="plotly_dark",
+                    paper_bgcolor="rgba(22,33,62,0.8)",
+                    plot_bgcolor="rgba(22,33,62,0.8)",
+                    height=400,
+                )
+                st.plotly_chart(fig, use_container_width=True)
 
-    # 핵심 지표가 전부 NaN인 행 제거
-    key_cols = ["달러환율", "육지 SMP", "두바이유"]
-    existing_keys = [c for c in key_cols if c in df_new.columns]
-    if existing_keys:
-        mask = df_new[existing_keys].notna().any(axis=1)
-        df_new = df_new[mask].reset_index(drop=True)
+    st.markdown("---")
+    st.markdown("### 🕐 시차(Lag) 분석")
 
-    return df_new
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        leading = st.selectbox(
+            "선행지표", KEY_INDICATORS, index=5, key="ld"
+        )
+    with col2:
+        lagging = st.selectbox(
+            "후행지표", KEY_INDICATORS, index=3, key="lg"
+        )
+    with col3:
+        max_lag = st.slider("최대 시차", 1, 365, 180, key="ml")
 
+    if leading != lagging:
+        lag_df, optimal = cached_lagged_correlation(df, version, leading, lagging, max_lag)
 
-# =============================================================================
-# LNG 월별 처리 (v5 로직 유지)
-# =============================================================================
+        with perf_stage("chart.lag_correlation"):
+            fig = go.Figure()
+            fig.add_trace(
+                go.Scatter(
+                    x=lag_df["lag"],
+                    y=lag_df["correlation"],
+                    mode="lines+markers",
+                    line=dict(color="#3498db"),
+                )
+            )
+            if optimal is not None:
+                fig.add_vline(x=optimal["lag"], line_dash="dash", line_color="#e94560")
+            fig.add_hline(y=0, line_dash="dot", line_color="gray")
+            fig.update_layout(
+                title=f"{leading} → {lagging}",
+                template="plotly_dark",
+                paper_bgcolor="rgba(22,33,62,0.8)",
+                plot_bgcolor="rgba(22,33,62,0.8)",
+                height=300,
+                yaxis=dict(range=[-1, 1]),
+            )
+            st.plotly_chart(fig, use_container_width=True)
 
+        if optimal is not None and not np.isnan(optimal["correlation"]):
+            strength, direction, _ = interpret_correlation(
+                optimal["correlation"]
+            )
+            st.info(
+                f"📌 최적 시차: **{int(optimal['lag'])}일** | 상관계수: **{optimal['correlation']:.3f}** ({strength} {direction} 상관관계)"
+            )
 
-def get_latest_lng_data(df):
-    lng_cols = ["탱크로리용", "연료전지용"]
-    result = {}
+    st.markdown("---")
+    st.markdown("### 🧭 Granger 인과 (VAR)")
+    st.caption(
+        "선택한 지표를 한 모형에 함께 넣고, 다른 지표의 과거를 모두 고려한 뒤에도 "
+        "원인 지표의 과거가 결과 지표 예측에 도움이 되는지 검정합니다 (일간 변동률, 금리는 %p)"
+    )
 
-    for col in lng_cols:
-        if col not in df.columns:
-            result[col] = {
-                "value": None,
-                "previous": None,
-                "change": None,
-                "date": None,
-                "prev_month": None,
-                "curr_month": None,
-            }
-            continue
+    col1, col2 = st.columns([1, 3])
+    with col1:
+        var_indicators = st.multiselect(
+            "분석 지표",
+            KEY_INDICATORS,
+            default=["두바이유", "달러환율", "육지 SMP"],
+            key="var_i",
+        )
+        var_max_lag = st.slider("최대 시차 (영업일)", 1, 20, 10, key="var_ml")
+        var_period = st.selectbox(
+            "분석 기간", ["6개월", "1년", "전체"], index=2, key="var_p"
+        )
 
-        valid_data = df[df[col].notna()][["날짜", col]].copy()
-        if len(valid_data) > 0:
-            valid_data["년월"] = valid_data["날짜"].dt.to_period("M")
-            monthly_data = valid_data.groupby("년월").last().reset_index()
-
-            if len(monthly_data) >= 2:
-                latest = monthly_data.iloc[-1]
-                prev = monthly_data.iloc[-2]
-                change = latest[col] - prev[col]
-
-                result[col] = {
-                    "value": latest[col],
-                    "previous": prev[col],
-                    "change": change,
-                    "date": latest["날짜"],
-                    "prev_month": str(prev["년월"]),
-                    "curr_month": str(latest["년월"]),
-                }
-            elif len(monthly_data) == 1:
-                latest = monthly_data.iloc[-1]
-                result[col] = {
-                    "value": latest[col],
-                    "previous": None,
-                    "change": None,
-                    "date": latest["날짜"],
-                    "prev_month": None,
-                    "curr_month": str(latest["년월"]),
-                }
+    with col2:
+        if len(var_indicators) >= 2:
+            result, error = cached_var(
+                store, version, var_indicators, var_max_lag, CHART_PERIODS.get(var_period)
+            )
+            if error:
+                st.warning(error)
             else:
-                result[col] = {
-                    "value": None,
-                    "previous": None,
-                    "change": None,
-                    "date": None,
-                    "prev_month": None,
-                    "curr_month": None,
-                }
+                with perf_stage("chart.granger_heatmap"):
+                    fig = px.imshow(
+                        result["p_value"],
+                        labels=dict(x="결과", y="원인", color="p값"),
+                        x=result["columns"],
+                        y=result["columns"],
+                        color_continuous_scale="Blues_r",
+                        zmin=0,
+                        zmax=0.2,
+                        text_auto=".3f",
+                    )
+                    fig.update_layout(
+                        template="plotly_dark",
+                        paper_bgcolor="rgba(22,33,62,0.8)",
+                        plot_bgcolor="rgba(22,33,62,0.8)",
+                        height=400,
+                    )
+                    st.plotly_chart(fig, use_container_width=True)
+                st.caption(
+                    f"VAR({result['lag']}) - BIC로 선택 | 관측 {result['n_obs']:,}일 | "
+                    "행 = 원인, 열 = 결과, p < 0.05면 유의"
+                )
+                significant = granger_table(result).query("유의")
+                if len(significant):
+                    st.info(
+                        "📌 "
+                        + " · ".join(
+                            f"**{r['원인']} → {r['결과']}** (p={r['p값']:.3f})"
+                            for _, r in significant.iterrows()
+                        )
+                    )
+                else:
+                    st.info("📌 유의한 Granger 인과 관계가 없습니다")
         else:
-            result[col] = {
-                "value": None,
-                "previous": None,
-                "change": None,
-                "date": None,
-                "prev_month": None,
-                "curr_month": None,
-            }
-    return result
+            st.info("지표를 2개 이상 선택하세요")
 
 
-# =============================================================================
-# 요약/알림 관련 함수
-# =============================================================================
+# TAB 5: 예측 분석
+@st.fragment
+def render_prediction_tab(store, df, version):
+    import plotly.graph_objects as go
 
+    st.markdown("## 🎯 회귀분석 기반 예측")
 
-def get_summary(df):
-    if df is None or len(df) < 2:
-        return {}
+    col1, col2 = st.columns([1, 2])
 
-    latest = df.iloc[-1]
-    previous = df.iloc[-2]
-    summary = {}
-    lng_data = get_latest_lng_data(df)
+    with col1:
+        target = st.selectbox(
+            "예측 대상", KEY_INDICATORS, index=3, key="pt"
+        )
 
-    for category, info in INDICATORS.items():
-        is_rate = category in ["금리", "스왑"]
-        summary[category] = {
-            "icon": info["icon"],
-            "color": info["color"],
-            "indicators": {},
-        }
+        feature_options = [x for x in KEY_INDICATORS if x != target]
 
-        for col_name, col_info in info["columns"].items():
-            if category == "LNG" and col_name in lng_data:
-                lng_info = lng_data[col_name]
-                current = lng_info["value"]
-                prev = lng_info["previous"]
-                change = lng_info["change"]
+        base_default = ["두바이유", "달러환율"]
+        default_features = [
+            x for x in base_default if x in feature_options
+        ]
 
-                if change is not None:
-                    direction = "up" if change > 0 else ("down" if change < 0 else "neutral")
-                    change_pct = change
-                else:
-                    direction = "neutral"
-                    change_pct = None
-
-                if lng_info.get("prev_month") and lng_info.get("curr_month"):
-                    prev_m = (
-                        lng_info["prev_month"].split("-")[1]
-                        if "-" in str(lng_info["prev_month"])
-                        else ""
-                    )
-                    curr_m = (
-                        lng_info["curr_month"].split("-")[1]
-                        if "-" in str(lng_info["curr_month"])
-                        else ""
-                    )
-                    note = f"({prev_m}월→{curr_m}월)"
-                else:
-                    note = ""
-
-                summary[category]["indicators"][col_name] = {
-                    "value": current,
-                    "previous": prev,
-                    "change": change,
-                    "change_pct": change_pct,
-                    "direction": direction,
-                    "unit": col_info["unit"],
-                    "format": col_info["format"],
-                    "note": note,
-                    "is_lng": True,
-                }
-            else:
-                current = latest.get(col_name)
-                prev = previous.get(col_name)
+        features = st.multiselect(
+            "설명 변수",
+            feature_options,
+            default=default_features,
+            key="pf",
+        )
 
-                if pd.notna(current) and pd.notna(prev) and prev != 0:
-                    change = current - prev
-                    change_pct = (change / prev) * 100 if not is_rate else change * 100
-                    direction = "up" if change > 0 else ("down" if change < 0 else "neutral")
+        train_period = st.selectbox(
+            "학습 기간",
+            ["3개월", "6개월", "1년", "전체", "최근 국면"],
+            index=2,
+            key="tp",
+            help="최근 국면: 예측 대상/설명 변수 중 가장 최근 구조 변화 시점 이후만 학습",
+        )
+        run_pred = st.button("🚀 예측 실행", use_container_width=True)
+
+    with col2:
+        if run_pred and features:
+            train_days = CHART_PERIODS.get(train_period)
+            train_start = None
+            if train_period == "최근 국면":
+                train_start = latest_break(cached_regimes(store, version), [target] + features)
+                if train_start is not None:
+                    st.caption(f"학습 시작: {train_start:%Y-%m-%d} (구조 변화 이후)")
+                    train_start = train_start.strftime("%Y-%m-%d")
                 else:
-                    change, change_pct, direction = None, None, "neutral"
-
-                summary[category]["indicators"][col_name] = {
-                    "value": current,
-                    "previous": prev,
-                    "change": change,
-                    "change_pct": change_pct,
-                    "direction": direction,
-                    "unit": col_info["unit"],
-                    "format": col_info["format"],
-                    "note": "",
-                }
-    return summary
-
-
-def check_alerts(summary):
-    alerts = []
-    for category, data in summary.items():
-        threshold = ALERT_THRESHOLDS.get(category, 5.0)
-        is_rate = category in ["금리", "스왑"]
+                    st.caption("구조 변화가 없어 전체 기간으로 학습합니다")
+            model_info, pred, error = cached_regression(
+                df, version, target, features, train_days, train_start
+            )
 
-        for col_name, ind in data["indicators"].items():
-            if ind["change_pct"] is None:
-                continue
+            if error:
+                st.error(error)
+            elif model_info:
+                st.markdown(
+                    f"**R² (설명력): {model_info['r2']:.3f}** | MAE: {model_info['mae']:.2f}"
+                )
 
-            check_val = abs(ind["change"]) * 100 if is_rate else abs(ind["change_pct"])
-            threshold_val = threshold * 100 if is_rate else threshold
+                with perf_stage("chart.regression_fit"):
+                    fig = go.Figure()
+                    fig.add_trace(
+                        go.Scatter(
+                            x=model_info["dates"],
+                            y=model_info["y_actual"],
+                            mode="lines",
+                            name="실제값",
+                            line=dict(color="#3498db"),
+                        )
+                    )
+                    fig.add_trace(
+                        go.Scatter(
+                            x=model_info["dates"],
+                            y=model_info["y_pred"],
+                            mode="lines",
+                            name="예측값",
+                            line=dict(color="#e94560", dash="dot"),
+                        )
+                    )
+                    fig.update_layout(
+                        template="plotly_dark",
+                        paper_bgcolor="rgba(22,33,62,0.8)",
+                        plot_bgcolor="rgba(22,33,62,0.8)",
+                        height=300,
+                    )
+                    st.plotly_chart(fig, use_container_width=True)
 
-            if check_val >= threshold_val:
-                alerts.append(
-                    {
-                        "category": category,
-                        "indicator": col_name,
-                        "change_pct": ind["change_pct"],
-                        "direction": ind["direction"],
-                        "icon": data["icon"],
-                        "current": ind.get("value"),
-                        "previous": ind.get("previous"),
-                        "fmt": ind.get("format", "{:,.2f}"),
-                        "unit": ind.get("unit", ""),
-                    }
+                actual = df[target].dropna().iloc[-1]
+                st.success(
+                    f"**현재 예측값: {pred:.2f}** (실제: {actual:.2f})"
                 )
-    return alerts
+        elif run_pred:
+            st.warning("설명 변수를 선택하세요.")
 
 
-def format_value(value, fmt, unit=""):
-    if pd.isna(value) or value is None:
-        return "N/A"
-    try:
-        return f"{fmt.format(value)} {unit}"
-    except Exception:
-        return str(value)
+# TAB 6: 데이터
+@st.fragment
+def render_data_tab(store, latest_date):
+    st.markdown("### 📋 원본 데이터")
 
+    col1, col2 = st.columns(2)
+    with col1:
+        date_range = st.date_input(
+            "날짜 범위",
+            value=(latest_date - timedelta(days=30), latest_date),
+        )
+    with col2:
+        table_cat = st.selectbox(
+            "카테고리", ["전체"] + list(INDICATORS.keys()), key="tc"
+        )
 
-def get_change_html(change, change_pct, direction, is_rate=False, is_lng=False):
-    if change is None:
-        return '<span class="metric-change-neutral">-</span>'
+    col3, col4, col5, col6 = st.columns(4)
+    with col3:
+        agg_label = st.radio("집계", list(RESAMPLE_RULES), horizontal=True, key="grid_agg")
+    with col4:
+        how_label = st.radio(
+            "집계 값", list(RESAMPLE_HOW), horizontal=True, key="grid_how",
+            disabled=RESAMPLE_RULES[agg_label] is None,
+        )
+    with col5:
+        page_size = st.selectbox("페이지 크기", GRID_PAGE_SIZES, index=1, key="grid_page_size")
+    with col6:
+        descending = st.radio(
+            "정렬 방향", ["내림차순", "오름차순"], horizontal=True, key="grid_desc"
+        ) == "내림차순"
+
+    # 주간/월간 집계는 전체 히스토리에 대해 데이터 버전당 1번만 계산하고 기간/카테고리는 그 위에서 자른다
+    view = store
+    rule = RESAMPLE_RULES[agg_label]
+    if rule is not None:
+        view = cached_resample(store, store.version, rule, RESAMPLE_HOW[how_label])
+    if isinstance(date_range, (list, tuple)) and len(date_range) == 2:
+        start, end = date_range
+        view = view.window(start, end)
+
+    if table_cat != "전체":
+        view = view.category(table_cat)
+
+    sort_by = st.selectbox("정렬 기준", ["날짜", *view.columns], key="grid_sort")
+
+    # 페이지 번호는 필터가 바뀌어 전체 페이지 수가 줄면 마지막 페이지로 당김
+    n_pages = page_count(len(view), page_size)
+    if st.session_state.get("grid_page", 1) > n_pages:
+        st.session_state["grid_page"] = n_pages
+    col_page, col_info = st.columns([1, 3])
+    with col_page:
+        page = st.number_input("페이지", min_value=1, max_value=n_pages, step=1, key="grid_page")
+    first = (page - 1) * page_size
+    with col_info:
+        st.caption(
+            f"전체 {len(view):,}행 중 {min(first + 1, len(view)):,}–"
+            f"{min(first + page_size, len(view)):,}행 ({page}/{n_pages} 페이지)"
+        )
 
-    arrow = "▲" if direction == "up" else ("▼" if direction == "down" else "―")
-    css = (
-        "metric-change-up"
-        if direction == "up"
-        else ("metric-change-down" if direction == "down" else "metric-change-neutral")
+    # 브라우저에는 현재 페이지 행만 보냄
+    st.dataframe(
+        grid_page(view, page - 1, page_size, sort_by, descending),
+        use_container_width=True,
+        hide_index=True,
     )
 
-    if is_rate:
-        return f'<span class="{css}">{arrow} {abs(change)*100:.1f}bp</span>'
-    elif is_lng:
-        return f'<span class="{css}">{arrow} {abs(change):.2f}</span>'
-    return f'<span class="{css}">{arrow} {abs(change_pct):.2f}%</span>'
-
-
-def create_metric_card(title, value, change_html, note=""):
-    note_html = f'<div style="color: #666; font-size: 0.75rem;">{note}</div>' if note else ""
-    return f"""
-    <div class="metric-card">
-        <div class="metric-title">{title}</div>
-        <div class="metric-value">{value}</div>
-        <div>{change_html}</div>
-        {note_html}
-    </div>
-    """
-
+    # 내보내기 파일은 버튼을 눌렀을 때만 별도 스레드에서 생성 (rerun마다 CSV를 만들지 않음)
+    col_fmt, col_btn = st.columns([3, 1])
+    with col_fmt:
+        export_fmt = st.radio(
+            "내보내기 형식",
+            available_formats(),
+            format_func=lambda f: EXPORT_FORMATS[f][0],
+            horizontal=True,
+            key="export_fmt",
+        )
+    label, mime, _ = EXPORT_FORMATS[export_fmt]
+    with col_btn:
+        st.download_button(
+            f"📥 {label.split(' ')[0]} 다운로드",
+            lambda: open_export(view, export_fmt),
+            export_filename(view, export_fmt),
+            mime,
+            use_container_width=True,
+        )
 
-# =============================================================================
-# 상관관계/회귀분석 함수
-# =============================================================================
 
+# TAB 2: 시뮬레이션
+@st.fragment
+def render_simulation_tab(df):
+    import plotly.graph_objects as go
 
-def calculate_correlation_matrix(df, columns, days=365):
-    if days:
-        cutoff = df["날짜"].max() - timedelta(days=days)
-        df_filtered = df[df["날짜"] >= cutoff]
-    else:
-        df_filtered = df
-    return df_filtered[columns].dropna().corr()
+    st.markdown("## 🌱 신재생에너지 수익성 시뮬레이터")
 
+    col1, col2 = st.columns([1, 2])
 
-def calculate_lagged_correlation(df, leading_col, lagging_col, max_lag=30):
-    results = []
-    df_clean = df[["날짜", leading_col, lagging_col]].dropna()
+    with col1:
+        st.markdown("### ⚙️ 프로젝트 설정")
 
-    for lag in range(0, max_lag + 1):
-        if lag == 0:
-            corr, p_value = stats.pearsonr(df_clean[leading_col], df_clean[lagging_col])
-        else:
-            leading_shifted = df_clean[leading_col].iloc[:-lag].values
-            lagging_current = df_clean[lagging_col].iloc[lag:].values
-            if len(leading_shifted) > 10:
-                corr, p_value = stats.pearsonr(leading_shifted, lagging_current)
-            else:
-                corr, p_value = np.nan, np.nan
-        results.append(
-            {
-                "lag": lag,
-                "correlation": corr,
-                "p_value": p_value,
-                "significant": p_value < 0.05 if not np.isnan(p_value) else False,
-            }
+        project_type = st.selectbox(
+            "발전 유형", ["태양광", "풍력(육상)", "풍력(해상)", "연료전지", "바이오"]
         )
-    return pd.DataFrame(results)
-
-
-def find_optimal_lag(lag_df):
-    valid_df = lag_df.dropna()
-    if len(valid_df) == 0:
-        return None
-    idx = valid_df["correlation"].abs().idxmax()
-    return valid_df.loc[idx]
 
+        defaults = {
+            "태양광": {"cf": 0.15, "rec_weight": 1.0},
+            "풍력(육상)": {"cf": 0.25, "rec_weight": 1.0},
+            "풍력(해상)": {"cf": 0.30, "rec_weight": 2.0},
+            "연료전지": {"cf": 0.85, "rec_weight": 2.0},
+            "바이오": {"cf": 0.80, "rec_weight": 1.5},
+        }
 
-def interpret_correlation(corr):
-    abs_corr = abs(corr)
-    if abs_corr >= 0.7:
-        return "강한", "양의" if corr > 0 else "음의", "correlation-strong"
-    elif abs_corr >= 0.4:
-        return "중간", "양의" if corr > 0 else "음의", "correlation-moderate"
-    return "약한", "양의" if corr > 0 else "음의", "correlation-weak"
-
+        capacity = st.number_input(
+            "설비용량 (MW)", min_value=0.1, max_value=1000.0, value=10.0, step=0.1
+        )
+        cf = (
+            st.slider(
+                "이용률 (%)", 5, 95, int(defaults[project_type]["cf"] * 100)
+            )
+            / 100
+        )
+        rec_weight = st.number_input(
+            "REC 가중치",
+            min_value=0.5,
+            max_value=5.0,
+            value=defaults[project_type]["rec_weight"],
+            step=0.1,
+        )
 
-def build_regression_model(df, target_col, feature_cols, train_days=365):
-    cutoff = (
-        df["날짜"].max() - timedelta(days=train_days)
-        if train_days
-        else df["날짜"].min()
-    )
-    df_train = df[df["날짜"] >= cutoff].copy()
+        st.markdown("### 📊 시나리오 설정")
 
-    cols_needed = [target_col] + feature_cols
-    df_clean = df_train[cols_needed].dropna()
+        current_smp = (
+            df["육지 SMP"].dropna().iloc[-1]
+            if "육지 SMP" in df.columns and len(df["육지 SMP"].dropna()) > 0
+            else 100
+        )
+        current_rec = (
+            df["육지 가격"].dropna().iloc[-1]
+            if "육지 가격" in df.columns and len(df["육지 가격"].dropna()) > 0
+            else 70000
+        )
 
-    if len(df_clean) < 30:
-        return None, None, None, "데이터가 부족합니다"
+        smp_scenarios = st.multiselect(
+            "SMP 시나리오 (원/kWh)",
+            [80, 100, 120, 150, 180, 200, 220],
+            default=[100, 150, 200],
+        )
+        rec_scenario = st.number_input(
+            "REC 가격 (원/REC)",
+            min_value=10000,
+            max_value=200000,
+            value=int(current_rec),
+            step=1000,
+        )
 
-    X = df_clean[feature_cols].values
-    y = df_clean[target_col].values
+    with col2:
+        st.markdown("### 📈 수익 시뮬레이션 결과")
 
-    scaler_X = StandardScaler()
-    scaler_y = StandardScaler()
+        if smp_scenarios:
+            results = []
+            for smp in smp_scenarios:
+                rev = calculate_renewable_revenue(
+                    smp, rec_scenario, capacity, cf, rec_weight
+                )
+                results.append(
+                    {
+                        "SMP (원/kWh)": smp,
+                        "연간발전량 (MWh)": f"{rev['annual_generation_mwh']:,.0f}",
+                        "SMP 수익 (억원)": f"{rev['smp_revenue']/100000000:.2f}",
+                        "REC 수익 (억원)": f"{rev['rec_revenue']/100000000:.2f}",
+                        "총 수익 (억원)": f"{rev['total_revenue']/100000000:.2f}",
+                    }
+                )
 
-    X_scaled = scaler_X.fit_transform(X)
-    y_scaled = scaler_y.fit_transform(y.reshape(-1, 1)).ravel()
+            st.dataframe(
+                pd.DataFrame(results), use_container_width=True, hide_index=True
+            )
 
-    model = LinearRegression()
-    model.fit(X_scaled, y_scaled)
+            with perf_stage("chart.simulation_revenue"):
+                fig = go.Figure()
+                revenues = [
+                    calculate_renewable_revenue(
+                        smp, rec_scenario, capacity, cf, rec_weight
+                    )["total_revenue"]
+                    / 100000000
+                    for smp in smp_scenarios
+                ]
+                fig.add_trace(
+                    go.Bar(
+                        x=[f"SMP {s}" for s in smp_scenarios],
+                        y=revenues,
+                        marker_color="#27ae60",
+                        text=[f"{r:.1f}억" for r in revenues],
+                        textposition="outside",
+                    )
+                )
+                fig.update_layout(
+                    title=f"{project_type} {capacity}MW 연간 예상 수익",
+                    yaxis_title="총 수익 (억원)",
+                    template="plotly_dark",
+                    paper_bgcolor="rgba(22,33,62,0.8)",
+                    plot_bgcolor="rgba(22,33,62,0.8)",
+                    height=350,
+                )
+                st.plotly_chart(fig, use_container_width=True)
 
-    y_pred_scaled = model.predict(X_scaled)
-    y_pred = scaler_y.inverse_transform(y_pred_scaled.reshape(-1, 1)).ravel()
 
-    r2 = r2_score(y, y_pred)
-    mae = mean_absolute_error(y, y_pred)
+# TAB 7: 리스크
+@st.fragment
+def render_risk_tab(store, version):
+    import plotly.graph_objects as go
 
-    coef_info = [
-        {
-            "feature": col,
-            "coefficient": model.coef_[i],
-            "importance": abs(model.coef_[i]),
-        }
-        for i, col in enumerate(feature_cols)
-    ]
-    coef_df = pd.DataFrame(coef_info).sort_values("importance", ascending=False)
-
-    return (
-        {
-            "model": model,
-            "scaler_X": scaler_X,
-            "scaler_y": scaler_y,
-            "r2": r2,
-            "mae": mae,
-            "coefficients": coef_df,
-            "y_actual": y,
-            "y_pred": y_pred,
-            "dates": df_train[df_train[target_col].notna()]["날짜"]
-            .iloc[-len(y) :]
-            .values,
-        },
-        X,
-        y,
-        None,
+    st.markdown("## 🛡️ 리스크 분석")
+    st.caption(
+        "일간 변동 기준 (가격 %, 금리/스왑 bp) | VaR는 1일 손실을 양수로 표시 - "
+        "하락 VaR는 보유(롱), 상승 VaR는 매도·차입(숏) 포지션의 손실"
     )
 
+    col1, col2 = st.columns(2)
+    with col1:
+        risk_period = st.selectbox(
+            "계산 기간 (영업일)", list(RISK_PERIODS), index=1, key="risk_p"
+        )
+    with col2:
+        risk_alpha = st.selectbox(
+            "VaR 신뢰수준",
+            [0.95, 0.99],
+            index=[0.95, 0.99].index(RISK_VAR_ALPHA),
+            format_func=lambda a: f"{a:.0%}",
+            key="risk_a",
+        )
 
-def predict_future(model_info, df, feature_cols):
-    if model_info is None:
-        return None
-    latest = df[feature_cols].dropna().iloc[-1].values.reshape(1, -1)
-    latest_scaled = model_info["scaler_X"].transform(latest)
-    pred_scaled = model_info["model"].predict(latest_scaled)
-    return model_info["scaler_y"].inverse_transform(pred_scaled.reshape(-1, 1)).ravel()[
-        0
-    ]
-
-
-# =============================================================================
-# 신재생에너지 수익성 시뮬레이터
-# =============================================================================
-
-
-def calculate_renewable_revenue(smp, rec_price, capacity_mw, cf=0.15, rec_weight=1.0):
-    annual_generation = capacity_mw * 1000 * 24 * 365 * cf / 1000
-    smp_revenue = annual_generation * smp * 1000
-    rec_count = annual_generation * rec_weight
-    rec_revenue = rec_count * rec_price
-    total_revenue = smp_revenue + rec_revenue
-
-    return {
-        "annual_generation_mwh": annual_generation,
-        "smp_revenue": smp_revenue,
-        "rec_revenue": rec_revenue,
-        "total_revenue": total_revenue,
-        "revenue_per_mw": total_revenue / capacity_mw if capacity_mw > 0 else 0,
-    }
-
+    table = cached_risk_table(store, version, RISK_PERIODS[risk_period], risk_alpha)
+    st.dataframe(
+        table.style.format(
+            {
+                "현재값": "{:,.2f}",
+                "변동성(연율)": "{:.2f}",
+                "하락 VaR(역사적)": "{:.2f}",
+                "상승 VaR(역사적)": "{:.2f}",
+                "하락 VaR(정규)": "{:.2f}",
+                "상승 VaR(정규)": "{:.2f}",
+                "최대낙폭(기간)": "{:.2f}",
+                "현재 낙폭(전체)": "{:.2f}",
+            },
+            na_rep="-",
+        ),
+        use_container_width=True,
+        hide_index=True,
+    )
 
-# =============================================================================
-# 투자 시그널 / 시장 요약
-# =============================================================================
+    st.markdown("### 📉 이동 변동성 (연율)")
+    dates, vol, vol_columns = cached_rolling_vol(store, version, RISK_VOL_WINDOW)
+    vol_indicators = st.multiselect(
+        "지표",
+        vol_columns,
+        default=[c for c in ["달러환율", "육지 SMP", "국고채 (3년)"] if c in vol_columns],
+        key="risk_vol_i",
+    )
+    if vol_indicators:
+        start = np.searchsorted(dates, dates[-1] - np.timedelta64(3 * 365, "D"))
+        with perf_stage("chart.rolling_vol"):
+            fig = go.Figure()
+            for col in vol_indicators:
+                fig.add_trace(
+                    go.Scatter(
+                        x=dates[start:],
+                        y=vol[start:, vol_columns.index(col)],
+                        mode="lines",
+                        name=col,
+                    )
+                )
+            fig.update_layout(
+                title=f"{RISK_VOL_WINDOW}영업일 이동 변동성 (최근 3년, 가격 %, 금리 bp)",
+                template="plotly_dark",
+                paper_bgcolor="rgba(22,33,62,0.8)",
+                plot_bgcolor="rgba(22,33,62,0.8)",
+                height=350,
+            )
+            st.plotly_chart(fig, use_container_width=True)
 
+    st.markdown("---")
+    st.markdown("### 💥 시나리오 충격 → 프로젝트 현금흐름")
+    st.caption(
+        f"충격을 주지 않은 SMP / REC / 국고채는 최근 {SCENARIO_LOOKBACK}영업일의 "
+        f"{SCENARIO_HORIZON}영업일 변동으로 추정한 베타로 전파합니다. 조달금리 = 국고채 (3년) + 가산금리"
+    )
 
-def generate_investment_signals(df, days=30):
-    signals = []
-    if len(df) < days:
-        return signals
-
-    latest = df.iloc[-1]
-    recent = df.tail(days)
-
-    # SMP
-    smp_current = latest.get("육지 SMP")
-    smp_avg = recent["육지 SMP"].mean()
-    smp_std = recent["육지 SMP"].std()
-
-    if pd.notna(smp_current) and pd.notna(smp_avg):
-        if smp_current < smp_avg - smp_std:
-            signals.append(
-                {
-                    "category": "신재생에너지",
-                    "indicator": "SMP",
-                    "signal": "BUY",
-                    "reason": f"SMP가 30일 평균 대비 저점 (현재: {smp_current:.1f}, 평균: {smp_avg:.1f})",
-                    "strength": "STRONG"
-                    if smp_current < smp_avg - 2 * smp_std
-                    else "MODERATE",
-                }
+    col1, col2 = st.columns([1, 2])
+    with col1:
+        preset = st.selectbox(
+            "시나리오", list(SCENARIO_PRESETS) + ["직접 입력"], key="scn_preset"
+        )
+        if preset == "직접 입력":
+            shocks = {
+                "국고채 (3년)": st.number_input(
+                    "국고채 (3년) 충격 (bp)", -300.0, 300.0, 100.0, 10.0, key="scn_rate"
+                ),
+                "달러환율": st.number_input(
+                    "달러환율 충격 (%)", -30.0, 30.0, 0.0, 1.0, key="scn_usd"
+                ),
+                "두바이유": st.number_input(
+                    "두바이유 충격 (%)", -60.0, 60.0, 0.0, 5.0, key="scn_oil"
+                ),
+            }
+        else:
+            shocks = SCENARIO_PRESETS[preset]
+
+        st.markdown("#### ⚙️ 프로젝트")
+        project = {
+            "capacity_mw": st.number_input(
+                "설비용량 (MW)", 0.1, 1000.0, 10.0, 0.1, key="scn_cap"
+            ),
+            "cf": st.slider("이용률 (%)", 5, 95, 15, key="scn_cf") / 100,
+            "rec_weight": st.number_input(
+                "REC 가중치", 0.5, 5.0, 1.0, 0.1, key="scn_rw"
+            ),
+            "debt": st.number_input(
+                "PF 대출 (억원)", 0.0, 10000.0, 100.0, 10.0, key="scn_debt"
             )
-        elif smp_current > smp_avg + smp_std:
-            signals.append(
-                {
-                    "category": "신재생에너지",
-                    "indicator": "SMP",
-                    "signal": "SELL",
-                    "reason": f"SMP가 30일 평균 대비 고점 (현재: {smp_current:.1f}, 평균: {smp_avg:.1f})",
-                    "strength": "STRONG"
-                    if smp_current > smp_avg + 2 * smp_std
-                    else "MODERATE",
-                }
+            * 100000000,
+            "spread": st.number_input(
+                "가산금리 (%p)", 0.0, 10.0, 2.0, 0.1, key="scn_spread"
+            ),
+            "opex_per_mw": st.number_input(
+                "운영비 (억원/MW·년)", 0.0, 10.0, 0.3, 0.05, key="scn_opex"
             )
+            * 100000000,
+        }
 
-    # REC
-    rec_current = latest.get("육지 가격")
-    rec_avg = recent["육지 가격"].mean()
-    rec_std = recent["육지 가격"].std()
-
-    if pd.notna(rec_current) and pd.notna(rec_avg) and rec_std > 0:
-        if rec_current < rec_avg - rec_std:
-            signals.append(
-                {
-                    "category": "신재생에너지",
-                    "indicator": "REC",
-                    "signal": "BUY",
-                    "reason": f"REC 가격 저점 매수 기회 (현재: {rec_current:,.0f}, 평균: {rec_avg:,.0f})",
-                    "strength": "STRONG"
-                    if rec_current < rec_avg - 2 * rec_std
-                    else "MODERATE",
-                }
-            )
+    with col2:
+        result = cached_scenario(store, version, shocks, project)
+        st.dataframe(
+            result["levels"].style.format(
+                {"현재": "{:,.2f}", "충격 후": "{:,.2f}", "변동": "{:+.1f}"}
+            ),
+            use_container_width=True,
+            hide_index=True,
+        )
 
-    # 금리
-    rate_current = latest.get("국고채 (3년)")
-    rate_avg = recent["국고채 (3년)"].mean()
-
-    if pd.notna(rate_current) and pd.notna(rate_avg):
-        if rate_current > rate_avg + 0.1:
-            signals.append(
-                {
-                    "category": "인프라",
-                    "indicator": "금리",
-                    "signal": "HOLD",
-                    "reason": f"금리 상승 중 - 신규 차입 주의 (현재: {rate_current:.2f}%, 평균: {rate_avg:.2f}%)",
-                    "strength": "MODERATE",
-                }
-            )
-        elif rate_current < rate_avg - 0.1:
-            signals.append(
-                {
-                    "category": "인프라",
-                    "indicator": "금리",
-                    "signal": "BUY",
-                    "reason": f"금리 하락 - 차입 적기 (현재: {rate_current:.2f}%, 평균: {rate_avg:.2f}%)",
-                    "strength": "MODERATE",
-                }
-            )
+        base, shocked = result["base"], result["shocked"]
+        rows = [
+            ("조달금리 (%)", "funding_rate", 1),
+            ("총 수익 (억원)", "total_revenue", 100000000),
+            ("운영비 (억원)", "opex", 100000000),
+            ("이자비용 (억원)", "interest", 100000000),
+            ("현금흐름 (억원)", "cash_flow", 100000000),
+        ]
+        st.dataframe(
+            pd.DataFrame(
+                [
+                    {
+                        "항목": label,
+                        "현재": f"{base[key] / unit:,.2f}",
+                        "충격 후": f"{shocked[key] / unit:,.2f}",
+                        "변화": f"{(shocked[key] - base[key]) / unit:+,.2f}",
+                    }
+                    for label, key, unit in rows
+                ]
+            ),
+            use_container_width=True,
+            hide_index=True,
+        )
 
-    # 환율
-    fx_current = latest.get("달러환율")
-    fx_avg = recent["달러환율"].mean()
-    fx_std = recent["달러환율"].std()
-
-    if pd.notna(fx_current) and pd.notna(fx_avg) and fx_std > 0:
-        if fx_current > fx_avg + fx_std:
-            signals.append(
-                {
-                    "category": "해외투자",
-                    "indicator": "환율",
-                    "signal": "HOLD",
-                    "reason": f"원화 약세 - 해외 신규 투자 주의 (현재: {fx_current:,.0f}원)",
-                    "strength": "MODERATE",
-                }
-            )
-        elif fx_current < fx_avg - fx_std:
-            signals.append(
-                {
-                    "category": "해외투자",
-                    "indicator": "환율",
-                    "signal": "BUY",
-                    "reason": f"원화 강세 - 해외 투자 적기 (현재: {fx_current:,.0f}원)",
-                    "strength": "MODERATE",
-                }
-            )
+        delta = (shocked["cash_flow"] - base["cash_flow"]) / 100000000
+        message = f"📌 연간 현금흐름 {delta:+,.2f}억원"
+        if base["cash_flow"]:
+            message += f" ({delta * 100000000 / abs(base['cash_flow']):+.1%})"
+        if result["n_obs"]:
+            message += f" | 베타 추정 관측 {result['n_obs']:,}개"
+        st.info(message)
+
+
+# TAB 3: 투자 시그널
+@st.fragment
+def render_signal_tab(df, version, alert_mode):
+    st.markdown("## 🔔 투자 의사결정 시그널")
+    st.markdown("최근 30일 평균 대비 현재 위치를 기준으로 신호를 생성합니다.")
+
+    signals, analysis_points = cached_signals(df, version, days=30)
+
+    if signals:
+        for signal in signals:
+            if signal["signal"] == "BUY":
+                css_class, icon, label = "signal-buy", "🟢", "매수 적기"
+            elif signal["signal"] == "SELL":
+                css_class, icon, label = "signal-sell", "🔴", "매도 고려"
+            else:
+                css_class, icon, label = "signal-hold", "🟡", "관망"
 
-    return signals
+            st.markdown(
+                f"""
+            <div class="{css_class}">
+                <div style="font-size: 2rem;">{icon}</div>
+                <div style="color: #fff; font-size: 1.2rem; font-weight: bold;">{signal['category']} - {signal['indicator']}</div>
+                <div style="color: #fff; font-size: 1.5rem; font-weight: bold;">{label}</div>
+                <div style="color: #aaa; margin-top: 0.5rem;">{signal['reason']}</div>
+                <div style="color: #888; font-size: 0.8rem;">신호 강도: {signal['strength']}</div>
+            </div>
+            """,
+                unsafe_allow_html=True,
+            )
+            st.markdown("<br>", unsafe_allow_html=True)
+    else:
+        st.info("현재 특별한 투자 시그널이 없습니다.")
 
+    st.markdown("---")
+    st.markdown("### 📋 종합 시장 분석")
 
-def generate_market_summary(df, days=7):
-    if len(df) < days:
-        return None
+    if analysis_points:
+        for point in analysis_points:
+            st.markdown(f"- {point}")
+    else:
+        st.info("시장이 전반적으로 안정적입니다.")
 
-    recent = df.tail(days)
-    prev_period = df.iloc[-(days * 2) : -days] if len(df) >= days * 2 else df.head(days)
+    st.markdown("---")
+    st.markdown("### 📜 과거 급변동 이력")
+    st.caption("상단 급변동 알림과 같은 기준(사이드바 알림 기준, 금리/스왑은 bp, LNG는 직전 기간 대비)을 전체 히스토리에 적용한 결과입니다.")
 
-    summary = {}
-    indicators = {
-        "달러환율": {"name": "달러/원 환율", "unit": "원", "format": "{:,.1f}"},
-        "육지 SMP": {"name": "SMP (육지)", "unit": "원/kWh", "format": "{:,.1f}"},
-        "육지 가격": {"name": "REC 가격", "unit": "원", "format": "{:,.0f}"},
-        "두바이유": {"name": "두바이유", "unit": "$/배럴", "format": "{:,.1f}"},
-        "국고채 (3년)": {"name": "국고채 3년", "unit": "%", "format": "{:,.2f}"},
-    }
+    scan = cached_alert_scan(df, version, alert_mode)
+    stats = scan["stats"]
+    if len(stats) == 0:
+        st.info("이력을 계산할 데이터가 부족합니다.")
+        return
 
-    for col, info in indicators.items():
-        if col not in df.columns:
-            continue
-        current_avg = recent[col].mean()
-        prev_avg = prev_period[col].mean()
-        current_last = recent[col].iloc[-1]
-
-        if pd.notna(current_avg) and pd.notna(prev_avg) and prev_avg != 0:
-            change_pct = (current_avg - prev_avg) / prev_avg * 100
-            trend = (
-                "상승"
-                if change_pct > 0.5
-                else ("하락" if change_pct < -0.5 else "보합")
-            )
+    st.dataframe(
+        stats.assign(last_breach=stats["last_breach"].dt.strftime("%Y-%m-%d")).rename(
+            columns={
+                "category": "카테고리",
+                "indicator": "지표",
+                "threshold": "임계값",
+                "unit": "단위",
+                "days": "판정일수",
+                "breach_days": "발생일수",
+                "breach_rate": "발생비율(%)",
+                "up": "상승",
+                "down": "하락",
+                "events": "관측 기준 건수",
+                "last_breach": "최근 발생일",
+                "max_abs_change": "최대 변동",
+            }
+        ),
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            "발생비율(%)": st.column_config.NumberColumn(format="%.1f"),
+            "최대 변동": st.column_config.NumberColumn(format="%.2f"),
+        },
+    )
 
-            summary[col] = {
-                "name": info["name"],
-                "current": current_last,
-                "avg": current_avg,
-                "prev_avg": prev_avg,
-                "change_pct": change_pct,
-                "trend": trend,
-                "unit": info["unit"],
-                "format": info["format"],
+    history_col = st.selectbox("지표별 발생일", stats["indicator"].tolist(), key="alert_history_col")
+    history = scan["breaches"][scan["breaches"]["indicator"] == history_col]
+    st.dataframe(
+        history.assign(날짜=history["날짜"].dt.strftime("%Y-%m-%d"))
+        .sort_values("날짜", ascending=False)[
+            ["날짜", "previous", "current", "change", "change_pct", "direction", "z"]
+        ]
+        .rename(
+            columns={
+                "previous": "이전",
+                "current": "현재",
+                "change": "변동",
+                "change_pct": "변동률(%/bp)",
+                "direction": "방향",
+                "z": "z-score",
             }
-    return summary
+        ),
+        use_container_width=True,
+        hide_index=True,
+        height=300,
+    )
 
 
 # =============================================================================
@@ -1390,12 +1082,17 @@ def generate_market_summary(df, days=7):
 
 
 def main():
-    df = load_data()
+    perf_run = perf_begin(PERF_ENV_ENABLED or st.query_params.get("perf") == "1")
+
+    store = load_store()
 
-    if df is None or len(df) == 0:
+    if store is None or len(store) == 0:
         st.error(f"❌ 데이터 파일을 찾을 수 없거나 데이터가 없습니다: {DATA_PATH}")
         return
 
+    # 모든 세션이 공유하는 float64 블록 위의 view (세션별 복사 없음)
+    df = store.to_frame()
+
     latest_date = df["날짜"].max()
     today = datetime.now()
 
@@ -1403,10 +1100,37 @@ def main():
     with st.sidebar:
         st.markdown("## ⚙️ 설정")
 
+        # 선택한 소스만 다시 크롤링 (다른 세션이 쓰는 나머지 캐시는 유지)
+        with st.expander("새로고침 대상", expanded=False):
+            sources = st.multiselect(
+                "크롤링 소스",
+                list(CRAWL_SOURCES),
+                default=list(CRAWL_SOURCES),
+                format_func=lambda s: CRAWL_SOURCES[s][0],
+                key="refresh_sources",
+            )
         if st.button("🔄 데이터 새로고침", use_container_width=True):
-            st.cache_data.clear()
+            refresh_sources(sources)
             st.rerun()
 
+        # 검증에서 걸러진 크롤링 값 (히스토리를 덮어쓰지 않고 격리됨)
+        suspects = recent_quarantine()
+        if len(suspects) > 0:
+            with st.expander(f"⚠️ 격리된 크롤링 값 {len(suspects)}건", expanded=False):
+                st.dataframe(
+                    suspects[["date", "indicator", "value", "reference", "reasons"]].rename(
+                        columns={
+                            "date": "기준일",
+                            "indicator": "지표",
+                            "value": "크롤링 값",
+                            "reference": "직전 값",
+                            "reasons": "사유",
+                        }
+                    ),
+                    hide_index=True,
+                    use_container_width=True,
+                )
+
         st.markdown("---")
         st.markdown("### 📂 카테고리 필터")
         categories = list(INDICATORS.keys())
@@ -1414,11 +1138,28 @@ def main():
             "표시할 카테고리", categories, default=categories
         )
 
+        st.markdown("---")
+        st.markdown("### 🚨 알림 기준")
+        alert_mode = st.radio(
+            "급변동 판단",
+            ["fixed", "adaptive"],
+            index=0 if ALERT_MODE == "fixed" else 1,
+            format_func=lambda m: "고정 임계값" if m == "fixed" else "변동성 대비 (z-score)",
+            help="변동성 대비: 지표별 최근 변동성(EWMA)의 z배 이상 움직일 때 알림",
+            key="alert_mode",
+        )
+
         st.markdown("---")
         st.markdown("### 📅 차트 기간")
         selected_period = st.selectbox(
             "기간 선택", list(CHART_PERIODS.keys()), index=2
         )
+        show_regimes = st.checkbox(
+            "구조 변화 시점 표시",
+            value=True,
+            help="핵심 지표의 국면 전환 시점 (평균 수준이 옮겨 간 날)",
+            key="show_regimes",
+        )
 
         st.markdown("---")
         st.markdown(
@@ -1441,10 +1182,16 @@ def main():
         unsafe_allow_html=True,
     )
 
-    summary = get_summary(df)
+    version = store.version
+    summary, alerts = cached_overview(df, version, alert_mode)
+
+    # IFAM_ALERT_SINKS가 있으면 새 알림을 발송 대기열로 (기록/발송은 백그라운드 워커, 중복 제거)
+    if os.environ.get("IFAM_ALERT_SINKS"):
+        from ifam.dispatch import get_dispatcher
+
+        get_dispatcher().submit(alerts, latest_date)
 
     # 급변동 알림
-    alerts = check_alerts(summary)
     if alerts:
         st.markdown(
             f'<div class="alert-box"><h4>🚨 급변동 알림 ({len(alerts)}건) - 기준일 대비</h4></div>',
@@ -1459,45 +1206,10 @@ def main():
                 if alert_idx < len(alerts):
                     alert = alerts[alert_idx]
                     with cols[col_idx]:
-                        direction = "▲" if alert["direction"] == "up" else "▼"
-                        color = "#00d26a" if alert["direction"] == "up" else "#ff6b6b"
-
-                        prev_str = format_value(
-                            alert.get("previous"),
-                            alert.get("fmt", "{:,.2f}"),
-                            alert.get("unit", ""),
-                        )
-                        curr_str = format_value(
-                            alert.get("current"),
-                            alert.get("fmt", "{:,.2f}"),
-                            alert.get("unit", ""),
-                        )
-
-                        st.markdown(
-                            f"""
-                        <div class="alert-item" style="border-color: {color};">
-                            <div style="color: #888; font-size: 0.8rem;">
-                                {alert['icon']} {alert['category']}
-                            </div>
-                            <div style="color: #fff; font-weight: bold; margin-top: 2px;">
-                                {alert['indicator']}
-                            </div>
-                            <div style="display:flex; justify-content:space-between; align-items:center; margin-top: 6px;">
-                                <div style="color: {color}; font-weight: bold; font-size: 0.95rem;">
-                                    {direction} {abs(alert['change_pct']):.2f}%
-                                </div>
-                                <div style="text-align: right; font-size: 0.75rem; line-height: 1.3;">
-                                    <div style="color:#aaaaaa;">전일: <span style="color:#ffffff;">{prev_str}</span></div>
-                                    <div style="color:#aaaaaa;">현재: <span style="color:#ffffff;">{curr_str}</span></div>
-                                </div>
-                            </div>
-                        </div>
-                        """,
-                            unsafe_allow_html=True,
-                        )
+                        st.markdown(create_alert_item(alert), unsafe_allow_html=True)
 
-    # 탭 구성
-    tab0, tab1, tab4, tab5, tab6, tab2, tab3 = st.tabs(
+    # 탭 구성 (선택된 탭만 계산/렌더링)
+    tab0, tab1, tab4, tab5, tab6, tab2, tab7, tab3 = st.tabs(
         [
             "📖 사용 메뉴얼",
             "📈 지표 현황",
@@ -1505,518 +1217,45 @@ def main():
             "🎯 예측 분석",
             "📋 데이터",
             "🌱 시뮬레이션",
+            "🛡️ 리스크",
             "🔔 투자 시그널",
-        ]
+        ],
+        key="main_tab",
+        on_change="rerun",
     )
 
-    # TAB 0: 간단 메뉴얼
     with tab0:
-        st.markdown("## 📖 대시보드 사용 메뉴얼")
-        st.markdown(
-            """
-        이 대시보드는 **엑셀 히스토리 + 웹 크롤링(당일/전일)** 데이터를 합쳐서  
-        환율, REC, SMP, 유가, LNG, 금리, 스왑 지표를 한 번에 모니터링하기 위한 내부용 도구입니다.
-        """
-        )
-
-        st.markdown("---")
-        st.markdown("### 1️⃣ 상단 급변동 알림")
-        st.markdown(
-            """
-        - 전일 대비 변동률이 임계값을 넘는 지표만 표시합니다.  
-        - 예시  
-          - 환율: ±1% 이상  
-          - REC: ±3% 이상  
-          - SMP: ±5% 이상  
-          - 금리/스왑: ±10bp 이상  
-        - 아침 회의에서 '무슨 지표가 크게 움직였는지'만 빠르게 확인하는 용도입니다.
-        """
-        )
-
-        st.markdown("---")
-        st.markdown("### 2️⃣ 탭 구조 요약")
-        st.markdown(
-            """
-        - **📈 지표 현황**: 카테고리별(환율/REC/SMP/유가/LNG/금리/스왑) 현재값 & 전일대비  
-        - **🔬 상관관계 분석**: 두 지표 간 상관계수, 시차(lag) 분석  
-        - **🎯 예측 분석**: 회귀모형으로 SMP, 금리 등을 다른 지표로 설명/예측  
-        - **🌱 시뮬레이션**: SMP/REC 시나리오에 따른 신재생 발전소 수익성 계산  
-        - **🔔 투자 시그널**: 최근 30일 평균 대비 현재 위치 기반 BUY/SELL/HOLD 자동 생성  
-        - **📋 데이터**: 원본 시계열 데이터 조회 및 CSV 다운로드
-        """
-        )
-
-        st.markdown("---")
-        st.markdown("### 3️⃣ 데이터 구조")
-        st.markdown(
-            """
-        - 엑셀(`데일리_클리핑_자료.xlsm`)에 2021년 이후 히스토리가 있고,  
-          오늘/전일 값은 **크롤링 데이터로 덮어써서** 사용합니다.  
-        - 엑셀이 없더라도, 크롤링이 되면 최소 2행(전일/당일) 데이터로 대시보드가 동작합니다.
-        """
-        )
-
-    # TAB 1: 지표 현황
+        if tab0.open:
+            render_manual_tab()
     with tab1:
-        st.markdown("### 📊 주간 시장 트렌드")
-        market_summary = generate_market_summary(df, days=7)
-
-        if market_summary:
-            cols = st.columns(5)
-            for i, (col_name, data_m) in enumerate(market_summary.items()):
-                with cols[i % 5]:
-                    trend_color = (
-                        "#00d26a"
-                        if data_m["trend"] == "상승"
-                        else ("#ff6b6b" if data_m["trend"] == "하락" else "#888")
-                    )
-                    trend_arrow = (
-                        "↑"
-                        if data_m["trend"] == "상승"
-                        else ("↓" if data_m["trend"] == "하락" else "→")
-                    )
-                    st.markdown(
-                        f"""
-                    <div class="summary-card">
-                        <div style="color: #888; font-size: 0.8rem;">{data_m['name']}</div>
-                        <div style="color: #fff; font-size: 1.3rem; font-weight: bold;">{data_m['format'].format(data_m['current'])} {data_m['unit']}</div>
-                        <div style="color: {trend_color};">{trend_arrow} {data_m['trend']} ({data_m['change_pct']:+.1f}%)</div>
-                    </div>
-                    """,
-                        unsafe_allow_html=True,
-                    )
-
-        st.markdown("---")
-
-        for category in selected_categories:
-            if category not in summary:
-                continue
-            data_c = summary[category]
-
-            st.markdown(
-                f"""
-            <div class="category-header" style="border-color: {data_c['color']};">
-                <span style="font-size: 1.5rem;">{data_c['icon']}</span>
-                <h3>{category}</h3>
-            </div>
-            """,
-                unsafe_allow_html=True,
-            )
-
-            cols = st.columns(4)
-            is_rate = category in ["금리", "스왑"]
-
-            for i, (col_name, ind) in enumerate(data_c["indicators"].items()):
-                with cols[i % 4]:
-                    value_str = format_value(ind["value"], ind["format"], ind["unit"])
-                    is_lng = ind.get("is_lng", False)
-                    change_html = get_change_html(
-                        ind["change"], ind["change_pct"], ind["direction"], is_rate, is_lng
-                    )
-                    note = ind.get("note", "")
-                    st.markdown(
-                        create_metric_card(col_name, value_str, change_html, note),
-                        unsafe_allow_html=True,
-                    )
-
-    # TAB 2: 시뮬레이션
-    with tab2:
-        st.markdown("## 🌱 신재생에너지 수익성 시뮬레이터")
-
-        col1, col2 = st.columns([1, 2])
-
-        with col1:
-            st.markdown("### ⚙️ 프로젝트 설정")
-
-            project_type = st.selectbox(
-                "발전 유형", ["태양광", "풍력(육상)", "풍력(해상)", "연료전지", "바이오"]
-            )
-
-            defaults = {
-                "태양광": {"cf": 0.15, "rec_weight": 1.0},
-                "풍력(육상)": {"cf": 0.25, "rec_weight": 1.0},
-                "풍력(해상)": {"cf": 0.30, "rec_weight": 2.0},
-                "연료전지": {"cf": 0.85, "rec_weight": 2.0},
-                "바이오": {"cf": 0.80, "rec_weight": 1.5},
-            }
-
-            capacity = st.number_input(
-                "설비용량 (MW)", min_value=0.1, max_value=1000.0, value=10.0, step=0.1
-            )
-            cf = (
-                st.slider(
-                    "이용률 (%)", 5, 95, int(defaults[project_type]["cf"] * 100)
-                )
-                / 100
-            )
-            rec_weight = st.number_input(
-                "REC 가중치",
-                min_value=0.5,
-                max_value=5.0,
-                value=defaults[project_type]["rec_weight"],
-                step=0.1,
-            )
-
-            st.markdown("### 📊 시나리오 설정")
-
-            current_smp = (
-                df["육지 SMP"].dropna().iloc[-1]
-                if "육지 SMP" in df.columns and len(df["육지 SMP"].dropna()) > 0
-                else 100
+        if tab1.open:
+            render_indicator_tab(
+                store,
+                df,
+                version,
+                summary,
+                selected_categories,
+                CHART_PERIODS[selected_period],
+                show_regimes,
             )
-            current_rec = (
-                df["육지 가격"].dropna().iloc[-1]
-                if "육지 가격" in df.columns and len(df["육지 가격"].dropna()) > 0
-                else 70000
-            )
-
-            smp_scenarios = st.multiselect(
-                "SMP 시나리오 (원/kWh)",
-                [80, 100, 120, 150, 180, 200, 220],
-                default=[100, 150, 200],
-            )
-            rec_scenario = st.number_input(
-                "REC 가격 (원/REC)",
-                min_value=10000,
-                max_value=200000,
-                value=int(current_rec),
-                step=1000,
-            )
-
-        with col2:
-            st.markdown("### 📈 수익 시뮬레이션 결과")
-
-            if smp_scenarios:
-                results = []
-                for smp in smp_scenarios:
-                    rev = calculate_renewable_revenue(
-                        smp, rec_scenario, capacity, cf, rec_weight
-                    )
-                    results.append(
-                        {
-                            "SMP (원/kWh)": smp,
-                            "연간발전량 (MWh)": f"{rev['annual_generation_mwh']:,.0f}",
-                            "SMP 수익 (억원)": f"{rev['smp_revenue']/100000000:.2f}",
-                            "REC 수익 (억원)": f"{rev['rec_revenue']/100000000:.2f}",
-                            "총 수익 (억원)": f"{rev['total_revenue']/100000000:.2f}",
-                        }
-                    )
-
-                st.dataframe(
-                    pd.DataFrame(results), use_container_width=True, hide_index=True
-                )
-
-                fig = go.Figure()
-                revenues = [
-                    calculate_renewable_revenue(
-                        smp, rec_scenario, capacity, cf, rec_weight
-                    )["total_revenue"]
-                    / 100000000
-                    for smp in smp_scenarios
-                ]
-                fig.add_trace(
-                    go.Bar(
-                        x=[f"SMP {s}" for s in smp_scenarios],
-                        y=revenues,
-                        marker_color="#27ae60",
-                        text=[f"{r:.1f}억" for r in revenues],
-                        textposition="outside",
-                    )
-                )
-                fig.update_layout(
-                    title=f"{project_type} {capacity}MW 연간 예상 수익",
-                    yaxis_title="총 수익 (억원)",
-                    template="plotly_dark",
-                    paper_bgcolor="rgba(22,33,62,0.8)",
-                    plot_bgcolor="rgba(22,33,62,0.8)",
-                    height=350,
-                )
-                st.plotly_chart(fig, use_container_width=True)
-
-    # TAB 3: 투자 시그널
-    with tab3:
-        st.markdown("## 🔔 투자 의사결정 시그널")
-        st.markdown("최근 30일 평균 대비 현재 위치를 기준으로 신호를 생성합니다.")
-
-        signals = generate_investment_signals(df, days=30)
-
-        if signals:
-            for signal in signals:
-                if signal["signal"] == "BUY":
-                    css_class, icon, label = "signal-buy", "🟢", "매수 적기"
-                elif signal["signal"] == "SELL":
-                    css_class, icon, label = "signal-sell", "🔴", "매도 고려"
-                else:
-                    css_class, icon, label = "signal-hold", "🟡", "관망"
-
-                st.markdown(
-                    f"""
-                <div class="{css_class}">
-                    <div style="font-size: 2rem;">{icon}</div>
-                    <div style="color: #fff; font-size: 1.2rem; font-weight: bold;">{signal['category']} - {signal['indicator']}</div>
-                    <div style="color: #fff; font-size: 1.5rem; font-weight: bold;">{label}</div>
-                    <div style="color: #aaa; margin-top: 0.5rem;">{signal['reason']}</div>
-                    <div style="color: #888; font-size: 0.8rem;">신호 강도: {signal['strength']}</div>
-                </div>
-                """,
-                    unsafe_allow_html=True,
-                )
-                st.markdown("<br>", unsafe_allow_html=True)
-        else:
-            st.info("현재 특별한 투자 시그널이 없습니다.")
-
-        st.markdown("---")
-        st.markdown("### 📋 종합 시장 분석")
-
-        latest_row = df.iloc[-1]
-        analysis_points = []
-
-        smp_current = latest_row.get("육지 SMP")
-        smp_avg_90d = df.tail(90)["육지 SMP"].mean()
-        if pd.notna(smp_current) and pd.notna(smp_avg_90d):
-            smp_vs_avg = (smp_current / smp_avg_90d - 1) * 100
-            if smp_vs_avg > 10:
-                analysis_points.append(
-                    f"⚡ SMP가 90일 평균 대비 **{smp_vs_avg:.1f}% 높음** - 신재생 발전 수익성 양호"
-                )
-            elif smp_vs_avg < -10:
-                analysis_points.append(
-                    f"⚡ SMP가 90일 평균 대비 **{abs(smp_vs_avg):.1f}% 낮음** - 수익성 주의"
-                )
-
-        rate_current = latest_row.get("국고채 (3년)")
-        rate_avg_90d = df.tail(90)["국고채 (3년)"].mean()
-        if pd.notna(rate_current) and pd.notna(rate_avg_90d):
-            if rate_current > rate_avg_90d + 0.2:
-                analysis_points.append(
-                    f"📊 금리 상승 추세 ({rate_current:.2f}%) - PF 조달비용 상승 예상"
-                )
-            elif rate_current < rate_avg_90d - 0.2:
-                analysis_points.append(
-                    f"📊 금리 하락 추세 ({rate_current:.2f}%) - 리파이낸싱 적기"
-                )
-
-        if analysis_points:
-            for point in analysis_points:
-                st.markdown(f"- {point}")
-        else:
-            st.info("시장이 전반적으로 안정적입니다.")
-
-    # TAB 4: 상관관계 분석
     with tab4:
-        st.markdown("## 🔬 선행/후행 지표 상관관계 분석")
-
-        col1, col2 = st.columns([1, 3])
-
-        with col1:
-            heatmap_period = st.selectbox(
-                "분석 기간", ["3개월", "6개월", "1년", "전체"], index=2, key="hm_p"
-            )
-            heatmap_indicators = st.multiselect(
-                "분석 지표",
-                KEY_INDICATORS,
-                default=["달러환율", "육지 SMP", "두바이유", "국고채 (3년)"],
-                key="hm_i",
-            )
-
-        with col2:
-            if len(heatmap_indicators) >= 2:
-                days = CHART_PERIODS.get(heatmap_period)
-                corr_matrix = calculate_correlation_matrix(
-                    df, heatmap_indicators, days
-                )
-
-                fig = px.imshow(
-                    corr_matrix,
-                    labels=dict(color="상관계수"),
-                    x=heatmap_indicators,
-                    y=heatmap_indicators,
-                    color_continuous_scale="RdBu_r",
-                    zmin=-1,
-                    zmax=1,
-                    text_auto=".2f",
-                )
-                fig.update_layout(
-                    template="plotly_dark",
-                    paper_bgcolor="rgba(22,33,62,0.8)",
-                    plot_bgcolor="rgba(22,33,62,0.8)",
-                    height=400,
-                )
-                st.plotly_chart(fig, use_container_width=True)
-
-        st.markdown("---")
-        st.markdown("### 🕐 시차(Lag) 분석")
-
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            leading = st.selectbox(
-                "선행지표", KEY_INDICATORS, index=5, key="ld"
-            )
-        with col2:
-            lagging = st.selectbox(
-                "후행지표", KEY_INDICATORS, index=3, key="lg"
-            )
-        with col3:
-            max_lag = st.slider("최대 시차", 1, 365, 180, key="ml")
-
-        if leading != lagging:
-            lag_df = calculate_lagged_correlation(
-                df, leading, lagging, max_lag
-            )
-            optimal = find_optimal_lag(lag_df)
-
-            fig = go.Figure()
-            fig.add_trace(
-                go.Scatter(
-                    x=lag_df["lag"],
-                    y=lag_df["correlation"],
-                    mode="lines+markers",
-                    line=dict(color="#3498db"),
-                )
-            )
-            if optimal is not None:
-                fig.add_vline(x=optimal["lag"], line_dash="dash", line_color="#e94560")
-            fig.add_hline(y=0, line_dash="dot", line_color="gray")
-            fig.update_layout(
-                title=f"{leading} → {lagging}",
-                template="plotly_dark",
-                paper_bgcolor="rgba(22,33,62,0.8)",
-                plot_bgcolor="rgba(22,33,62,0.8)",
-                height=300,
-                yaxis=dict(range=[-1, 1]),
-            )
-            st.plotly_chart(fig, use_container_width=True)
-
-            if optimal is not None and not np.isnan(optimal["correlation"]):
-                strength, direction, _ = interpret_correlation(
-                    optimal["correlation"]
-                )
-                st.info(
-                    f"📌 최적 시차: **{int(optimal['lag'])}일** | 상관계수: **{optimal['correlation']:.3f}** ({strength} {direction} 상관관계)"
-                )
-
-    # TAB 5: 예측 분석
+        if tab4.open:
+            render_correlation_tab(store, df, version)
     with tab5:
-        st.markdown("## 🎯 회귀분석 기반 예측")
-
-        col1, col2 = st.columns([1, 2])
-
-        with col1:
-            target = st.selectbox(
-                "예측 대상", KEY_INDICATORS, index=3, key="pt"
-            )
-
-            feature_options = [x for x in KEY_INDICATORS if x != target]
-
-            base_default = ["두바이유", "달러환율"]
-            default_features = [
-                x for x in base_default if x in feature_options
-            ]
-
-            features = st.multiselect(
-                "설명 변수",
-                feature_options,
-                default=default_features,
-                key="pf",
-            )
-
-            train_period = st.selectbox(
-                "학습 기간", ["3개월", "6개월", "1년", "전체"], index=2, key="tp"
-            )
-            run_pred = st.button("🚀 예측 실행", use_container_width=True)
-
-        with col2:
-            if run_pred and features:
-                train_days = CHART_PERIODS.get(train_period)
-                model_info, _, _, error = build_regression_model(
-                    df, target, features, train_days
-                )
-
-                if error:
-                    st.error(error)
-                elif model_info:
-                    st.markdown(
-                        f"**R² (설명력): {model_info['r2']:.3f}** | MAE: {model_info['mae']:.2f}"
-                    )
-
-                    fig = go.Figure()
-                    fig.add_trace(
-                        go.Scatter(
-                            x=model_info["dates"],
-                            y=model_info["y_actual"],
-                            mode="lines",
-                            name="실제값",
-                            line=dict(color="#3498db"),
-                        )
-                    )
-                    fig.add_trace(
-                        go.Scatter(
-                            x=model_info["dates"],
-                            y=model_info["y_pred"],
-                            mode="lines",
-                            name="예측값",
-                            line=dict(color="#e94560", dash="dot"),
-                        )
-                    )
-                    fig.update_layout(
-                        template="plotly_dark",
-                        paper_bgcolor="rgba(22,33,62,0.8)",
-                        plot_bgcolor="rgba(22,33,62,0.8)",
-                        height=300,
-                    )
-                    st.plotly_chart(fig, use_container_width=True)
-
-                    pred = predict_future(model_info, df, features)
-                    actual = df[target].dropna().iloc[-1]
-                    st.success(
-                        f"**현재 예측값: {pred:.2f}** (실제: {actual:.2f})"
-                    )
-            elif run_pred:
-                st.warning("설명 변수를 선택하세요.")
-
-    # TAB 6: 데이터
+        if tab5.open:
+            render_prediction_tab(store, df, version)
     with tab6:
-        st.markdown("### 📋 원본 데이터")
-
-        col1, col2 = st.columns(2)
-        with col1:
-            date_range = st.date_input(
-                "날짜 범위",
-                value=(latest_date - timedelta(days=30), latest_date),
-            )
-        with col2:
-            table_cat = st.selectbox(
-                "카테고리", ["전체"] + list(INDICATORS.keys()), key="tc"
-            )
-
-        df_table = df.copy()
-        if isinstance(date_range, (list, tuple)) and len(date_range) == 2:
-            start, end = date_range
-            df_table = df_table[
-                (df_table["날짜"] >= pd.to_datetime(start))
-                & (df_table["날짜"] <= pd.to_datetime(end))
-            ]
-
-        if table_cat != "전체":
-            cols = ["날짜"] + list(INDICATORS[table_cat]["columns"].keys())
-            existing = [c for c in cols if c in df_table.columns]
-            df_table = df_table[existing]
-
-        df_display = df_table.copy()
-        df_display["날짜"] = df_display["날짜"].dt.strftime("%Y-%m-%d")
-        st.dataframe(
-            df_display.sort_values("날짜", ascending=False),
-            use_container_width=True,
-            height=400,
-        )
-
-        csv = df_display.to_csv(index=False, encoding="utf-8-sig")
-        st.download_button(
-            "📥 CSV 다운로드",
-            csv,
-            f"data_{datetime.now().strftime('%Y%m%d')}.csv",
-            "text/csv",
-        )
+        if tab6.open:
+            render_data_tab(store, latest_date)
+    with tab2:
+        if tab2.open:
+            render_simulation_tab(df)
+    with tab7:
+        if tab7.open:
+            render_risk_tab(store, version)
+    with tab3:
+        if tab3.open:
+            render_signal_tab(df, version, alert_mode)
 
     # 푸터
     st.markdown("---")
@@ -2029,6 +1268,9 @@ def main():
         unsafe_allow_html=True,
     )
 
+    if perf_run is not None:
+        render_perf_panel(perf_run)
+
 
 if __name__ == "__main__":
     main()
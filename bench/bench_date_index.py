@@ -0,0 +1,97 @@
+"""
+기간 필터 벤치마크: boolean mask vs 날짜 인덱스(searchsorted + slice view)
+
+수십 년 길이의 합성 히스토리(영업일, DATA_COLUMNS 전체)를 만들어
+탭들이 쓰는 기간 필터(최근 1개월/1년/전체, 날짜 범위)를 두 방식으로 비교한다.
+
+사용법 (저장소 루트에서):
+    python bench/bench_date_index.py
+    python bench/bench_date_index.py --years 10 30 60 --repeat 200
+"""
+
+import argparse
+import os
+import sys
+import timeit
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ifam import DATA_COLUMNS, FrameStore, date_slice, recent_slice  # noqa: E402
+
+
+def synthetic_history(years, seed=0):
+    """최근 날짜에서 years년 전까지의 영업일 랜덤워크 히스토리"""
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range(end="2026-10-16", periods=int(years * 252))
+    n_cols = len(DATA_COLUMNS) - 1
+    steps = rng.normal(0, 0.01, size=(len(dates), n_cols))
+    values = 100 * np.exp(np.cumsum(steps, axis=0))
+    df = pd.DataFrame(values, columns=DATA_COLUMNS[1:])
+    df.insert(0, "날짜", dates)
+    return df
+
+
+def bench(fn, repeat):
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=max(3, repeat // 50), number=number))
+    return best / number * 1e6
+
+
+def run(years_list, repeat):
+    rows = []
+    for years in years_list:
+        df = synthetic_history(years)
+        store = FrameStore.from_frame(df)
+        last = df["날짜"].iloc[-1]
+
+        cases = {
+            "최근 30일": (30, None),
+            "최근 1년": (365, None),
+            "날짜 범위(중간 1년)": (None, (last - timedelta(days=365 * years // 2),
+                                        last - timedelta(days=365 * years // 2 - 365))),
+        }
+        for name, (days, window) in cases.items():
+            if window is None:
+                cutoff = last - timedelta(days=days)
+                mask_fn = lambda: df[df["날짜"] >= cutoff]  # noqa: E731
+                slice_fn = lambda: df.iloc[recent_slice(df["날짜"], days)]  # noqa: E731
+                store_fn = lambda: store.recent(days)  # noqa: E731
+            else:
+                start, end = window
+                mask_fn = lambda: df[(df["날짜"] >= start) & (df["날짜"] <= end)]  # noqa: E731
+                slice_fn = lambda: df.iloc[date_slice(df["날짜"], start, end)]  # noqa: E731
+                store_fn = lambda: store.window(start, end)  # noqa: E731
+
+            assert len(mask_fn()) == len(slice_fn()) == len(store_fn())
+            rows.append(
+                {
+                    "years": years,
+                    "rows": len(df),
+                    "case": name,
+                    "mask_us": bench(mask_fn, repeat),
+                    "slice_us": bench(slice_fn, repeat),
+                    "store_us": bench(store_fn, repeat),
+                }
+            )
+    return pd.DataFrame(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--years", type=int, nargs="+", default=[5, 20, 50])
+    parser.add_argument("--repeat", type=int, default=100)
+    args = parser.parse_args()
+
+    result = run(args.years, args.repeat)
+    result["speedup"] = result["mask_us"] / result["slice_us"]
+    with pd.option_context("display.width", 120, "display.float_format", "{:,.1f}".format):
+        print(result.to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
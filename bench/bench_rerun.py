@@ -0,0 +1,96 @@
+"""
+위젯 조작 1회당 Streamlit 재실행 지연 벤치마크 (streamlit.testing AppTest, 브라우저 없이 실행)
+
+각 시나리오마다 해당 탭을 열고 위젯 값을 바꿔가며 재실행 시간을 잰다.
+크롤러는 네트워크 없이 즉시 실패하도록 막아서 엑셀 히스토리만으로 측정한다.
+
+사용법 (저장소 루트에서):
+    python bench/bench_rerun.py
+    python bench/bench_rerun.py --app /tmp/app_old.py      # 이전 버전과 비교
+    git show <rev>:app.py > /tmp/app_old.py                  # 이전 버전 추출
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+import requests
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 벤치 실행의 수정 이력 / 격리 기록은 임시 폴더로 (data/*.sqlite 실제 기록에 섞지 않음, 하위 프로세스도 상속)
+_SCRATCH = tempfile.mkdtemp(prefix="ifam_bench_")
+os.environ["IFAM_REVISIONS_PATH"] = os.path.join(_SCRATCH, "revisions.sqlite")
+os.environ["IFAM_QUARANTINE_PATH"] = os.path.join(_SCRATCH, "quarantine.sqlite")
+
+# (시나리오, 탭 라벨, 위젯 종류, 위젯 key, 값 목록)
+SCENARIOS = [
+    ("시차 분석 최대 시차", "🔬 상관관계 분석", "slider", "ml", [90, 120, 150, 200, 250, 300]),
+    ("히트맵 분석 기간", "🔬 상관관계 분석", "selectbox", "hm_p", ["3개월", "6개월", "전체", "1년"]),
+    ("데이터 카테고리", "📋 데이터", "selectbox", "tc", ["환율", "REC", "SMP", "금리", "전체"]),
+]
+
+
+def _offline(*args, **kwargs):
+    raise requests.ConnectionError("offline benchmark")
+
+
+def run(app_path, repeat):
+    from streamlit.testing.v1 import AppTest
+
+    requests.get = _offline
+
+    at = AppTest.from_file(os.path.abspath(app_path), default_timeout=300)
+    t0 = time.perf_counter()
+    at.run()
+    cold = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    at.run()
+    warm = time.perf_counter() - t0
+
+    results = {"cold_start_s": cold, "warm_rerun_s": warm, "scenarios": {}}
+
+    for name, tab_label, kind, key, values in SCENARIOS:
+        at.session_state["main_tab"] = tab_label
+        at.run()
+
+        timings = []
+        for value in (values * repeat)[: max(len(values), repeat)]:
+            widget = getattr(at, kind)(key=key)
+            widget.set_value(value)
+            t0 = time.perf_counter()
+            at.run()
+            timings.append(time.perf_counter() - t0)
+            if at.exception:
+                raise RuntimeError(at.exception[0].value)
+
+        results["scenarios"][name] = {
+            "median_ms": statistics.median(timings) * 1000,
+            "max_ms": max(timings) * 1000,
+            "n": len(timings),
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--app", default=os.path.join(ROOT, "app.py"))
+    parser.add_argument("--repeat", type=int, default=6)
+    args = parser.parse_args()
+
+    os.chdir(ROOT)
+    res = run(args.app, args.repeat)
+
+    print(f"app: {args.app}")
+    print(f"  최초 실행      {res['cold_start_s']:8.2f} s")
+    print(f"  재실행(무조작) {res['warm_rerun_s'] * 1000:8.1f} ms")
+    for name, r in res["scenarios"].items():
+        print(f"  {name:<14} median {r['median_ms']:8.1f} ms | max {r['max_ms']:8.1f} ms (n={r['n']})")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
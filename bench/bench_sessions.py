@@ -0,0 +1,166 @@
+"""
+동시 세션 부하 테스트: 세션 수가 늘 때 메모리/지연이 어떻게 변하는지 (Streamlit 없이 스레드로 흉내)
+
+세션 1개 = 대시보드 rerun 1회가 거치는 데이터 경로
+  load_store → to_frame → cached_overview → 지표별 cached_chart_series → cached_signals
+  → cached_market_summary → cached_correlation_matrix → grid_page
+N개 세션을 스레드로 동시에 실행하고, 모든 세션이 결과를 쥐고 있는 시점의 메모리(tracemalloc)와
+세션별 지연을 잰다.
+
+  - shared: 현재 구조 (memoize 결과/FrameStore를 프로세스에서 1벌 공유, 세션은 view만 가짐)
+  - copy:   st.cache_data 방식 흉내 (캐시 hit마다 결과를 pickle 왕복 → 세션마다 복사본)
+
+엑셀 히스토리만 사용 (크롤링 없음). --scale로 히스토리를 늘려서 측정할 수 있다.
+
+사용법 (저장소 루트에서):
+    python bench/bench_sessions.py
+    python bench/bench_sessions.py --sessions 1 10 20 40 --scale 10
+"""
+
+import argparse
+import os
+import pickle
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 벤치 실행의 수정 이력 / 격리 기록은 임시 폴더로 (data/*.sqlite 실제 기록에 섞지 않음, 하위 프로세스도 상속)
+_SCRATCH = tempfile.mkdtemp(prefix="ifam_bench_")
+os.environ["IFAM_REVISIONS_PATH"] = os.path.join(_SCRATCH, "revisions.sqlite")
+os.environ["IFAM_QUARANTINE_PATH"] = os.path.join(_SCRATCH, "quarantine.sqlite")
+sys.path.insert(0, ROOT)
+
+from ifam import (  # noqa: E402
+    KEY_INDICATORS,
+    FrameStore,
+    cached_chart_series,
+    cached_correlation_matrix,
+    cached_market_summary,
+    cached_overview,
+    cached_signals,
+    clear_all,
+    grid_page,
+    load_store,
+)
+from ifam.cache import cache_stats  # noqa: E402
+
+
+def synthetic_store(store, scale):
+    """히스토리를 scale배로 늘린 FrameStore (날짜를 과거로 이어붙임, 값은 그대로 반복)"""
+    if scale <= 1:
+        return store
+    n = len(store)
+    step = np.timedelta64(1, "D")
+    dates = np.concatenate(
+        [store.dates - (scale - 1 - k) * n * step for k in range(scale)]
+    )
+    values = np.concatenate([store.values] * scale)
+    return FrameStore(dates, values, store.columns)
+
+
+def session_run(store, mode):
+    """세션 1개의 rerun 데이터 경로. 세션이 화면을 그리는 동안 쥐고 있는 결과들을 반환"""
+    get = (lambda x: pickle.loads(pickle.dumps(x))) if mode == "copy" else (lambda x: x)
+    version = store.version
+
+    held = {"store": get(store)}
+    df = held["store"].to_frame()
+    held["df"] = df
+    held["overview"] = get(cached_overview(df, version))
+    held["charts"] = [
+        get(cached_chart_series(store, version, col, None)) for col in store.columns
+    ]
+    held["signals"] = get(cached_signals(df, version, 30))
+    held["market"] = get(cached_market_summary(df, version, 7))
+    held["corr"] = get(cached_correlation_matrix(df, version, KEY_INDICATORS, 365))
+    held["page"] = grid_page(held["store"], 0, 50)
+    return held
+
+
+def run_sessions(store, n_sessions, mode):
+    """n개 세션을 동시에 시작, 전부 결과를 쥔 시점의 추가 메모리와 세션별 지연"""
+    start = threading.Barrier(n_sessions + 1)
+    done = threading.Barrier(n_sessions + 1)
+    release = threading.Event()
+    latencies = []
+    holding = []  # 측정 시점까지 세션들이 쥐고 있는 결과
+    lock = threading.Lock()
+
+    def worker():
+        start.wait()
+        t0 = time.perf_counter()
+        held = session_run(store, mode)
+        elapsed = time.perf_counter() - t0
+        with lock:
+            latencies.append(elapsed * 1000)
+            holding.append(held)
+        done.wait()
+        release.wait()
+
+    threads = [threading.Thread(target=worker) for _ in range(n_sessions)]
+    for t in threads:
+        t.start()
+
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    start.wait()
+    done.wait()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    release.set()
+    for t in threads:
+        t.join()
+    holding.clear()
+
+    return {
+        "held_mb": (current - base) / 1e6,
+        "peak_mb": (peak - base) / 1e6,
+        "p50_ms": statistics.median(latencies),
+        "max_ms": max(latencies),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 5, 10, 20, 40])
+    parser.add_argument("--scale", type=int, default=1, help="히스토리 배수")
+    parser.add_argument("--modes", nargs="+", default=["shared", "copy"])
+    args = parser.parse_args()
+
+    os.chdir(ROOT)
+    base_store = load_store(crawl=False)
+    if base_store is None:
+        print(f"데이터가 없습니다: {ROOT}/data")
+        return 1
+    store = synthetic_store(base_store, args.scale)
+    print(f"히스토리 {len(store):,}행 x {len(store.columns)}열, 블록 {store.nbytes / 1e6:.1f} MB")
+
+    for mode in args.modes:
+        # 캐시 예열: 첫 세션의 계산 비용은 세션 수와 무관하므로 측정에서 뺀다
+        clear_all()
+        session_run(store, "shared")
+        print(f"\n[{mode}]")
+        print(f"  {'세션':>4} {'보유 MB':>9} {'피크 MB':>9} {'MB/세션':>8} {'p50 ms':>9} {'max ms':>9}")
+        for n in args.sessions:
+            r = run_sessions(store, n, mode)
+            print(
+                f"  {n:>4} {r['held_mb']:>9.2f} {r['peak_mb']:>9.2f} {r['held_mb'] / n:>8.3f}"
+                f" {r['p50_ms']:>9.1f} {r['max_ms']:>9.1f}"
+            )
+
+    print("\n공유 캐시 (상위 5개)")
+    for s in cache_stats()[:5]:
+        print(f"  {s['name']:<28} {s['size']:>4}개 {s['bytes'] / 1e6:>8.2f} MB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
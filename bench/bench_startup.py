@@ -0,0 +1,128 @@
+"""
+대시보드 기동 시간 벤치마크: 모듈 import 시간(python -X importtime) + 첫 화면 렌더링
+
+  - import: `import app` 누적 시간과 가장 무거운 최상위 모듈 (새 프로세스에서 n회, 중앙값)
+  - 첫 렌더링: AppTest 새 프로세스의 최초 실행(엑셀 로드 포함)과,
+    데이터가 캐시된 프로세스에 새 세션이 붙었을 때의 첫 화면 (지표 현황 탭)
+
+크롤러는 네트워크 없이 즉시 실패하도록 막는다.
+
+사용법 (저장소 루트에서):
+    python bench/bench_startup.py
+    git show <rev>:app.py > /tmp/app_old.py
+    python bench/bench_startup.py --app /tmp/app_old.py   # 이전 버전과 비교
+"""
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 벤치 실행의 수정 이력 / 격리 기록은 임시 폴더로 (data/*.sqlite 실제 기록에 섞지 않음, 하위 프로세스도 상속)
+_SCRATCH = tempfile.mkdtemp(prefix="ifam_bench_")
+os.environ["IFAM_REVISIONS_PATH"] = os.path.join(_SCRATCH, "revisions.sqlite")
+os.environ["IFAM_QUARANTINE_PATH"] = os.path.join(_SCRATCH, "quarantine.sqlite")
+
+RENDER_SCRIPT = """
+import json, sys, time
+import requests
+
+def _offline(*args, **kwargs):
+    raise requests.ConnectionError("offline benchmark")
+
+requests.get = _offline
+from streamlit.testing.v1 import AppTest
+
+t0 = time.perf_counter()
+at = AppTest.from_file(sys.argv[1], default_timeout=300)
+at.run()
+cold = time.perf_counter() - t0
+
+at2 = AppTest.from_file(sys.argv[1], default_timeout=300)
+t0 = time.perf_counter()
+at2.run()
+warm = time.perf_counter() - t0
+
+at2.session_state["main_tab"] = "📈 지표 현황"
+t0 = time.perf_counter()
+at2.run()
+cards = time.perf_counter() - t0
+print(json.dumps({"cold_s": cold, "new_session_ms": warm * 1000, "cards_ms": cards * 1000}))
+"""
+
+
+def _isolated_app(app_path):
+    """app.py 파일만 임시 폴더로 복사 (ifam / data는 저장소 것을 사용)"""
+    tmp = tempfile.mkdtemp(prefix="bench_startup_")
+    shutil.copy(app_path, os.path.join(tmp, "app.py"))
+    return tmp
+
+
+def import_times(app_path, repeat):
+    """import app 누적 시간(ms) 중앙값과 최상위 import 모듈별 누적 시간"""
+    tmp = _isolated_app(app_path)
+    env = {**os.environ, "PYTHONPATH": ROOT}
+    totals, modules = [], {}
+    for _ in range(repeat):
+        res = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import app"],
+            cwd=tmp,
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+        for line in res.stderr.splitlines():
+            if not line.startswith("import time:") or "|" not in line:
+                continue
+            _, cumulative, name = line.split("|")
+            if not cumulative.strip().isdigit():
+                continue
+            # app 바로 아래(들여쓰기 2칸) 모듈만 집계
+            if name.strip() == "app":
+                totals.append(int(cumulative) / 1000)
+            elif name.startswith("   ") and not name.startswith("    "):
+                modules.setdefault(name.strip(), []).append(int(cumulative) / 1000)
+    top = sorted(
+        ((statistics.median(v), k) for k, v in modules.items()), reverse=True
+    )[:8]
+    return statistics.median(totals), top
+
+
+def first_render(app_path):
+    res = subprocess.run(
+        [sys.executable, "-c", RENDER_SCRIPT, os.path.abspath(app_path)],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    return json.loads(res.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--app", default=os.path.join(ROOT, "app.py"))
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--skip-render", action="store_true", help="AppTest 렌더링(엑셀 로드 수 초) 생략")
+    args = parser.parse_args()
+
+    total, top = import_times(args.app, args.repeat)
+    print(f"app: {args.app}")
+    print(f"  import app        {total:8.1f} ms (중앙값, n={args.repeat})")
+    for ms, name in top:
+        print(f"    {name:<28}{ms:8.1f} ms")
+
+    if not args.skip_render:
+        res = first_render(args.app)
+        print(f"  최초 실행(콜드)   {res['cold_s']:8.2f} s")
+        print(f"  새 세션 첫 화면   {res['new_session_ms']:8.1f} ms")
+        print(f"  지표 현황 탭      {res['cards_ms']:8.1f} ms")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
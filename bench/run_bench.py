@@ -0,0 +1,390 @@
+"""
+데이터/분석 핫패스 벤치마크 (Streamlit 없이 headless 실행)
+
+측정 대상
+  - load_data: 번들 엑셀(data/데일리_클리핑_자료.xlsm) 파싱 + 크롤링(HTML fixture) + 영업일 정렬
+  - fetch_realtime_data_with_history: fixture 재생 (요청당 평균 200ms 지연, 20% 실패 주입)
+  - align_to_business_days, get_summary, check_alerts, scan_alerts, calculate_correlation_matrix,
+    calculate_lagged_correlation(max_lag=365), build_regression_model,
+    generate_investment_signals, generate_market_summary, calculate_renewable_revenue, downsample,
+    grid_page, resample_store, RevisionLog.asof (수정 이력 시점 조회), detect_regimes,
+    fit_var (VAR + Granger), build_risk_state / update_risk_state (+1행), risk_table, run_scenario
+  - 분석 함수들은 실제 히스토리(1x)와 이를 늘린 합성 히스토리(10x/100x)에서 각각 측정
+
+크롤러는 ifam.fetch replay 모드로 bench/fixtures/ 녹화본(index.json)에 응답하므로 네트워크 없이 돌아간다.
+크롤링 단독 측정은 지연/실패를 주입해 동시 요청 + 재시도 경로까지 잰다.
+load 단계 끝에 크롤러별 계측 기록(스레드 풀 안)이 빠짐없이 남는지 확인한다 (check_crawl_perf).
+analytics 전에 scan_alerts가 float64 load_data() 프레임 기준으로 check_alerts / FrameStore 경로와
+같은 발생 목록을 내는지 확인한다 (check_alert_scan).
+Streamlit 없이 ifam 코어 패키지만 import 한다.
+결과는 bench/results/bench_<git rev>_<시각>.json 으로 저장되고,
+--compare 로 이전 결과와 비교할 수 있다.
+
+사용법 (저장소 루트에서):
+    python bench/run_bench.py
+    python bench/run_bench.py --scales 1 10 --skip-load
+    python bench/run_bench.py --compare bench/results/bench_abc1234_20261019-0900.json
+
+같은 폴더의 다른 벤치마크
+    bench/bench_date_index.py   기간 필터 (boolean mask vs 날짜 인덱스)
+    bench/bench_rerun.py        위젯 조작당 Streamlit 재실행 지연
+    bench/bench_startup.py      대시보드 import 시간 / 첫 화면 렌더링
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURE_DIR = os.path.join(ROOT, "bench", "fixtures")
+RESULT_DIR = os.path.join(ROOT, "bench", "results")
+CRAWL_LATENCY_MS = 200
+
+# 벤치 실행의 수정 이력 / 격리 기록은 임시 폴더로 (data/*.sqlite 실제 기록에 섞지 않음, 하위 프로세스도 상속)
+_SCRATCH = tempfile.mkdtemp(prefix="ifam_bench_")
+os.environ["IFAM_REVISIONS_PATH"] = os.path.join(_SCRATCH, "revisions.sqlite")
+os.environ["IFAM_QUARANTINE_PATH"] = os.path.join(_SCRATCH, "quarantine.sqlite")
+
+sys.path.insert(0, ROOT)
+
+from ifam import (  # noqa: E402
+    CRAWL_SOURCES,
+    FrameStore,
+    KEY_INDICATORS,
+    RevisionLog,
+    align_to_business_days,
+    build_regression_model,
+    breaches_on,
+    build_risk_state,
+    calculate_correlation_matrix,
+    calculate_lagged_correlation,
+    calculate_renewable_revenue,
+    check_alerts,
+    clear_all,
+    detect_regimes,
+    downsample,
+    fetch_mode,
+    fetch_realtime_data_with_history,
+    fit_var,
+    generate_investment_signals,
+    generate_market_summary,
+    get_summary,
+    grid_page,
+    load_data,
+    perf_begin,
+    refresh_sources,
+    resample_store,
+    risk_table,
+    run_scenario,
+    scan_alerts,
+    update_risk_state,
+)
+
+def synthetic_history(df, scale, seed=0):
+    """
+    실제 히스토리를 scale배 길이로 늘린 합성 히스토리.
+    값은 실제 구간을 반복하면서 ±0.5% 노이즈를 섞고(결측 패턴 유지), 날짜는 역일 기준으로 과거로 늘린다.
+    (영업일로 늘리면 100x에서 datetime64[ns] 범위를 벗어남)
+    """
+    if scale == 1:
+        return df
+    rng = np.random.default_rng(seed)
+    values = df.drop(columns="날짜").to_numpy(dtype=float)
+    tiled = np.tile(values, (scale, 1))
+    tiled = tiled * (1 + rng.normal(0, 0.005, size=tiled.shape))
+    dates = pd.date_range(end=df["날짜"].iloc[-1], periods=len(tiled), freq="D")
+    out = pd.DataFrame(tiled, columns=df.columns[1:])
+    out.insert(0, "날짜", dates)
+    return out
+
+
+def synthetic_revisions(df, revised=0.05, seed=0):
+    """
+    히스토리의 값 있는 칸마다 관측일 18시에 수집된 이력 1건 + 그중 revised 비율은 다음날 수정 1건.
+    반환: (RevisionLog, 중간 시점)
+    """
+    rng = np.random.default_rng(seed)
+    values = df.drop(columns="날짜").to_numpy(dtype=float)
+    rows, cols = np.nonzero(~np.isnan(values))
+    dates = df["날짜"].to_numpy().astype("datetime64[D]")[rows]
+    ingested = dates.astype("datetime64[s]") + np.timedelta64(18, "h")
+    again = rng.random(len(rows)) < revised
+
+    log = RevisionLog(
+        np.concatenate([dates, dates[again]]),
+        np.concatenate([cols, cols[again]]),
+        np.concatenate([values[rows, cols], values[rows, cols][again] * 1.001]),
+        np.zeros(len(rows) + int(again.sum()), dtype=np.int8),
+        np.concatenate([ingested, ingested[again] + np.timedelta64(1, "D")]),
+    )
+    return log, ingested[len(ingested) // 2]
+
+
+def measure(fn, repeat, min_time=0.2):
+    """fn 1회 호출 시간(ms) 목록. 짧은 함수는 min_time을 채울 때까지 반복해서 평균"""
+    fn()  # warm-up (import, 캐시 채우기)
+    timings = []
+    for _ in range(repeat):
+        n, t0 = 0, time.perf_counter()
+        while True:
+            fn()
+            n += 1
+            elapsed = time.perf_counter() - t0
+            if elapsed >= min_time or n >= 1000:
+                break
+        timings.append(elapsed / n * 1000)
+    return timings
+
+
+def bench_load(repeat):
+    def cold_load():
+        clear_all()
+        return load_data()
+
+    def cold_crawl():
+        refresh_sources()
+        return fetch_realtime_data_with_history()
+
+    with fetch_mode("replay", FIXTURE_DIR, backoff=0):
+        df = cold_load()
+        load_ms = [_timed(cold_load) for _ in range(repeat)]
+
+    # 사이트 응답 지연 + 간헐적 연결 실패 (재시도 대기는 실제 값 그대로)
+    with fetch_mode("replay", FIXTURE_DIR, latency_ms=CRAWL_LATENCY_MS, failure_rate=0.2, seed=0):
+        crawl_ms = [_timed(cold_crawl) for _ in range(repeat)]
+
+    with fetch_mode("replay", FIXTURE_DIR, backoff=0):
+        check_crawl_perf()
+
+    return df, [
+        {"name": "load_data (엑셀+fixture, cold)", "scale": 1, "rows": len(df), "ms": load_ms},
+        {
+            "name": f"fetch_realtime (재생 {CRAWL_LATENCY_MS}ms, 실패 20%)",
+            "scale": 1,
+            "rows": len(df),
+            "ms": crawl_ms,
+        },
+    ]
+
+
+def check_crawl_perf():
+    """크롤러별 계측이 스레드 풀 안에서도 같은 run에 기록되는지 (소스마다 miss 기록 1개 이상)"""
+    refresh_sources()
+    run = perf_begin(True)
+    try:
+        fetch_realtime_data_with_history()
+    finally:
+        perf_begin(False)
+    depth = {r["stage"]: r["depth"] for r in run["records"]}
+    missed = {r["stage"] for r in run["records"] if r["cache"] == "miss"}
+    expected = {fn.__name__ for _, fn in CRAWL_SOURCES.values()}
+    if expected - missed or any(depth[s] != 1 for s in expected & depth.keys()):
+        raise RuntimeError(f"크롤러 계측 누락/깊이 오류: {sorted(expected - missed)} / {depth}")
+
+
+def check_alert_scan(df, step=7):
+    """
+    scan_alerts 동등성 확인 (기준은 float64 load_data() 프레임)
+      - 표본 기준일(step행마다 + 마지막 행)의 check_alerts(get_summary(...))와 발생 목록이 같은지
+      - FrameStore.to_frame() 경로(대시보드/API)의 스캔 결과가 load_data() 결과와 같은지
+    """
+    breaches = scan_alerts(df)["breaches"]
+    rows = list(range(1, len(df), step)) + [len(df) - 1]
+    bad = []
+    for r in rows:
+        expected = [
+            (a["indicator"], a["direction"]) for a in check_alerts(get_summary(df.iloc[: r + 1]))
+        ]
+        on_day = breaches_on(breaches, df["날짜"].iloc[r])
+        if expected != list(zip(on_day["indicator"], on_day["direction"])):
+            bad.append(str(df["날짜"].iloc[r].date()))
+    if bad:
+        raise RuntimeError(f"scan_alerts ≠ check_alerts ({len(bad)}/{len(rows)}일): {bad[:5]}")
+
+    from_store = scan_alerts(FrameStore.from_frame(df).to_frame())["breaches"]
+    try:
+        pd.testing.assert_frame_equal(
+            breaches.reset_index(drop=True), from_store.reset_index(drop=True), check_dtype=False
+        )
+    except AssertionError as e:
+        raise RuntimeError(
+            f"scan_alerts 결과가 FrameStore 경로에서 달라짐 ({len(breaches)} vs {len(from_store)}): {e}"
+        )
+
+
+def _timed(fn):
+    t0 = time.perf_counter()
+    fn()
+    return (time.perf_counter() - t0) * 1000
+
+
+def bench_analytics(df, scales, repeat):
+    results = []
+    revenue_grid = [(smp, rec) for smp in range(60, 260, 5) for rec in range(30000, 110000, 2500)]
+
+    for scale in scales:
+        data = synthetic_history(df, scale)
+        rows = len(data)
+        summary = get_summary(data)
+        store = FrameStore.from_frame(data)
+        revisions, midpoint = synthetic_revisions(data)
+        risk_state = build_risk_state(store)
+        risk_prev = build_risk_state(store.rows(slice(0, -1)))
+        project = {"capacity_mw": 10.0, "debt": 1e10, "spread": 2.0, "opex_per_mw": 3e7}
+        cases = {
+            "align_to_business_days": lambda: align_to_business_days(data),
+            "get_summary": lambda: get_summary(data),
+            "check_alerts": lambda: check_alerts(summary),
+            "scan_alerts (전체 히스토리)": lambda: scan_alerts(data),
+            "scan_alerts (adaptive, EWMA 포함)": lambda: scan_alerts(data, mode="adaptive"),
+            "calculate_correlation_matrix (1년)": lambda: calculate_correlation_matrix(
+                data, KEY_INDICATORS, 365
+            ),
+            "calculate_correlation_matrix (전체)": lambda: calculate_correlation_matrix(
+                data, KEY_INDICATORS, None
+            ),
+            "calculate_lagged_correlation (max_lag=365)": lambda: calculate_lagged_correlation(
+                data, "두바이유", "육지 SMP", 365
+            ),
+            "build_regression_model (전체)": lambda: build_regression_model(
+                data, "육지 SMP", ["두바이유", "달러환율", "국고채 (3년)"], None
+            ),
+            "downsample lttb (육지 SMP 전체 → 2000점)": lambda: downsample(
+                data["날짜"].to_numpy(), data["육지 SMP"].to_numpy(), 2000
+            ),
+            "grid_page (달러환율 정렬, 50행)": lambda: grid_page(store, 3, 50, "달러환율"),
+            "resample_store (월간 평균)": lambda: resample_store(store, "ME"),
+            "RevisionLog.asof (히스토리 중간 시점)": lambda: revisions.asof(midpoint),
+            "fit_var (KEY_INDICATORS, max_lag=10)": lambda: fit_var(store, KEY_INDICATORS, 10),
+            "build_risk_state (전체 히스토리)": lambda: build_risk_state(store),
+            "update_risk_state (+1행)": lambda: update_risk_state(risk_prev, store),
+            "risk_table (250영업일)": lambda: risk_table(risk_state),
+            "run_scenario (금리 +100bp · 달러 +10%)": lambda: run_scenario(
+                store, {"국고채 (3년)": 100.0, "달러환율": 10.0}, project
+            ),
+            "generate_investment_signals": lambda: generate_investment_signals(data, 30),
+            "generate_market_summary": lambda: generate_market_summary(data, 7),
+            f"calculate_renewable_revenue x{len(revenue_grid)}": lambda: [
+                calculate_renewable_revenue(smp, rec, 10.0, 0.15, 1.0)
+                for smp, rec in revenue_grid
+            ],
+        }
+        if scale < 100:  # 100x는 순차 실행 시 지표당 수 초
+            cases["detect_regimes (KEY_INDICATORS)"] = lambda: detect_regimes(store)
+        for name, fn in cases.items():
+            n_repeat = repeat if scale < 100 or "lagged" not in name else max(1, repeat // 2)
+            results.append(
+                {"name": name, "scale": scale, "rows": rows, "ms": measure(fn, n_repeat)}
+            )
+            print(f"  [{scale:>3}x] {name:<45} {statistics.median(results[-1]['ms']):10.2f} ms")
+    return results
+
+
+def git_rev():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except Exception:
+        return "unknown"
+
+
+def summarize(results):
+    for r in results:
+        r["median_ms"] = statistics.median(r["ms"])
+        r["best_ms"] = min(r["ms"])
+        r["n"] = len(r["ms"])
+    return results
+
+
+def compare(current, baseline_path):
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)
+    base = {(r["name"], r["scale"]): r for r in baseline["results"]}
+
+    print(f"\n비교 기준: {baseline_path} ({baseline['meta']['git_rev']})")
+    print(f"{'항목':<50}{'배율':>6}{'이전(ms)':>12}{'현재(ms)':>12}{'비율':>8}")
+    for r in current:
+        old = base.get((r["name"], r["scale"]))
+        if old is None:
+            continue
+        ratio = r["median_ms"] / old["median_ms"] if old["median_ms"] else float("nan")
+        flag = "  ⚠️" if ratio > 1.2 else ""
+        print(
+            f"{r['name']:<50}{r['scale']:>5}x{old['median_ms']:>12.2f}{r['median_ms']:>12.2f}"
+            f"{ratio:>8.2f}{flag}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="데이터/분석 핫패스 벤치마크")
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--load-repeat", type=int, default=3)
+    parser.add_argument("--skip-load", action="store_true", help="엑셀 파싱(수 초) 생략")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON")
+    parser.add_argument("--output", help="결과 JSON 경로 (기본: bench/results/...)")
+    args = parser.parse_args()
+
+    os.chdir(ROOT)
+    results = []
+
+    if args.skip_load:
+        with fetch_mode("replay", FIXTURE_DIR, backoff=0):
+            df = load_data()
+    else:
+        print("load_data ...")
+        df, load_results = bench_load(args.load_repeat)
+        results.extend(load_results)
+        for r in load_results:
+            print(f"  {r['name']:<51} {statistics.median(r['ms']):10.2f} ms")
+
+    if df is None or len(df) == 0:
+        print("히스토리를 불러오지 못했습니다.", file=sys.stderr)
+        return 1
+
+    check_alert_scan(df)
+
+    print("analytics ...")
+    results.extend(bench_analytics(df, args.scales, args.repeat))
+    results = summarize(results)
+
+    meta = {
+        "git_rev": git_rev(),
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "scales": args.scales,
+    }
+    output = args.output or os.path.join(
+        RESULT_DIR, f"bench_{meta['git_rev']}_{datetime.now():%Y%m%d-%H%M%S}.json"
+    )
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump({"meta": meta, "results": results}, f, ensure_ascii=False, indent=2)
+    print(f"\n결과 저장: {output}")
+
+    if args.compare:
+        compare(results, args.compare)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
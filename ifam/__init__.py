@@ -0,0 +1,147 @@
+# =============================================================================
+# ifam - 지표 모니터링 코어 (Streamlit 없이 배치/API/대시보드가 공용으로 사용)
+#  - import ifam 자체는 하위 모듈을 로딩하지 않음 → 배치 프로세스 기동 수 ms
+#  - ifam.load_store 처럼 이름에 처음 접근할 때 해당 모듈만 import
+#  - requests/bs4, scipy, sklearn은 실제로 쓰는 함수 안에서만 import
+#
+#  config      지표 정의 / 임계값 / 휴장일 (순수 파이썬)
+#  perf        계측 (perf_begin / perf_stage / timed)
+#  cache       프로세스 공유 TTL 캐시 (memoize)
+#  bizdays     영업일 캘린더
+#  store       날짜 인덱스 슬라이스 + FrameStore
+#  fetch       크롤러 HTTP (재시도 / 응답 녹화·재생, python -m ifam.fetch)
+#  crawlers    웹 크롤링 (소스별 동시 요청)
+#  validate    크롤링 값 검증 (범위 / MAD z-score / 스프레드) + 격리
+#  revisions   값 수정 이력 (관측일 × 수집 시각) + 시점 조회 (python -m ifam.revisions)
+#  loader      엑셀 + 크롤링 병합, 영업일 정렬 (load_data / load_store / load_store_asof)
+#  frequency   혼합 주기(월간 LNG 등) 처리
+#  summary     요약 / 급변동 알림
+#  alerts      전체 히스토리 급변동 스캔 (발생 이력 / 빈도)
+#  analytics   상관관계 / 회귀분석
+#  causality   VAR / Granger 인과 (여러 지표 선행-후행)
+#  regimes     구조 변화(국면 전환) 탐지 (PELT, 지표별 프로세스 풀)
+#  signals     투자 시그널 / 시장 요약
+#  simulation  신재생 수익성 / PF 현금흐름 계산
+#  risk        변동성 / VaR / 최대낙폭 (누적 상태 증분 갱신) + 시나리오 충격
+#  formatting  값/변동 표시 HTML 조각
+#  downsample  차트 시계열 다운샘플링 (LTTB / min-max)
+#  grid        데이터 표 페이지 조회 (서버 정렬) / 주간·월간 집계
+#  export      CSV / Parquet / Excel 내보내기 (요청 시 생성, 행 묶음 단위)
+#  service     데이터 버전 단위 분석 결과 캐시
+#  report      데일리 리포트 HTML / Excel 배치 (python -m ifam.report)
+#  api         읽기 전용 HTTP API, JSON / Arrow (python -m ifam.api)
+#  dispatch    알림 발송 outbox + 파일/웹훅/메일 sink (python -m ifam.dispatch)
+# =============================================================================
+
+import importlib
+
+_EXPORTS = {
+    # config
+    "DATA_PATH": "config",
+    "DATA_COLUMNS": "config",
+    "INDICATORS": "config",
+    "COLUMN_FREQ": "config",
+    "CHART_PERIODS": "config",
+    "ALERT_THRESHOLDS": "config",
+    "ALERT_MODE": "config",
+    "ALERT_RULES": "config",
+    "KEY_INDICATORS": "config",
+    # perf / cache
+    "perf_begin": "perf",
+    "perf_context": "perf",
+    "perf_stage": "perf",
+    "timed": "perf",
+    "memoize": "cache",
+    "clear_all": "cache",
+    # 영업일 / 날짜 인덱스
+    "latest_business_day": "bizdays",
+    "previous_business_day": "bizdays",
+    "business_days": "bizdays",
+    "date_slice": "store",
+    "recent_slice": "store",
+    "FrameStore": "store",
+    # 로딩
+    "fetch_realtime_data_with_history": "crawlers",
+    "CRAWL_SOURCES": "crawlers",
+    "http_get": "fetch",
+    "fetch_mode": "fetch",
+    "read_history": "loader",
+    "align_to_business_days": "loader",
+    "load_data": "loader",
+    "load_store": "loader",
+    "refresh_sources": "loader",
+    "load_store_asof": "loader",
+    "read_revisions": "revisions",
+    "RevisionLog": "revisions",
+    "validate_overlay": "validate",
+    "recent_quarantine": "validate",
+    # 분석
+    "build_frequency_index": "frequency",
+    "get_summary": "summary",
+    "check_alerts": "summary",
+    "scan_alerts": "alerts",
+    "breaches_on": "alerts",
+    "build_vol_state": "alerts",
+    "update_vol_state": "alerts",
+    "vol_state_for": "alerts",
+    "latest_sigma": "alerts",
+    "AlertDispatcher": "dispatch",
+    "get_dispatcher": "dispatch",
+    "calculate_correlation_matrix": "analytics",
+    "calculate_lagged_correlation": "analytics",
+    "find_optimal_lag": "analytics",
+    "build_regression_model": "analytics",
+    "predict_future": "analytics",
+    "fit_var": "causality",
+    "granger_table": "causality",
+    "detect_regimes": "regimes",
+    "latest_break": "regimes",
+    "generate_investment_signals": "signals",
+    "generate_market_summary": "signals",
+    "generate_analysis_points": "signals",
+    "calculate_renewable_revenue": "simulation",
+    "calculate_project_cashflow": "simulation",
+    "build_risk_state": "risk",
+    "update_risk_state": "risk",
+    "risk_state_for": "risk",
+    "risk_table": "risk",
+    "rolling_vol": "risk",
+    "run_scenario": "risk",
+    "format_value": "formatting",
+    "downsample": "downsample",
+    "grid_page": "grid",
+    "resample_store": "grid",
+    "open_export": "export",
+    "iter_csv": "export",
+    "available_formats": "export",
+    # 버전 단위 캐시
+    "cached_overview": "service",
+    "cached_alert_scan": "service",
+    "cached_chart_series": "service",
+    "cached_resample": "service",
+    "cached_market_summary": "service",
+    "cached_signals": "service",
+    "cached_correlation_matrix": "service",
+    "cached_lagged_correlation": "service",
+    "cached_regression": "service",
+    "cached_regimes": "service",
+    "cached_var": "service",
+    "cached_risk_table": "service",
+    "cached_rolling_vol": "service",
+    "cached_scenario": "service",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module 'ifam' has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -0,0 +1,384 @@
+# =============================================================================
+# ifam/alerts.py - 전체 히스토리 급변동 스캔 (check_alerts의 벡터화 버전)
+#  - check_alerts()는 마지막 두 행만 요약 dict로 비교 → 과거 빈도/이력을 알 수 없음
+#  - 같은 규칙(ALERT_THRESHOLDS, 금리/스왑은 bp 기준, 월간 지표는 기간 비교)을
+#    지표별 배열 diff로 모든 행에 한 번에 적용
+#  - 마지막 행 결과는 check_alerts(get_summary(df))와 같다
+#  - 변동성 기준(adaptive) 알림용 지표별 EWMA 변동성 상태: 한 번 만들고 새 행만 갱신
+# =============================================================================
+
+import threading
+
+import numpy as np
+import pandas as pd
+
+from .config import (
+    ALERT_EWMA_LAMBDA,
+    ALERT_MIN_OBS,
+    ALERT_RULES,
+    ALERT_THRESHOLDS,
+    ASOF_FILL_LIMIT,
+    COLUMN_FREQ,
+    INDICATORS,
+)
+from .frequency import asof_fill, build_frequency_index
+from .perf import timed
+
+BREACH_COLUMNS = [
+    "날짜",
+    "category",
+    "indicator",
+    "current",
+    "previous",
+    "change",
+    "change_pct",
+    "direction",
+    "threshold",
+    "is_periodic",
+    "obs_date",
+    "rule",
+    "z",
+]
+
+RATE_CATEGORIES = ["금리", "스왑"]
+
+# 일간 지표만 변동성 상태 대상 (월간 지표는 관측이 드물어 고정 기준)
+DAILY_COLUMNS = [
+    (category, col_name)
+    for category, info in INDICATORS.items()
+    for col_name in info["columns"]
+    if COLUMN_FREQ.get(col_name, "D") == "D"
+]
+
+
+def _daily_changes(values, dates, is_rate):
+    """일간 지표: 전일 대비 (get_summary와 같은 as-of 값 / dtype / 연산 순서)"""
+    dtype = values.dtype
+    values, src = asof_fill(values, dates)
+    values = values.astype(dtype)
+    current = values[1:]
+    previous = values[:-1]
+    valid = ~np.isnan(current) & ~np.isnan(previous) & (previous != 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        change = current - previous
+        change_pct = change * 100 if is_rate else (change / previous) * 100
+    pad = np.array([np.nan], dtype=values.dtype)
+    return {
+        "current": np.concatenate([pad, current]),
+        "previous": np.concatenate([pad, previous]),
+        "change": np.concatenate([pad, change]),
+        "change_pct": np.concatenate([pad, change_pct]),
+        "valid": np.concatenate([[False], valid]),
+        "obs_row": src,
+    }
+
+
+def _periodic_changes(entry, n_rows):
+    """
+    월간 등 비일간 지표: 각 행 기준 최신 관측값 vs 직전 기간 마지막 관측값
+    (= 그 행까지 자른 frequency index로 get_period_data()를 부른 결과)
+    """
+    obs_rows = entry["obs_rows"]
+    obs_values = entry["obs_values"]
+    # 관측마다 속한 기간 번호 (기간 마지막 관측 직후에 번호 증가)
+    is_last = np.isin(obs_rows, entry["rows"])
+    group = np.concatenate([[0], np.cumsum(is_last)[:-1]]).astype(int)
+
+    # 행 r 기준 최신 관측 j (없으면 -1)
+    j = np.searchsorted(obs_rows, np.arange(n_rows), side="right") - 1
+    has_obs = j >= 0
+    g = np.where(has_obs, group[np.maximum(j, 0)], 0)
+    valid = has_obs & (g >= 1)
+
+    current = np.where(has_obs, obs_values[np.maximum(j, 0)], np.nan)
+    previous = np.where(valid, entry["values"][np.maximum(g - 1, 0)], np.nan)
+    change = current - previous
+    return {
+        "current": current,
+        "previous": previous,
+        "change": change,
+        "change_pct": change,  # get_summary와 같이 기간 지표는 변동폭 그대로
+        "valid": valid,
+        "obs_row": np.where(has_obs, obs_rows[np.maximum(j, 0)], -1),
+    }
+
+
+# =============================================================================
+# EWMA 변동성 상태 (변동성 기준 알림)
+# =============================================================================
+
+
+def _moves(values, dates, is_rate):
+    """
+    (행, 지표) 블록의 전일 대비 변동 (check_alerts와 같은 척도: %, 금리/스왑은 bp).
+    직전 값은 _daily_changes와 같은 as-of 값 → 결측 뒤 첫 관측도 z 분자와 같은 변동으로 반영.
+    당일 관측이 없는 행(as-of로 채운 값, 변동 0)은 분산에 넣지 않는다.
+    """
+    filled, src = asof_fill(values, dates)
+    current = filled[1:]
+    previous = filled[:-1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        change = current - previous
+        moves = np.where(is_rate, change * 100, change / previous * 100)
+    observed = src[1:] == np.arange(1, len(filled))[:, None]
+    valid = observed & ~np.isnan(previous) & (previous != 0)
+    return np.where(valid, moves, np.nan)
+
+
+def _advance(state, moves, start):
+    """
+    start 행부터 EWMA 분산을 이어서 계산 (행 단위 루프, 지표 방향은 벡터화).
+    처음 ALERT_MIN_OBS개 관측까지는 단순 평균으로 시작값을 잡고 그 뒤로 EWMA.
+    """
+    lam = state["lam"]
+    min_obs = state["min_obs"]
+    var = state["var"]
+    count = state["count"]
+    k = var.shape[1]
+    prev_var = var[start - 1] if start > 0 else np.zeros(k)
+    prev_cnt = count[start - 1] if start > 0 else np.zeros(k, dtype=np.int64)
+
+    for t in range(start, len(var)):
+        m = moves[t - start]
+        ok = ~np.isnan(m)
+        cnt = prev_cnt + ok
+        weight = np.where(cnt <= min_obs, 1.0 / np.maximum(cnt, 1), 1 - lam)
+        prev_var = np.where(ok, prev_var + weight * (np.nan_to_num(m) ** 2 - prev_var), prev_var)
+        prev_cnt = cnt
+        var[t] = prev_var
+        count[t] = cnt
+
+
+def build_vol_state(df, lam=ALERT_EWMA_LAMBDA, min_obs=ALERT_MIN_OBS):
+    """
+    일간 지표별 EWMA 변동성 상태 (RiskMetrics 방식, 평균 0 가정).
+
+    {
+      'columns': 일간 지표 목록, 'dates': 날짜, 'values': 입력 블록(갱신 시 비교용),
+      'var': 각 행까지 반영한 분산 (행, 지표), 'count': 반영된 관측 수, 'lam', 'min_obs'
+    }
+    """
+    columns = [c for _, c in DAILY_COLUMNS if c in df.columns]
+    state = {
+        "columns": columns,
+        "is_rate": np.array([cat in RATE_CATEGORIES for cat, c in DAILY_COLUMNS if c in df.columns]),
+        "dates": np.empty(0, dtype="datetime64[ns]"),
+        "values": np.empty((0, len(columns))),
+        "var": np.empty((0, len(columns))),
+        "count": np.empty((0, len(columns)), dtype=np.int64),
+        "lam": lam,
+        "min_obs": min_obs,
+    }
+    return update_vol_state(state, df)
+
+
+def update_vol_state(state, df):
+    """
+    state를 df에 맞게 갱신. 기존 행과 처음 달라지는 행(크롤링으로 덮어쓴 당일/전일 등)
+    부터만 다시 계산하므로 새로고침마다 새 행 수 × 지표 수만큼만 계산한다.
+    """
+    columns = state["columns"]
+    dates = df["날짜"].to_numpy(dtype="datetime64[ns]")
+    values = df[columns].to_numpy(dtype=np.float64)
+
+    # 기존 상태와 처음 달라지는 행
+    common = min(len(dates), len(state["dates"]))
+    same = (dates[:common] == state["dates"][:common]) & np.all(
+        (values[:common] == state["values"][:common])
+        | (np.isnan(values[:common]) & np.isnan(state["values"][:common])),
+        axis=1,
+    )
+    start = common if same.all() else int(np.argmin(same))
+
+    n = len(dates)
+    var = np.empty((n, len(columns)))
+    count = np.empty((n, len(columns)), dtype=np.int64)
+    var[:start] = state["var"][:start]
+    count[:start] = state["count"][:start]
+    state = {**state, "dates": dates, "values": values, "var": var, "count": count}
+
+    if start < n:
+        # as-of 직전 값이 닿는 행까지 앞에서부터 (격자가 영업일 행이라 ASOF_FILL_LIMIT행이면 충분)
+        lo = max(start - 1 - ASOF_FILL_LIMIT, 0)
+        moves = _moves(values[lo:], dates[lo:], state["is_rate"])
+        moves = np.vstack([np.full((1, len(columns)), np.nan), moves])[start - lo :]
+        _advance(state, moves, start)
+    return state
+
+
+def sigma_at(state, row):
+    """row 행의 변동을 판단할 기준 표준편차 = row 직전까지의 EWMA (관측 부족이면 None)"""
+    if row < 1:
+        return {}
+    var = state["var"][row - 1]
+    enough = state["count"][row - 1] >= state["min_obs"]
+    return {
+        col: float(np.sqrt(v))
+        for col, v, ok in zip(state["columns"], var, enough)
+        if ok and v > 0
+    }
+
+
+def latest_sigma(state):
+    """마지막 행(기준일) 판단용 표준편차 → check_alerts(summary, sigma=...)"""
+    return sigma_at(state, len(state["dates"]) - 1)
+
+
+_vol_state = {"state": None}
+_vol_state_lock = threading.Lock()
+
+
+def vol_state_for(df):
+    """
+    프로세스 공유 변동성 상태를 df 기준으로 갱신해서 반환.
+    처음 한 번만 전체 히스토리를 계산하고, 이후 새로고침은 바뀐 행부터만 이어서 계산.
+    """
+    with _vol_state_lock:
+        state = _vol_state["state"]
+        if state is None or state["columns"] != [c for _, c in DAILY_COLUMNS if c in df.columns]:
+            state = build_vol_state(df)
+        else:
+            state = update_vol_state(state, df)
+        _vol_state["state"] = state
+        return state
+
+
+# =============================================================================
+# 히스토리 스캔
+# =============================================================================
+
+
+@timed("scan_alerts")
+def scan_alerts(df, freq_index=None, mode="fixed", rules=None):
+    """
+    전체 히스토리에 급변동 규칙을 적용.
+    mode="adaptive"면 각 행 직전까지의 EWMA 변동성 기준 (check_alerts(summary, sigma=...)와 같은 규칙)
+
+    반환:
+    {
+      'breaches': 임계값을 넘은 (날짜, 지표)별 행 DataFrame (BREACH_COLUMNS, 날짜 → 지표 순),
+      'stats': 지표별 발생 빈도 DataFrame (판정 가능 일수, 발생 일수/비율, 상승/하락,
+               서로 다른 관측 기준 발생 건수, 최근 발생일, 최대 변동),
+    }
+    """
+    empty = {
+        "breaches": pd.DataFrame(columns=BREACH_COLUMNS),
+        "stats": pd.DataFrame(),
+    }
+    if df is None or len(df) < 2:
+        return empty
+
+    if freq_index is None:
+        freq_index = build_frequency_index(df)
+    rules = ALERT_RULES if rules is None else rules
+    dates = df["날짜"].to_numpy()
+    n_rows = len(df)
+
+    sigma = {}
+    if mode == "adaptive":
+        state = build_vol_state(df)
+        enough = state["count"] >= state["min_obs"]
+        std = np.where(enough & (state["var"] > 0), np.sqrt(state["var"]), np.nan)
+        # 행 t의 기준은 t-1까지의 변동성
+        std = np.vstack([np.full((1, std.shape[1]), np.nan), std[:-1]])
+        sigma = {col: std[:, i] for i, col in enumerate(state["columns"])}
+
+    frames = []
+    stats = []
+    order = 0
+    for category, info in INDICATORS.items():
+        is_rate = category in RATE_CATEGORIES
+        scale = 100 if is_rate else 1
+
+        for col_name, col_info in info["columns"].items():
+            order += 1
+            rule = rules.get(col_name) or {"threshold": ALERT_THRESHOLDS.get(category, 5.0)}
+            threshold = rule["threshold"]
+            periodic = COLUMN_FREQ.get(col_name, "D") != "D"
+            if periodic:
+                entry = freq_index.get(col_name)
+                if entry is None or len(entry["rows"]) == 0:
+                    continue
+                ch = _periodic_changes(entry, n_rows)
+            else:
+                if col_name not in df.columns:
+                    continue
+                ch = _daily_changes(df[col_name].to_numpy(), dates, is_rate)
+
+            # check_alerts와 같은 비교식
+            with np.errstate(invalid="ignore", divide="ignore"):
+                check_val = np.abs(ch["change"]) * 100 if is_rate else np.abs(ch["change_pct"])
+                fixed_hit = check_val >= threshold * scale
+
+                vol = sigma.get(col_name) if rule.get("adaptive", True) else None
+                if vol is not None:
+                    z = ch["change_pct"] / vol
+                    adaptive = ~np.isnan(vol)
+                    hit = np.where(
+                        adaptive,
+                        (np.abs(z) >= rule["z"]) & (check_val >= rule["floor"] * scale),
+                        fixed_hit,
+                    )
+                else:
+                    z = np.full(n_rows, np.nan)
+                    adaptive = np.zeros(n_rows, dtype=bool)
+                    hit = fixed_hit
+                hit = ch["valid"] & hit
+
+            rows = np.flatnonzero(hit)
+            change = ch["change"][rows]
+            direction = np.where(change > 0, "up", np.where(change < 0, "down", "neutral"))
+            obs_row = ch["obs_row"][rows]
+            frames.append(
+                pd.DataFrame(
+                    {
+                        "날짜": dates[rows],
+                        "category": category,
+                        "indicator": col_name,
+                        "current": ch["current"][rows],
+                        "previous": ch["previous"][rows],
+                        "change": change,
+                        "change_pct": ch["change_pct"][rows],
+                        "direction": direction,
+                        "threshold": threshold,
+                        "is_periodic": periodic,
+                        "obs_date": dates[obs_row],
+                        "rule": np.where(adaptive[rows], "adaptive", "fixed"),
+                        "z": np.where(adaptive[rows], z[rows], np.nan),
+                        "_order": order,
+                    }
+                )
+            )
+
+            n_valid = int(ch["valid"].sum())
+            stats.append(
+                {
+                    "category": category,
+                    "indicator": col_name,
+                    "threshold": threshold,
+                    "unit": "bp" if is_rate else (col_info["unit"] if periodic else "%"),
+                    "days": n_valid,
+                    "breach_days": len(rows),
+                    "breach_rate": len(rows) / n_valid * 100 if n_valid else np.nan,
+                    "up": int((direction == "up").sum()),
+                    "down": int((direction == "down").sum()),
+                    # 월간 지표는 같은 기간 비교가 여러 날 반복되므로 관측 기준으로도 집계
+                    "events": len(np.unique(obs_row)),
+                    "last_breach": dates[rows[-1]] if len(rows) else pd.NaT,
+                    "max_abs_change": (
+                        float(np.nanmax(np.abs(ch["change_pct"][rows]))) if len(rows) else np.nan
+                    ),
+                }
+            )
+
+    breaches = pd.concat(frames, ignore_index=True)
+    breaches = breaches.sort_values(["날짜", "_order"], kind="stable", ignore_index=True)
+    return {
+        "breaches": breaches.drop(columns="_order")[BREACH_COLUMNS],
+        "stats": pd.DataFrame(stats),
+    }
+
+
+def breaches_on(breaches, date):
+    """특정 기준일의 발생 목록 (check_alerts와 같은 순서)"""
+    return breaches[breaches["날짜"] == pd.Timestamp(date)]
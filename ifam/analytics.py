@@ -0,0 +1,138 @@
+# =============================================================================
+# ifam/analytics.py - 상관관계/회귀분석 함수
+#  - scipy / sklearn은 함수 안에서 import (코어 import 시 로딩하지 않음)
+# =============================================================================
+
+import numpy as np
+import pandas as pd
+
+from .perf import timed
+from .store import date_slice, recent_slice
+
+
+@timed("calculate_correlation_matrix")
+def calculate_correlation_matrix(df, columns, days=365):
+    df_filtered = df.iloc[recent_slice(df["날짜"], days)]
+    return df_filtered[columns].dropna().corr()
+
+
+@timed("calculate_lagged_correlation")
+def calculate_lagged_correlation(df, leading_col, lagging_col, max_lag=30):
+    from scipy import stats
+
+    results = []
+    df_clean = df[["날짜", leading_col, lagging_col]].dropna()
+
+    for lag in range(0, max_lag + 1):
+        if lag == 0:
+            corr, p_value = stats.pearsonr(df_clean[leading_col], df_clean[lagging_col])
+        else:
+            leading_shifted = df_clean[leading_col].iloc[:-lag].values
+            lagging_current = df_clean[lagging_col].iloc[lag:].values
+            if len(leading_shifted) > 10:
+                corr, p_value = stats.pearsonr(leading_shifted, lagging_current)
+            else:
+                corr, p_value = np.nan, np.nan
+        results.append(
+            {
+                "lag": lag,
+                "correlation": corr,
+                "p_value": p_value,
+                "significant": p_value < 0.05 if not np.isnan(p_value) else False,
+            }
+        )
+    return pd.DataFrame(results)
+
+
+def find_optimal_lag(lag_df):
+    valid_df = lag_df.dropna()
+    if len(valid_df) == 0:
+        return None
+    idx = valid_df["correlation"].abs().idxmax()
+    return valid_df.loc[idx]
+
+
+def interpret_correlation(corr):
+    abs_corr = abs(corr)
+    if abs_corr >= 0.7:
+        return "강한", "양의" if corr > 0 else "음의", "correlation-strong"
+    elif abs_corr >= 0.4:
+        return "중간", "양의" if corr > 0 else "음의", "correlation-moderate"
+    return "약한", "양의" if corr > 0 else "음의", "correlation-weak"
+
+
+@timed("build_regression_model")
+def build_regression_model(df, target_col, feature_cols, train_days=365, start=None):
+    """start가 있으면 train_days 대신 start 이후로 학습 (구조 변화 시점 등, regimes.latest_break)"""
+    if start is not None:
+        df_train = df.iloc[date_slice(df["날짜"], start=start)]
+    else:
+        df_train = df.iloc[recent_slice(df["날짜"], train_days)]
+
+    cols_needed = [target_col] + feature_cols
+    df_clean = df_train[cols_needed].dropna()
+
+    if len(df_clean) < 30:
+        return None, None, None, "데이터가 부족합니다"
+
+    from sklearn.linear_model import LinearRegression
+    from sklearn.metrics import mean_absolute_error, r2_score
+    from sklearn.preprocessing import StandardScaler
+
+    X = df_clean[feature_cols].values
+    y = df_clean[target_col].values
+
+    scaler_X = StandardScaler()
+    scaler_y = StandardScaler()
+
+    X_scaled = scaler_X.fit_transform(X)
+    y_scaled = scaler_y.fit_transform(y.reshape(-1, 1)).ravel()
+
+    model = LinearRegression()
+    model.fit(X_scaled, y_scaled)
+
+    y_pred_scaled = model.predict(X_scaled)
+    y_pred = scaler_y.inverse_transform(y_pred_scaled.reshape(-1, 1)).ravel()
+
+    r2 = r2_score(y, y_pred)
+    mae = mean_absolute_error(y, y_pred)
+
+    coef_info = [
+        {
+            "feature": col,
+            "coefficient": model.coef_[i],
+            "importance": abs(model.coef_[i]),
+        }
+        for i, col in enumerate(feature_cols)
+    ]
+    coef_df = pd.DataFrame(coef_info).sort_values("importance", ascending=False)
+
+    return (
+        {
+            "model": model,
+            "scaler_X": scaler_X,
+            "scaler_y": scaler_y,
+            "r2": r2,
+            "mae": mae,
+            "coefficients": coef_df,
+            "y_actual": y,
+            "y_pred": y_pred,
+            "dates": df_train[df_train[target_col].notna()]["날짜"]
+            .iloc[-len(y) :]
+            .values,
+        },
+        X,
+        y,
+        None,
+    )
+
+
+def predict_future(model_info, df, feature_cols):
+    if model_info is None:
+        return None
+    latest = df[feature_cols].dropna().iloc[-1].values.reshape(1, -1)
+    latest_scaled = model_info["scaler_X"].transform(latest)
+    pred_scaled = model_info["model"].predict(latest_scaled)
+    return model_info["scaler_y"].inverse_transform(pred_scaled.reshape(-1, 1)).ravel()[
+        0
+    ]
@@ -0,0 +1,374 @@
+# =============================================================================
+# ifam/api.py - 읽기 전용 HTTP API (병합 데이터 / 요약 / 알림 / 시그널)
+#  - 다른 내부 도구가 Streamlit 화면을 긁거나 CSV를 손으로 받던 것을 대체
+#  - 표준 라이브러리 ThreadingHTTPServer만 사용 (외부 서비스/프레임워크 불필요)
+#  - load_store / service 캐시를 그대로 쓰므로 대시보드와 같은 프로세스에서 띄우면 캐시 공유
+#  - 응답: JSON (Accept-Encoding: gzip이면 gzip 압축) 또는 Arrow IPC stream (format=arrow)
+#  - ETag = 데이터 버전 + 요청 → If-None-Match가 같으면 304 (본문 없이)
+#
+# 사용법 (저장소 루트에서):
+#   python -m ifam.api --port 8765 --no-crawl
+#   curl -s --compressed 'localhost:8765/data?start=2025-11-01&columns=달러환율,육지 SMP'
+#   curl -s 'localhost:8765/data?category=금리&format=arrow' -o rates.arrows
+#   curl -s localhost:8765/summary | python -m json.tool
+#
+# 대시보드 프로세스 안에서 함께 띄우기: IFAM_API_PORT=8765 streamlit run app.py
+#
+# 엔드포인트 (모두 GET)
+#   /health     데이터 버전, 행 수, 기간
+#   /columns    지표 목록 (카테고리/단위/주기)
+#   /data       병합 시계열 ?start=&end=&columns=a,b&category=&format=json|arrow
+#   /summary    get_summary() 결과
+#   /alerts     check_alerts() 결과 ?mode=fixed|adaptive
+#   /alerts/history  과거 급변동 이력 + 지표별 빈도 ?start=&end=&indicator=&mode=
+#   /signals    투자 시그널 + 종합 분석 문구
+#   /export     파일 내보내기 (chunked 전송) ?format=csv|parquet|xlsx + /data와 같은 필터
+#   공통 ?asof=2026-09-01T09:00  그 시점에 알고 있던 데이터 기준 (수정 이력, load_store_asof)
+# =============================================================================
+
+import argparse
+import gzip
+import hashlib
+import itertools
+import json
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, quote, urlsplit
+
+import numpy as np
+
+from .cache import memoize
+from .config import ALERT_MODE, COLUMN_FREQ, DATA_PATH, INDICATORS
+from .export import EXPORT_FORMATS, available_formats, export_filename, iter_csv, open_export
+from .formatting import to_jsonable
+from .loader import load_store, load_store_asof
+from .service import cached_alert_scan, cached_overview, cached_signals
+from .store import date_slice
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+GZIP_MIN_BYTES = 1024
+
+ARROW_MIME = "application/vnd.apache.arrow.stream"
+JSON_MIME = "application/json; charset=utf-8"
+
+
+class ApiError(Exception):
+    """클라이언트 요청 오류 (status 코드와 메시지를 JSON으로 응답)"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+# =============================================================================
+# 응답 본문 생성
+# =============================================================================
+
+
+def _columns_meta():
+    return [
+        {
+            "name": col_name,
+            "category": category,
+            "unit": col_info["unit"],
+            "freq": COLUMN_FREQ.get(col_name, "D"),
+        }
+        for category, info in INDICATORS.items()
+        for col_name, col_info in info["columns"].items()
+    ]
+
+
+def select_view(store, params):
+    """start / end / columns / category 필터를 FrameStore view로 적용 (복사 없음)"""
+    view = store
+    if params.get("start") or params.get("end"):
+        try:
+            view = view.window(params.get("start") or None, params.get("end") or None)
+        except ValueError as exc:
+            raise ApiError(400, f"잘못된 날짜: {exc}")
+
+    if params.get("category"):
+        if params["category"] not in INDICATORS:
+            raise ApiError(400, f"알 수 없는 카테고리: {params['category']}")
+        view = view.category(params["category"])
+
+    if params.get("columns"):
+        columns = [c.strip() for c in params["columns"].split(",") if c.strip()]
+        unknown = [c for c in columns if c not in view.offsets]
+        if unknown:
+            raise ApiError(400, f"알 수 없는 지표: {', '.join(unknown)}")
+        view = view.select(columns)
+    return view
+
+
+def encode_frame(view, fmt):
+    frame = view.to_frame()
+    if fmt == "arrow":
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise ApiError(406, "pyarrow가 설치되어 있지 않아 Arrow 응답을 만들 수 없습니다")
+        # 전송량을 줄이려고 값 열만 float32로 (분석/알림 계산은 float64 블록 그대로)
+        frame = frame.astype({c: np.float32 for c in view.columns})
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return sink.getvalue().to_pybytes(), ARROW_MIME
+
+    body = frame.to_json(orient="split", index=False, date_format="iso", date_unit="s")
+    return body.encode("utf-8"), JSON_MIME
+
+
+def _json_body(obj):
+    return json.dumps(to_jsonable(obj), ensure_ascii=False).encode("utf-8"), JSON_MIME
+
+
+@memoize(maxsize=256)
+def render_endpoint(_store, version, path, params, fmt):
+    """
+    (데이터 버전, 경로, 쿼리, 형식) 단위로 인코딩된 본문을 캐시.
+    같은 요청은 버전이 바뀔 때까지 직렬화도 다시 하지 않는다.
+    """
+    params = dict(params)
+    if path == "/data":
+        return encode_frame(select_view(_store, params), fmt)
+
+    if fmt == "arrow":
+        raise ApiError(406, f"{path}는 JSON만 지원합니다")
+
+    if path == "/health":
+        return _json_body(
+            {
+                "status": "ok",
+                "version": version,
+                "rows": len(_store),
+                "start": str(_store.dates[0].astype("datetime64[D]")),
+                "end": str(_store.dates[-1].astype("datetime64[D]")),
+            }
+        )
+    if path == "/columns":
+        return _json_body(_columns_meta())
+
+    df = _store.to_frame()
+    if path == "/summary":
+        summary, _ = cached_overview(df, version)
+        return _json_body({"date": df["날짜"].iloc[-1], "summary": summary})
+    mode = params.get("mode") or ALERT_MODE
+    if mode not in ("fixed", "adaptive"):
+        raise ApiError(400, f"지원하지 않는 mode: {mode}")
+    if path == "/alerts":
+        _, alerts = cached_overview(df, version, mode)
+        return _json_body({"date": df["날짜"].iloc[-1], "alerts": alerts})
+    if path == "/alerts/history":
+        scan = cached_alert_scan(df, version, mode)
+        breaches = scan["breaches"]
+        try:
+            rows = date_slice(
+                breaches["날짜"], params.get("start") or None, params.get("end") or None
+            )
+        except ValueError as exc:
+            raise ApiError(400, f"잘못된 날짜: {exc}")
+        breaches = breaches.iloc[rows]
+        if params.get("indicator"):
+            breaches = breaches[breaches["indicator"] == params["indicator"]]
+        return _json_body(
+            {
+                "stats": scan["stats"].to_dict("records"),
+                "breaches": breaches.to_dict("records"),
+            }
+        )
+    if path == "/signals":
+        signals, analysis_points = cached_signals(df, version, days=30)
+        return _json_body(
+            {
+                "date": df["날짜"].iloc[-1],
+                "signals": signals,
+                "analysis_points": analysis_points,
+            }
+        )
+    raise ApiError(404, f"없는 경로: {path}")
+
+
+# =============================================================================
+# HTTP 서버
+# =============================================================================
+
+
+class ApiHandler(BaseHTTPRequestHandler):
+    server_version = "IFAM-API/1.0"
+    protocol_version = "HTTP/1.1"
+
+    # make_server()가 서버 객체에 설정
+    #   server.data_path, server.crawl, server.quiet
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        params = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        export = url.path == "/export"
+        fmt = params.pop("format", None) or (
+            "csv"
+            if export
+            else ("arrow" if ARROW_MIME in self.headers.get("Accept", "") else "json")
+        )
+
+        try:
+            if fmt not in (EXPORT_FORMATS if export else ("json", "arrow")):
+                raise ApiError(400, f"지원하지 않는 format: {fmt}")
+            if export and fmt not in available_formats():
+                raise ApiError(406, "pyarrow가 설치되어 있지 않아 Parquet 파일을 만들 수 없습니다")
+            asof = params.pop("asof", None)
+            if asof:
+                try:
+                    store = load_store_asof(asof)
+                except ValueError as exc:
+                    raise ApiError(400, f"잘못된 asof: {exc}")
+                if store is None:
+                    raise ApiError(404, f"{asof} 시점의 수정 이력이 없습니다")
+            else:
+                store = load_store(self.server.data_path, self.server.crawl)
+            if store is None:
+                raise ApiError(503, "데이터를 불러오지 못했습니다")
+
+            key = json.dumps([url.path, sorted(params.items()), fmt], ensure_ascii=False)
+            etag = f'"{store.version}-{hashlib.blake2b(key.encode(), digest_size=6).hexdigest()}"'
+            if etag in self.headers.get("If-None-Match", ""):
+                self._send(304, b"", None, etag)
+                return
+            if export:
+                self._stream_export(select_view(store, params), fmt, etag)
+                return
+
+            body, mime = render_endpoint(
+                store, store.version, url.path, tuple(sorted(params.items())), fmt
+            )
+            self._send(200, body, mime, etag)
+        except ApiError as exc:
+            self._send(exc.status, *_json_body({"error": exc.message}))
+        except Exception as exc:  # 서버는 계속 살아 있어야 함
+            self._send(500, *_json_body({"error": f"{type(exc).__name__}: {exc}"}))
+
+    def _send(self, status, body, mime, etag=None):
+        if (
+            body
+            and len(body) >= GZIP_MIN_BYTES
+            and "gzip" in self.headers.get("Accept-Encoding", "")
+        ):
+            body = gzip.compress(body, compresslevel=5)
+            encoding = "gzip"
+        else:
+            encoding = None
+
+        self.send_response(status)
+        if mime:
+            self.send_header("Content-Type", mime)
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+        if etag:
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
+        self.send_header("Vary", "Accept, Accept-Encoding")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+    def _stream_export(self, view, fmt, etag):
+        """
+        내보내기 파일을 chunked 전송 (CSV는 행 묶음 단위로 만들면서 바로 보냄)
+          - 파일형은 spool 전체, CSV는 헤더 + 첫 행 묶음을 만든 뒤에 200을 보냄 → 그 전 오류는 일반 오류 응답
+          - 헤더를 보낸 뒤의 오류는 본문에 더 쓰지 않고 연결만 끊음 (종료 chunk가 없어 클라이언트가 잘림을 앎)
+        """
+        _, mime, _ = EXPORT_FORMATS[fmt]
+        spool = None
+        if fmt == "csv":
+            chunks = iter_csv(view)
+            chunks = itertools.chain(list(itertools.islice(chunks, 2)), chunks)
+        else:
+            spool = open_export(view, fmt)
+            chunks = iter(lambda: spool.read(64 * 1024), b"")
+
+        self.send_response(200)
+        self.send_header("Content-Type", mime)
+        self.send_header(
+            "Content-Disposition",
+            f"attachment; filename*=UTF-8''{quote(export_filename(view, fmt))}",
+        )
+        self.send_header("Transfer-Encoding", "chunked")
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        try:
+            for chunk in chunks:
+                if chunk:
+                    self.wfile.write(f"{len(chunk):X}\r\n".encode() + chunk + b"\r\n")
+            self.wfile.write(b"0\r\n\r\n")
+        except Exception as exc:
+            self.close_connection = True
+            self.log_error("내보내기 전송 중단: %s: %s", type(exc).__name__, exc)
+        finally:
+            if spool is not None:
+                spool.close()
+
+    def log_message(self, format, *args):
+        if not getattr(self.server, "quiet", False):
+            super().log_message(format, *args)
+
+
+def make_server(host=DEFAULT_HOST, port=DEFAULT_PORT, data_path=DATA_PATH, crawl=True, quiet=False):
+    server = ThreadingHTTPServer((host, port), ApiHandler)
+    server.daemon_threads = True
+    server.data_path = data_path
+    server.crawl = crawl
+    server.quiet = quiet
+    return server
+
+
+_background = {"server": None}
+_background_lock = threading.Lock()
+
+
+def start_background(host=DEFAULT_HOST, port=DEFAULT_PORT, **kwargs):
+    """
+    현재 프로세스 안에서 API 서버를 daemon 스레드로 시작 (프로세스당 1번만).
+    대시보드와 같은 프로세스라 load_store / 분석 캐시를 그대로 공유한다.
+    """
+    with _background_lock:
+        if _background["server"] is None:
+            server = make_server(host, port, quiet=True, **kwargs)
+            threading.Thread(
+                target=server.serve_forever, name="ifam-api", daemon=True
+            ).start()
+            _background["server"] = server
+        return _background["server"]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m ifam.api", description="지표 데이터 읽기 전용 HTTP API"
+    )
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--data", default=DATA_PATH, help="엑셀 히스토리 경로")
+    parser.add_argument(
+        "--no-crawl", action="store_true", help="크롤링 없이 엑셀 히스토리만 사용"
+    )
+    parser.add_argument("--quiet", action="store_true", help="요청 로그 끄기")
+    args = parser.parse_args(argv)
+
+    server = make_server(args.host, args.port, args.data, not args.no_crawl, args.quiet)
+    print(f"IFAM API: http://{args.host}:{server.server_port}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
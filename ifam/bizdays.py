@@ -0,0 +1,34 @@
+# =============================================================================
+# ifam/bizdays.py - 국내 영업일 캘린더 (KRX 휴장일 기준)
+# =============================================================================
+
+import numpy as np
+import pandas as pd
+
+from .config import KR_HOLIDAYS
+
+KR_BUSDAYCAL = np.busdaycalendar(
+    holidays=np.array(KR_HOLIDAYS, dtype="datetime64[D]")
+)
+
+
+def latest_business_day(date_obj):
+    """date_obj 당일이 영업일이면 그대로, 아니면 직전 영업일 (date 반환)"""
+    d = np.datetime64(date_obj, "D")
+    return np.busday_offset(d, 0, roll="backward", busdaycal=KR_BUSDAYCAL).astype(
+        object
+    )
+
+
+def previous_business_day(date_obj):
+    """date_obj 기준 직전 영업일 (date 반환)"""
+    d = np.datetime64(latest_business_day(date_obj), "D")
+    return np.busday_offset(d, -1, busdaycal=KR_BUSDAYCAL).astype(object)
+
+
+def business_days(start, end):
+    """start~end (양끝 포함) 사이 영업일 DatetimeIndex"""
+    days = np.arange(
+        np.datetime64(start, "D"), np.datetime64(end, "D") + 1, dtype="datetime64[D]"
+    )
+    return pd.DatetimeIndex(days[np.is_busday(days, busdaycal=KR_BUSDAYCAL)])
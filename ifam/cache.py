@@ -0,0 +1,166 @@
+# =============================================================================
+# ifam/cache.py - 프로세스 전체 공유 메모리 캐시 (st.cache_data / st.cache_resource 대체)
+#  - Streamlit 없이 배치/API에서도 같은 캐시를 쓰고, 대시보드 세션들과도 공유
+#  - 결과는 복사/피클 없이 그대로 돌려줌 → 세션이 늘어도 결과는 프로세스에 1벌
+#  - 대신 결과 안의 ndarray는 읽기 전용으로 잠금 (한 세션의 수정이 다른 세션에 새지 않도록)
+#    DataFrame은 pandas Copy-on-Write로 파생 객체 수정이 원본에 닿지 않으므로 그대로 둠
+# =============================================================================
+
+import functools
+import inspect
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+from .perf import mark_cache_miss, payload_size
+
+_REGISTRY = []
+
+
+def _freeze(value):
+    """캐시 키로 쓸 수 있게 list/dict/set 인자를 hashable로 변환"""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(v) for v in value)
+    return value
+
+
+def _seal(value, _depth=0):
+    """결과 안의 ndarray를 읽기 전용으로 (dict/list/tuple은 3단계까지 따라감)"""
+    if isinstance(value, np.ndarray):
+        value.flags.writeable = False
+    elif _depth < 3 and isinstance(value, dict):
+        for v in value.values():
+            _seal(v, _depth + 1)
+    elif _depth < 3 and isinstance(value, (list, tuple)):
+        for v in value:
+            _seal(v, _depth + 1)
+    return value
+
+
+class _Flight:
+    """진행 중인 계산 1건 (같은 키로 들어온 다른 호출은 이 결과를 기다렸다가 그대로 받음)"""
+
+    __slots__ = ("done", "result", "error", "owner")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.owner = threading.get_ident()
+
+
+def memoize(ttl=None, maxsize=128):
+    """
+    TTL + LRU 메모리 캐시 데코레이터.
+
+    - 밑줄(_)로 시작하는 인자는 키에서 제외 (st.cache_data 규칙과 동일)
+      → 큰 DataFrame은 _df로 넘기고 FrameStore.version 같은 작은 값으로 키를 잡는다
+    - ttl(초)이 지나면 다시 계산, maxsize를 넘으면 가장 오래 안 쓴 항목부터 제거
+    - single-flight: 같은 키의 계산이 진행 중이면 새로 계산하지 않고 그 결과를 기다림
+      (TTL 만료 직후 여러 세션이 동시에 rerun해도 크롤링/엑셀 파싱은 1번)
+    - 캐시 안에서 본문이 실행되면(miss) 바깥 timed 기록에 표시
+    - wrapper.clear()로 비우기, wrapper.invalidate(*args)로 해당 키만 비우기,
+      clear_all()로 전체 비우기 (진행 중이던 계산 결과는 기다리던 호출에만 전달되고 저장되지 않음)
+    """
+
+    def decorator(fn):
+        signature = inspect.signature(fn)
+        key_params = [p for p in signature.parameters if not p.startswith("_")]
+        entries = OrderedDict()
+        inflight = {}
+        lock = threading.Lock()
+        generation = [0]
+
+        def make_key(args, kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            return tuple(_freeze(bound.arguments[p]) for p in key_params)
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            key = make_key(args, kwargs)
+            now = time.monotonic()
+            with lock:
+                hit = entries.get(key)
+                if hit is not None and (ttl is None or now - hit[0] < ttl):
+                    entries.move_to_end(key)
+                    return hit[1]
+                flight = inflight.get(key)
+                leader = flight is None or flight.owner == threading.get_ident()
+                if leader:
+                    flight = inflight[key] = _Flight()
+                    started = generation[0]
+
+            if not leader:
+                flight.done.wait()
+                if flight.error is not None:
+                    raise flight.error
+                return flight.result
+
+            mark_cache_miss()
+            try:
+                flight.result = _seal(fn(*args, **kwargs))
+            except BaseException as exc:
+                flight.error = exc
+                raise
+            finally:
+                with lock:
+                    if inflight.get(key) is flight:
+                        del inflight[key]
+                    if flight.error is None and generation[0] == started:
+                        entries[key] = (now, flight.result)
+                        entries.move_to_end(key)
+                        while len(entries) > maxsize:
+                            entries.popitem(last=False)
+                flight.done.set()
+            return flight.result
+
+        def clear():
+            with lock:
+                entries.clear()
+                generation[0] += 1
+
+        def invalidate(*args, **kwargs):
+            key = make_key(args, kwargs)
+            with lock:
+                entries.pop(key, None)
+                generation[0] += 1
+
+        def cache_info():
+            with lock:
+                values = [v for _, v in entries.values()]
+                pending = len(inflight)
+            return {
+                "name": fn.__qualname__,
+                "size": len(values),
+                "inflight": pending,
+                "ttl": ttl,
+                "maxsize": maxsize,
+                "bytes": sum(payload_size(v) for v in values),
+            }
+
+        wrapper.clear = clear
+        wrapper.invalidate = invalidate
+        wrapper.cache_info = cache_info
+        _REGISTRY.append(wrapper)
+        return wrapper
+
+    return decorator
+
+
+def clear_all():
+    """memoize 캐시 전체 비우기 (데이터 새로고침)"""
+    for wrapper in _REGISTRY:
+        wrapper.clear()
+
+
+def cache_stats():
+    """memoize 캐시별 항목 수 / 결과 크기 추정 (프로세스 전체, 크기순)"""
+    stats = [wrapper.cache_info() for wrapper in _REGISTRY]
+    return sorted(stats, key=lambda s: -s["bytes"])
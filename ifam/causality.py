@@ -0,0 +1,143 @@
+# =============================================================================
+# ifam/causality.py - VAR / Granger 인과 (여러 지표를 한 모형에서 함께 보는 선행-후행 분석)
+#  - 시차 상관(analytics.calculate_lagged_correlation)은 두 지표씩만 봄
+#    → 두바이유가 SMP를 이끄는지, 둘 다 달러환율을 따라가는지 구분 못 함
+#  - 선택한 지표들의 일간 변동(%, 금리/스왑은 %p)으로 VAR(p)를 적합하고
+#    "다른 지표의 과거를 모두 넣은 상태에서 i의 과거가 j 예측에 도움이 되는가"를 F 검정
+#  - 시차 설계행렬은 sliding_window_view로 한 번에 (시차마다 .shift() 복사 없음)
+#  - 표본은 Gram 행렬(X'X, X'Y, Y'Y)을 만들 때 1번만 훑고, 모든 식(지표 k개)은 lstsq 한 번으로
+#  - Granger F는 계수 공분산 블록에 대한 Wald 형태로 (원인 k개 × 결과 k개)를 batched solve 한 번에
+#    (원인 지표를 뺀 제약 모형을 식마다 따로 적합한 F와 같은 값)
+#  - 시차 p는 1..max_lag 중 BIC 최소 (같은 표본에서 비교)
+# =============================================================================
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+from .alerts import RATE_CATEGORIES
+from .config import INDICATORS
+from .perf import timed
+
+_IS_RATE = {
+    col_name: category in RATE_CATEGORIES
+    for category, info in INDICATORS.items()
+    for col_name in info["columns"]
+}
+
+
+def daily_changes(values, columns):
+    """(행=영업일, 열=지표) 수준 → 일간 변동 (가격은 %, 금리/스왑은 %p). 첫 행은 NaN"""
+    values = np.asarray(values, dtype=np.float64)
+    is_rate = np.array([_IS_RATE.get(c, False) for c in columns])
+    diff = np.full_like(values, np.nan)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        diff[1:] = np.where(is_rate, values[1:] - values[:-1], (values[1:] / values[:-1] - 1) * 100)
+    diff[~np.isfinite(diff)] = np.nan
+    return diff
+
+
+def lagged_design(changes, lags):
+    """
+    (T, k) 변동 → X (n, 1 + lags·k) [상수, 1시차 k개, 2시차 k개, ...], Y (n, k).
+    시차 창은 strided view, X를 채울 때 1번만 복사. 결측이 하나라도 낀 행은 제외.
+    """
+    T, k = changes.shape
+    windows = sliding_window_view(changes, (lags + 1, k))[:, 0]  # (T - lags, lags + 1, k)
+    Y = windows[:, lags]
+    X = np.empty((T - lags, 1 + lags * k))
+    X[:, 0] = 1.0
+    X[:, 1:] = windows[:, lags - 1 :: -1].reshape(T - lags, lags * k)
+    complete = ~(np.isnan(X).any(axis=1) | np.isnan(Y).any(axis=1))
+    return X[complete], Y[complete]
+
+
+def _ols_gram(xtx, xty, yty, m):
+    """
+    앞 m개 설명변수로 모든 식을 한 번에 OLS (Gram 행렬 부분 블록만 사용 → 표본 크기와 무관).
+    반환: (계수 (m, k), 잔차 제곱합·교차곱 (k, k))
+    """
+    coef = np.linalg.lstsq(xtx[:m, :m], xty[:m], rcond=None)[0]
+    return coef, yty - coef.T @ xty[:m]
+
+
+@timed("fit_var")
+def fit_var(store, columns, max_lag=5, window=None):
+    """
+    store의 최근 window일(None이면 전체) columns로 VAR(p) 적합 + 모든 쌍의 Granger F 검정.
+    반환: (결과 dict, 오류 문자열) - 결과
+      columns, lag (BIC 선택 p), bic (1..max_lag), n_obs,
+      coef (p, 원인, 결과), r2 (식마다), f_stat / p_value (행=원인, 열=결과, 대각은 NaN)
+    """
+    from scipy import stats
+
+    columns = [c for c in columns if c in store.offsets]
+    k = len(columns)
+    if k < 2:
+        return None, "지표를 2개 이상 선택하세요"
+
+    view = store.recent(window).select(columns)
+    changes = daily_changes(view.values, columns)
+    if len(changes) <= max_lag + 1:
+        return None, "데이터가 부족합니다"
+
+    X_full, Y = lagged_design(changes, max_lag)
+    n = len(Y)
+    if n < 1 + max_lag * k + 30:
+        return None, "데이터가 부족합니다"
+
+    # 표본을 지나는 계산은 Gram 행렬 3개뿐, 시차별 적합/검정은 (1 + max_lag·k)차 행렬 연산
+    xtx, xty, yty = X_full.T @ X_full, X_full.T @ Y, Y.T @ Y
+    bic = np.full(max_lag, np.inf)
+    for p in range(1, max_lag + 1):
+        sign, logdet = np.linalg.slogdet(_ols_gram(xtx, xty, yty, 1 + p * k)[1] / n)
+        if sign > 0:
+            bic[p - 1] = logdet + np.log(n) / n * p * k * k
+    lags = int(np.argmin(bic)) + 1
+    m = 1 + lags * k
+    dof = n - m
+
+    coef, ssr = _ols_gram(xtx, xty, yty, m)  # (m, k) - 식 k개를 한 번에
+    s2 = np.diag(ssr) / dof
+    sst = ((Y - Y.mean(axis=0)) ** 2).sum(axis=0)
+
+    # 원인 i의 시차 계수 블록 b_ij (p개)에 대한 Wald: b' [s²_j (X'X)⁻¹_ii]⁻¹ b / p
+    xtx_inv = np.linalg.pinv(xtx[:m, :m])
+    block = 1 + np.arange(lags)[None, :] * k + np.arange(k)[:, None]  # (원인, p) 열 위치
+    cov_blocks = xtx_inv[block[:, :, None], block[:, None, :]]  # (원인, p, p)
+    coef_blocks = coef[block]  # (원인, p, 결과)
+    wald = (coef_blocks * np.linalg.solve(cov_blocks, coef_blocks)).sum(axis=1)
+    f_stat = wald / (lags * s2[None, :])
+    np.fill_diagonal(f_stat, np.nan)
+
+    return (
+        {
+            "columns": columns,
+            "lag": lags,
+            "bic": bic,
+            "n_obs": n,
+            "coef": coef[1:].reshape(lags, k, k),
+            "r2": 1 - np.diag(ssr) / sst,
+            "f_stat": f_stat,
+            "p_value": stats.f.sf(f_stat, lags, dof),
+        },
+        None,
+    )
+
+
+def granger_table(result, alpha=0.05):
+    """fit_var 결과 → (원인, 결과, F, p값, 유의) 행 목록 (p값 오름차순)"""
+    columns = result["columns"]
+    rows = [
+        {
+            "원인": columns[i],
+            "결과": columns[j],
+            "F": result["f_stat"][i, j],
+            "p값": result["p_value"][i, j],
+            "유의": bool(result["p_value"][i, j] < alpha),
+        }
+        for i in range(len(columns))
+        for j in range(len(columns))
+        if i != j
+    ]
+    return pd.DataFrame(rows).sort_values("p값", kind="stable").reset_index(drop=True)
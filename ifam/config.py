@@ -0,0 +1,293 @@
+# =============================================================================
+# ifam/config.py - 설정 (지표 정의 / 알림 임계값 / 휴장일 / 보간 규칙)
+#  - 순수 파이썬 상수만 둔다 (import 비용 없음)
+# =============================================================================
+
+import os
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DATA_PATH = os.path.join(PROJECT_ROOT, "data", "데일리_클리핑_자료.xlsm")
+
+# 크롤링 값 검증에서 걸러진(격리된) 값 기록
+#  - IFAM_QUARANTINE_PATH / IFAM_REVISIONS_PATH: 벤치·테스트 실행이 실제 기록에 섞이지 않도록 경로 변경
+QUARANTINE_PATH = os.environ.get(
+    "IFAM_QUARANTINE_PATH", os.path.join(PROJECT_ROOT, "data", "quarantine.sqlite")
+)
+
+# 값 수정 이력 (관측일 × 수집 시각, 특정 시점에 알고 있던 데이터 재현용)
+REVISIONS_PATH = os.environ.get(
+    "IFAM_REVISIONS_PATH", os.path.join(PROJECT_ROOT, "data", "revisions.sqlite")
+)
+
+# 알림 발송 outbox (재시작해도 이미 보낸 알림은 다시 보내지 않도록 발송 기록 보관)
+ALERT_OUTBOX_PATH = os.path.join(PROJECT_ROOT, "data", "alert_outbox.sqlite")
+
+DATA_COLUMNS = [
+    "날짜",
+    "달러환율",
+    "엔환율",
+    "유로환율",
+    "위안화환율",
+    "육지 가격",
+    "육지 거래량",
+    "제주 가격",
+    "제주 거래량",
+    "육지 SMP",
+    "제주 SMP",
+    "두바이유",
+    "브렌트유",
+    "WTI",
+    "탱크로리용",
+    "연료전지용",
+    "콜금리(1일)",
+    "CD (91일)",
+    "CP (91일)",
+    "국고채 (3년)",
+    "국고채 (5년)",
+    "국고채 (10년)",
+    "산금채 (1년)",
+    "회사채 (3년)(AA-)",
+    "회사채 (3년)(BBB-)",
+    "IRS (3년)",
+    "IRS (5년)",
+    "IRS (10년)",
+    "CRS (1년)",
+    "CRS (3년)",
+]
+
+# 지표 정의 (unit 단위 / format 표시 형식 / freq 고유 주기 / range 값이 있을 수 있는 범위 - 크롤링 값 검증용)
+INDICATORS = {
+    "환율": {
+        "icon": "💱",
+        "color": "#3498db",
+        "columns": {
+            "달러환율": {"unit": "원", "format": "{:,.1f}", "range": (800, 2500)},
+            "엔환율": {"unit": "원/100엔", "format": "{:,.2f}", "range": (500, 2000)},
+            "유로환율": {"unit": "원", "format": "{:,.2f}", "range": (900, 2600)},
+            "위안화환율": {"unit": "원", "format": "{:,.2f}", "range": (100, 400)},
+        },
+    },
+    "REC": {
+        "icon": "📗",
+        "color": "#27ae60",
+        "columns": {
+            "육지 가격": {"unit": "원/REC", "format": "{:,.0f}", "range": (500, 300000)},
+            "육지 거래량": {"unit": "REC", "format": "{:,.0f}", "range": (0, 5000000)},
+            "제주 가격": {"unit": "원/REC", "format": "{:,.0f}", "range": (500, 300000)},
+            "제주 거래량": {"unit": "REC", "format": "{:,.0f}", "range": (0, 1000000)},
+        },
+    },
+    "SMP": {
+        "icon": "⚡",
+        "color": "#f39c12",
+        "columns": {
+            "육지 SMP": {"unit": "원/kWh", "format": "{:,.2f}", "range": (0, 1000)},
+            "제주 SMP": {"unit": "원/kWh", "format": "{:,.2f}", "range": (0, 1000)},
+        },
+    },
+    "유가": {
+        "icon": "🛢️",
+        "color": "#e74c3c",
+        "columns": {
+            "두바이유": {"unit": "$/배럴", "format": "{:,.2f}", "range": (5, 300)},
+            "브렌트유": {"unit": "$/배럴", "format": "{:,.2f}", "range": (5, 300)},
+            "WTI": {"unit": "$/배럴", "format": "{:,.2f}", "range": (-50, 300)},
+        },
+    },
+    "LNG": {
+        "icon": "🔥",
+        "color": "#9b59b6",
+        "columns": {
+            "탱크로리용": {"unit": "원/MJ", "format": "{:,.4f}", "freq": "M", "range": (3, 100)},
+            "연료전지용": {"unit": "원/MJ", "format": "{:,.4f}", "freq": "M", "range": (3, 100)},
+        },
+    },
+    "금리": {
+        "icon": "📊",
+        "color": "#1abc9c",
+        "columns": {
+            "콜금리(1일)": {"unit": "%", "format": "{:,.3f}", "range": (-1, 20)},
+            "CD (91일)": {"unit": "%", "format": "{:,.2f}", "range": (-1, 20)},
+            "CP (91일)": {"unit": "%", "format": "{:,.2f}", "range": (-1, 20)},
+            "국고채 (3년)": {"unit": "%", "format": "{:,.3f}", "range": (-1, 20)},
+            "국고채 (5년)": {"unit": "%", "format": "{:,.3f}", "range": (-1, 20)},
+            "국고채 (10년)": {"unit": "%", "format": "{:,.3f}", "range": (-1, 20)},
+            "산금채 (1년)": {"unit": "%", "format": "{:,.3f}", "range": (-1, 20)},
+            "회사채 (3년)(AA-)": {"unit": "%", "format": "{:,.3f}", "range": (-1, 20)},
+            "회사채 (3년)(BBB-)": {"unit": "%", "format": "{:,.3f}", "range": (0, 30)},
+        },
+    },
+    "스왑": {
+        "icon": "🔄",
+        "color": "#34495e",
+        "columns": {
+            "IRS (3년)": {"unit": "%", "format": "{:,.4f}", "range": (-1, 20)},
+            "IRS (5년)": {"unit": "%", "format": "{:,.4f}", "range": (-1, 20)},
+            "IRS (10년)": {"unit": "%", "format": "{:,.4f}", "range": (-1, 20)},
+            "CRS (1년)": {"unit": "%", "format": "{:,.2f}", "range": (-3, 15)},
+            "CRS (3년)": {"unit": "%", "format": "{:,.2f}", "range": (-3, 15)},
+        },
+    },
+}
+
+# 지표별 고유 주기 ("D" 일간 / "W" 주간 / "M" 월간 / "Q" 분기, INDICATORS에 "freq" 미지정 시 일간)
+COLUMN_FREQ = {
+    col_name: col_info.get("freq", "D")
+    for info in INDICATORS.values()
+    for col_name, col_info in info["columns"].items()
+}
+
+CHART_PERIODS = {"1개월": 30, "3개월": 90, "6개월": 180, "1년": 365, "전체": None}
+
+# 시계열 차트: 지표당 브라우저로 보내는 최대 점 개수 (차트 폭 픽셀 수준) / 다운샘플 방식
+CHART_MAX_POINTS = 2000
+CHART_DOWNSAMPLE = "lttb"  # "lttb" | "minmax"
+
+ALERT_THRESHOLDS = {
+    "환율": 1.0,
+    "REC": 3.0,
+    "SMP": 5.0,
+    "유가": 3.0,
+    "LNG": 5.0,
+    "금리": 0.1,
+    "스왑": 0.1,
+}
+
+# 알림 기준: "fixed" = 임계값 고정, "adaptive" = 지표별 EWMA 변동성 대비 z-score
+ALERT_MODE = "fixed"
+ALERT_EWMA_LAMBDA = 0.94  # RiskMetrics 일간 감쇠계수 (반감기 약 11영업일)
+ALERT_MIN_OBS = 20  # 변동성 추정에 필요한 최소 관측 수 (미달 시 고정 임계값 사용)
+
+# 지표별 알림 규칙 (기본값은 ALERT_THRESHOLDS 카테고리 값, 지표 단위로 덮어쓰기)
+#  - threshold: 고정 기준 (%, 금리/스왑은 %p → 0.1 = 10bp, 월간 지표는 변동폭)
+#  - z: 변동성 기준 배수 (|변동| >= z × 직전까지의 EWMA 표준편차)
+#  - floor: 변동성 기준에서도 이보다 작은 변동은 무시 (조용한 구간의 과민 반응 방지)
+#  - adaptive: False면 항상 고정 기준 (관측이 드문 월간 지표 등)
+ALERT_RULE_OVERRIDES = {
+    "탱크로리용": {"adaptive": False},
+    "연료전지용": {"adaptive": False},
+}
+
+ALERT_RULES = {
+    col_name: {
+        "threshold": ALERT_THRESHOLDS.get(category, 5.0),
+        "z": 3.0,
+        "floor": ALERT_THRESHOLDS.get(category, 5.0) / 2,
+        "adaptive": True,
+        **ALERT_RULE_OVERRIDES.get(col_name, {}),
+    }
+    for category, info in INDICATORS.items()
+    for col_name in info["columns"]
+}
+
+# 크롤링 값 검증 (병합 전에 전일/당일 값을 히스토리와 비교, 걸리면 덮어쓰지 않고 격리)
+#  - 범위: INDICATORS의 range 밖
+#  - MAD: 직전 VALIDATION_WINDOW개 관측의 일간 변동 대비 robust z-score가 VALIDATION_MAD_Z 초과
+#         이면서 변동 폭이 VALIDATION_MIN_MOVE 이상 (%, 금리/스왑은 %p)
+#  - 스프레드: 두 지표 차이가 최근 중앙값에서 허용 폭($ 등 지표 단위) 이상 벗어남
+VALIDATION_WINDOW = 60
+VALIDATION_MAD_Z = 12.0
+VALIDATION_MIN_MOVE = {
+    "환율": 3.0,
+    "REC": 20.0,
+    "SMP": 60.0,
+    "유가": 10.0,
+    "LNG": 20.0,
+    "금리": 0.5,
+    "스왑": 0.5,
+}
+# 지표 단위 덮어쓰기 (None = MAD 검사 안 함, 거래량처럼 꼬리가 두꺼운 지표는 범위 검사만)
+VALIDATION_MIN_MOVE_OVERRIDES = {
+    "육지 거래량": None,
+    "제주 거래량": None,
+    "제주 가격": 100.0,
+}
+VALIDATION_SPREADS = [("두바이유", "브렌트유", 15.0)]
+
+KEY_INDICATORS = [
+    "달러환율",
+    "유로환율",
+    "위안화환율",
+    "육지 SMP",
+    "제주 SMP",
+    "두바이유",
+    "브렌트유",
+    "WTI",
+    "국고채 (3년)",
+    "국고채 (5년)",
+    "국고채 (10년)",
+    "IRS (3년)",
+    "IRS (5년)",
+]
+
+# 구조 변화(국면) 탐지: 표준화한 지표 수준의 평균 변화점 (PELT)
+#  - 벌점 = REGIME_PENALTY × log(관측치 수), 클수록 큰 국면 전환만 남음
+#    (2021~2025 히스토리에서 지표당 2~3개: 유가 2022-02/2022-09, 금리 2022-03/2024-07 등)
+#  - 국면은 최소 REGIME_MIN_SIZE 관측 (약 3개월)
+REGIME_PENALTY = 10.0
+REGIME_MIN_SIZE = 60
+
+# 리스크 지표 (일간 변동 기준: 가격은 %, 금리/스왑은 bp)
+RISK_WINDOW = 250  # VaR / 최대낙폭 계산 기간 (영업일, 약 1년)
+RISK_VOL_WINDOW = 20  # 이동 변동성 창 (영업일)
+RISK_VAR_ALPHA = 0.99  # 1일 VaR 신뢰수준
+RISK_ANNUALIZE = 252  # 연율화 (영업일 수)
+RISK_PERIODS = {"6개월": 125, "1년": 250, "2년": 500}  # 대시보드 계산 기간 선택지 (영업일)
+
+# 시나리오 충격 (가격은 %, 금리/스왑은 bp)
+#  - 직접 충격을 주지 않은 SCENARIO_TARGETS는 충격 지표에 대한 과거 베타로 전파
+#    (최근 SCENARIO_LOOKBACK 영업일의 SCENARIO_HORIZON 영업일 변동으로 회귀)
+#  - 조달금리 = SCENARIO_BASE_RATE + 가산금리 → 수익성 시뮬레이터의 이자비용/현금흐름에 반영
+SCENARIO_PRESETS = {
+    "금리 +100bp": {"국고채 (3년)": 100.0},
+    "달러 +10%": {"달러환율": 10.0},
+    "금리 +100bp · 달러 +10%": {"국고채 (3년)": 100.0, "달러환율": 10.0},
+    "유가 +30%": {"두바이유": 30.0},
+}
+SCENARIO_TARGETS = ["육지 SMP", "육지 가격", "국고채 (3년)"]
+SCENARIO_BASE_RATE = "국고채 (3년)"
+SCENARIO_HORIZON = 20
+SCENARIO_LOOKBACK = 750
+
+# 국내 금융시장 휴장일 (KRX 휴장일 기준, 주말 제외 / 대체·임시공휴일, 연말 휴장 포함)
+# ※ 매년 말 KRX 공시를 보고 다음 해 휴장일을 추가해야 함
+KR_HOLIDAYS = [
+    # 2021
+    "2021-01-01", "2021-02-11", "2021-02-12", "2021-03-01", "2021-05-05",
+    "2021-05-19", "2021-08-16", "2021-09-20", "2021-09-21", "2021-09-22",
+    "2021-10-04", "2021-10-11", "2021-12-31",
+    # 2022
+    "2022-01-31", "2022-02-01", "2022-02-02", "2022-03-01", "2022-03-09",
+    "2022-05-05", "2022-06-01", "2022-06-06", "2022-08-15", "2022-09-09",
+    "2022-09-12", "2022-10-03", "2022-10-10", "2022-12-30",
+    # 2023
+    "2023-01-23", "2023-01-24", "2023-03-01", "2023-05-01", "2023-05-05",
+    "2023-05-29", "2023-06-06", "2023-08-15", "2023-09-28", "2023-09-29",
+    "2023-10-02", "2023-10-03", "2023-10-09", "2023-12-25", "2023-12-29",
+    # 2024
+    "2024-01-01", "2024-02-09", "2024-02-12", "2024-03-01", "2024-04-10",
+    "2024-05-01", "2024-05-06", "2024-05-15", "2024-06-06", "2024-08-15",
+    "2024-09-16", "2024-09-17", "2024-09-18", "2024-10-01", "2024-10-03",
+    "2024-10-09", "2024-12-25", "2024-12-31",
+    # 2025
+    "2025-01-01", "2025-01-27", "2025-01-28", "2025-01-29", "2025-01-30",
+    "2025-03-03", "2025-05-01", "2025-05-05", "2025-05-06", "2025-06-03",
+    "2025-06-06", "2025-08-15", "2025-10-03", "2025-10-06", "2025-10-07",
+    "2025-10-08", "2025-10-09", "2025-12-25", "2025-12-31",
+    # 2026
+    "2026-01-01", "2026-02-16", "2026-02-17", "2026-02-18", "2026-03-02",
+    "2026-05-01", "2026-05-05", "2026-05-25", "2026-06-03", "2026-08-17",
+    "2026-09-24", "2026-09-25", "2026-10-05", "2026-10-09", "2026-12-25",
+    "2026-12-31",
+    # 2027
+    "2027-01-01", "2027-02-08", "2027-02-09", "2027-03-01", "2027-05-05",
+    "2027-05-13", "2027-08-16", "2027-09-14", "2027-09-15", "2027-09-16",
+    "2027-10-04", "2027-10-11", "2027-12-27", "2027-12-31",
+]
+
+# 영업일 그리드 결측 규칙
+#  - 일간 지표: 그리드에는 채우지 않음. 최신/직전 값 비교(요약, 알림, 시그널)에서만
+#    직전 관측값을 최대 N영업일까지 as-of로 끌어옴 (0이면 끌어오지 않음)
+#  - 주간/월간 지표(LNG 요금 등): 그리드에는 고시된 칸만. 기간 비교는 frequency 인덱스로
+ASOF_FILL_LIMIT = 5
@@ -0,0 +1,487 @@
+# =============================================================================
+# ifam/crawlers.py - 크롤링 함수들 (실제 HTML 구조에 맞게 selector는 한 번씩 확인 필요)
+#  - bs4는 함수 안에서 import (코어 import 시 로딩하지 않음), HTTP는 fetch.http_get (재시도 / 녹화·재생)
+#  - 소스별 결과는 memoize로 캐시 (CRAWL_SOURCES 단위로 새로고침)
+# =============================================================================
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from .bizdays import latest_business_day, previous_business_day
+from .cache import memoize
+from .fetch import http_get
+from .perf import perf_context, timed
+
+
+@timed("fetch_fx_smbs", cached=True)
+@memoize(ttl=1800)
+def fetch_fx_smbs(target_date):
+    """
+    환율 - 서울외국환중개 (smbs.biz)
+    URL: http://www.smbs.biz/ExRate/TodayExRate.jsp?tr_date=YYYYMMDD
+
+    반환 예시:
+    {
+      '달러환율': 1473.5,
+      '엔환율': 944.01,
+      '유로환율': 1704.99,
+      '위안화환율': 207.78
+    }
+    """
+    from bs4 import BeautifulSoup
+
+    base_url = "http://www.smbs.biz/ExRate/TodayExRate.jsp"
+    params = {"tr_date": target_date.strftime("%Y%m%d")}
+    fx = {}
+
+    try:
+        res = http_get(base_url, params=params, timeout=10)
+        res.encoding = res.apparent_encoding
+        soup = BeautifulSoup(res.text, "html.parser")
+
+        table = soup.find("table")
+        if not table:
+            return fx
+
+        for row in table.find_all("tr"):
+            tds = row.find_all("td")
+            if len(tds) < 2:
+                continue
+
+            name = tds[0].get_text(strip=True)
+            val_txt = tds[1].get_text(strip=True).replace(",", "")
+
+            try:
+                value = float(val_txt)
+            except ValueError:
+                continue
+
+            if "미국" in name or "USD" in name:
+                fx["달러환율"] = value
+            elif "일본" in name or "JPY" in name:
+                fx["엔환율"] = value
+            elif "유로" in name or "EUR" in name:
+                fx["유로환율"] = value
+            elif "중국" in name or "CNY" in name:
+                fx["위안화환율"] = value
+
+        return fx
+    except Exception:
+        return fx
+
+
+@timed("fetch_rec_smp_onerec", cached=True)
+@memoize(ttl=3600)
+def fetch_rec_smp_onerec():
+    """
+    REC + SMP - 에너지공단 ONEREC 포털.
+
+    반환 형식:
+    {
+      '육지 가격': {'current': ..., 'prev': ...},
+      '육지 거래량': {...},
+      '제주 가격': {...},
+      '제주 거래량': {...},
+      '육지 SMP': {...},
+      '제주 SMP': {...}
+    }
+
+    ※ 실제 테이블 헤더/열 순서는 사이트 HTML을 보고 index를 한번 조정해야 함.
+    """
+    from bs4 import BeautifulSoup
+
+    result = {}
+
+    # --------------------------
+    # REC
+    # --------------------------
+    try:
+        rec_url = "https://onerec.kmos.kr/portal/rec/reportNewsList.do"
+        params = {"key": "2335"}
+        res = http_get(rec_url, params=params, timeout=10)
+        res.encoding = res.apparent_encoding
+        soup = BeautifulSoup(res.text, "html.parser")
+
+        table = soup.find("table")
+        if table:
+            rows = table.find_all("tr")
+            rows = [r for r in rows if r.find_all("td") or r.find_all("th")]
+            if len(rows) >= 3:
+                header = [th.get_text(strip=True) for th in rows[0].find_all(["th", "td"])]
+
+                # 대략적인 위치 추정 – 실제 헤더 텍스트 보고 수정
+                idx_land_price = next(
+                    (i for i, h in enumerate(header) if "육지" in h and ("가격" in h or "정산" in h)),
+                    None,
+                )
+                idx_land_vol = next(
+                    (i for i, h in enumerate(header) if "육지" in h and ("거래" in h or "물량" in h)),
+                    None,
+                )
+                idx_jeju_price = next(
+                    (i for i, h in enumerate(header) if "제주" in h and ("가격" in h or "정산" in h)),
+                    None,
+                )
+                idx_jeju_vol = next(
+                    (i for i, h in enumerate(header) if "제주" in h and ("거래" in h or "물량" in h)),
+                    None,
+                )
+
+                def parse_row(row):
+                    vals = []
+                    for td in row.find_all("td"):
+                        txt = (
+                            td.get_text(strip=True)
+                            .replace(",", "")
+                            .replace("원", "")
+                            .replace("REC", "")
+                        )
+                        try:
+                            vals.append(float(txt))
+                        except ValueError:
+                            vals.append(None)
+                    return vals
+
+                data_rows = [r for r in rows[1:] if r.find_all("td")]
+                if len(data_rows) >= 2:
+                    today_vals = parse_row(data_rows[0])
+                    yday_vals = parse_row(data_rows[1])
+
+                    if idx_land_price is not None:
+                        result["육지 가격"] = {
+                            "current": today_vals[idx_land_price],
+                            "prev": yday_vals[idx_land_price],
+                        }
+                    if idx_land_vol is not None:
+                        result["육지 거래량"] = {
+                            "current": today_vals[idx_land_vol],
+                            "prev": yday_vals[idx_land_vol],
+                        }
+                    if idx_jeju_price is not None:
+                        result["제주 가격"] = {
+                            "current": today_vals[idx_jeju_price],
+                            "prev": yday_vals[idx_jeju_price],
+                        }
+                    if idx_jeju_vol is not None:
+                        result["제주 거래량"] = {
+                            "current": today_vals[idx_jeju_vol],
+                            "prev": yday_vals[idx_jeju_vol],
+                        }
+    except Exception:
+        pass
+
+    # --------------------------
+    # SMP
+    # --------------------------
+    try:
+        smp_url = "https://onerec.kmos.kr/portal/rec/selectRecSMPList.do"
+        params = {"key": "1965"}
+        res = http_get(smp_url, params=params, timeout=10)
+        res.encoding = res.apparent_encoding
+        soup = BeautifulSoup(res.text, "html.parser")
+
+        table = soup.find("table")
+        if table:
+            rows = table.find_all("tr")
+            rows = [r for r in rows if r.find_all("td") or r.find_all("th")]
+            if len(rows) >= 3:
+                header = [th.get_text(strip=True) for th in rows[0].find_all(["th", "td"])]
+
+                idx_main = next(
+                    (i for i, h in enumerate(header) if "육지" in h and "SMP" in h),
+                    None,
+                )
+                idx_jeju = next(
+                    (i for i, h in enumerate(header) if "제주" in h and "SMP" in h),
+                    None,
+                )
+
+                def parse_row(row):
+                    vals = []
+                    for td in row.find_all("td"):
+                        txt = td.get_text(strip=True).replace(",", "")
+                        try:
+                            vals.append(float(txt))
+                        except ValueError:
+                            vals.append(None)
+                    return vals
+
+                data_rows = [r for r in rows[1:] if r.find_all("td")]
+                if len(data_rows) >= 2:
+                    today_vals = parse_row(data_rows[0])
+                    yday_vals = parse_row(data_rows[1])
+
+                    if idx_main is not None:
+                        result["육지 SMP"] = {
+                            "current": today_vals[idx_main],
+                            "prev": yday_vals[idx_main],
+                        }
+                    if idx_jeju is not None:
+                        result["제주 SMP"] = {
+                            "current": today_vals[idx_jeju],
+                            "prev": yday_vals[idx_jeju],
+                        }
+    except Exception:
+        pass
+
+    return result
+
+
+@timed("fetch_oil_petronet", cached=True)
+@memoize(ttl=3600)
+def fetch_oil_petronet():
+    """
+    국제유가 - Petronet
+    URL: https://www.petronet.co.kr/v4/sub.jsp?fmuId=KDFQSTAT&smuId=KDFQ01
+
+    반환 예시:
+    {
+      '두바이유': {'current': ..., 'prev': ...},
+      '브렌트유': {'current': ..., 'prev': ...},
+      'WTI': {'current': ..., 'prev': ...}
+    }
+    """
+    from bs4 import BeautifulSoup
+
+    url = "https://www.petronet.co.kr/v4/sub.jsp"
+    params = {"fmuId": "KDFQSTAT", "smuId": "KDFQ01"}
+    result = {}
+
+    try:
+        res = http_get(url, params=params, timeout=10)
+        res.encoding = res.apparent_encoding
+        soup = BeautifulSoup(res.text, "html.parser")
+
+        table = soup.find("table")
+        if not table:
+            return result
+
+        rows = [r for r in table.find_all("tr") if r.find_all("td")]
+        if len(rows) < 2:
+            return result
+
+        # 마지막 두 행을 전일/당일로 가정 (실제 구조에 맞게 필요시 조정)
+        prev_row = rows[-2]
+        curr_row = rows[-1]
+
+        def parse_row(row):
+            vals = []
+            for td in row.find_all("td"):
+                txt = td.get_text(strip=True).replace(",", "")
+                try:
+                    vals.append(float(txt))
+                except ValueError:
+                    vals.append(None)
+            return vals
+
+        prev_vals = parse_row(prev_row)
+        curr_vals = parse_row(curr_row)
+
+        # [날짜, 두바이, 브렌트, WTI] 순이라고 가정
+        if len(curr_vals) >= 4 and len(prev_vals) >= 4:
+            result["두바이유"] = {"current": curr_vals[1], "prev": prev_vals[1]}
+            result["브렌트유"] = {"current": curr_vals[2], "prev": prev_vals[2]}
+            result["WTI"] = {"current": curr_vals[3], "prev": prev_vals[3]}
+
+    except Exception:
+        pass
+
+    return result
+
+
+@timed("fetch_lng_kogas", cached=True)
+@memoize(ttl=3600)
+def fetch_lng_kogas():
+    """
+    LNG 가격 - 한국가스공사
+    URL: https://www.kogas.or.kr/site/koGas/1040401000000
+
+    반환 예시:
+    {
+      '탱크로리용': {'current': ..., 'prev': ...},
+      '연료전지용': {'current': ..., 'prev': ...}
+    }
+    """
+    from bs4 import BeautifulSoup
+
+    url = "https://www.kogas.or.kr/site/koGas/1040401000000"
+    result = {}
+
+    try:
+        res = http_get(url, timeout=10)
+        res.encoding = res.apparent_encoding
+        soup = BeautifulSoup(res.text, "html.parser")
+
+        table = soup.find("table")
+        if not table:
+            return result
+
+        rows = [r for r in table.find_all("tr") if r.find_all("td")]
+        if len(rows) < 2:
+            return result
+
+        curr_row = rows[0]
+        prev_row = rows[1]
+
+        header_cells = [th.get_text(strip=True) for th in table.find_all("th")]
+        idx_tanker = next(
+            (i for i, h in enumerate(header_cells) if "탱크로리" in h),
+            None,
+        )
+        idx_fuel = next(
+            (i for i, h in enumerate(header_cells) if "연료전지" in h),
+            None,
+        )
+
+        def parse_row(row):
+            vals = []
+            for td in row.find_all("td"):
+                txt = (
+                    td.get_text(strip=True)
+                    .replace(",", "")
+                    .replace("원", "")
+                    .replace("MJ", "")
+                )
+                try:
+                    vals.append(float(txt))
+                except ValueError:
+                    vals.append(None)
+            return vals
+
+        curr_vals = parse_row(curr_row)
+        prev_vals = parse_row(prev_row)
+
+        if idx_tanker is not None and idx_tanker < len(curr_vals):
+            result["탱크로리용"] = {
+                "current": curr_vals[idx_tanker],
+                "prev": prev_vals[idx_tanker]
+                if idx_tanker < len(prev_vals)
+                else curr_vals[idx_tanker],
+            }
+        if idx_fuel is not None and idx_fuel < len(curr_vals):
+            result["연료전지용"] = {
+                "current": curr_vals[idx_fuel],
+                "prev": prev_vals[idx_fuel]
+                if idx_fuel < len(prev_vals)
+                else curr_vals[idx_fuel],
+            }
+    except Exception:
+        pass
+
+    return result
+
+
+@timed("ecos_request")
+def ecos_request(stat_code, start_date, end_date, item_code=None):
+    """
+    한국은행 ECOS API 템플릿.
+    실제 stat_code / item_code는 ECOS 개발자센터에서 사용하는 코드로 교체 필요.
+    """
+    # 대시보드는 시작 시 st.secrets 값을 환경변수로 넘겨준다
+    api_key = os.environ.get("ECOS_API_KEY", "")
+    if not api_key:
+        return []
+
+    base_url = (
+        f"https://ecos.bok.or.kr/api/StatisticSearch/{api_key}/json/kr/1/10/"
+        f"{stat_code}/DD/{start_date}/{end_date}"
+    )
+    if item_code:
+        base_url += f"/{item_code}"
+
+    try:
+        res = http_get(base_url, timeout=10)
+        data = res.json()
+        return data.get("StatisticSearch", {}).get("row", [])
+    except Exception:
+        return []
+
+
+@timed("fetch_rates_ecos", cached=True)
+@memoize(ttl=3600)
+def fetch_rates_ecos(today, yesterday):
+    """
+    ECOS에서 콜금리, 국고채3년 등 금리를 가져오는 템플릿.
+
+    실제 stat_code / item_code는 연준님이 쓰는 시리즈로 교체해야 함.
+    현재는 구조만 잡아둔 상태.
+    """
+    result = {}
+
+    today_str = today.strftime("%Y%m%d")
+    yday_str = yesterday.strftime("%Y%m%d")
+
+    # 예시 1) 콜금리(1일) - (코드 예시는 placeholder)
+    call_rows = ecos_request("722Y001", yday_str, today_str, item_code="0100000")
+    if call_rows:
+        call_rows = sorted(call_rows, key=lambda r: r.get("TIME", ""))
+        prev_val = float(call_rows[0]["DATA_VALUE"])
+        curr_val = float(call_rows[-1]["DATA_VALUE"])
+        result["콜금리(1일)"] = {"current": curr_val, "prev": prev_val}
+
+    # 예시 2) 국고채(3년) - placeholder
+    t3_rows = ecos_request("733Y001", yday_str, today_str, item_code="BBK3Y")
+    if t3_rows:
+        t3_rows = sorted(t3_rows, key=lambda r: r.get("TIME", ""))
+        prev_val = float(t3_rows[0]["DATA_VALUE"])
+        curr_val = float(t3_rows[-1]["DATA_VALUE"])
+        result["국고채 (3년)"] = {"current": curr_val, "prev": prev_val}
+
+    # 나머지 CD, CP, 국고채5/10년, 회사채 AA-/BBB- 등도 위 패턴으로 추가 가능
+    return result
+
+
+@timed("fetch_realtime_data_with_history", cached=True)
+@memoize(ttl=1800)
+def fetch_realtime_data_with_history():
+    """
+    크롤링을 통해 '오늘/전일' 데이터를 모두 가져와서 통합 map으로 반환.
+
+    반환 예시:
+    {
+      '달러환율': {'current': 1473.5, 'prev': 1462.7},
+      '육지 SMP': {'current': 110.5, 'prev': 108.2},
+      ...
+    }
+    """
+    today = latest_business_day(datetime.today().date())
+    yesterday = previous_business_day(today)
+
+    # 소스별 요청은 서로 독립 → 동시에 보내고 (가장 느린 사이트 1개 시간), 병합은 아래 순서대로
+    with ThreadPoolExecutor(max_workers=6, thread_name_prefix="crawl") as pool:
+        # 작업마다 perf_context() → 크롤러별 계측(시간 / 캐시 hit·miss / 크기)이 이 run에 기록됨
+        def submit(fn, *args):
+            return pool.submit(perf_context().run, fn, *args)
+
+        fx_today = submit(fetch_fx_smbs, today)
+        fx_yday = submit(fetch_fx_smbs, yesterday)
+        sources = [
+            submit(fetch_rec_smp_onerec),  # REC / SMP
+            submit(fetch_oil_petronet),  # 유가
+            submit(fetch_lng_kogas),  # LNG
+            submit(fetch_rates_ecos, today, yesterday),  # 금리 (ECOS)
+        ]
+
+    data = {}
+
+    # 환율
+    fx_today, fx_yday = fx_today.result(), fx_yday.result()
+    for name in ["달러환율", "엔환율", "유로환율", "위안화환율"]:
+        if name in fx_today and name in fx_yday:
+            data[name] = {"current": fx_today[name], "prev": fx_yday[name]}
+
+    for future in sources:
+        data.update(future.result())
+
+    return data
+
+
+# 새로고침 단위 (소스 → 표시 이름, 크롤러). 선택한 소스의 캐시만 비우고 나머지 크롤링 결과는 재사용
+CRAWL_SOURCES = {
+    "fx": ("환율 (서울외국환중개)", fetch_fx_smbs),
+    "rec_smp": ("REC / SMP (전력거래소)", fetch_rec_smp_onerec),
+    "oil": ("유가 (페트로넷)", fetch_oil_petronet),
+    "lng": ("LNG (가스공사)", fetch_lng_kogas),
+    "rates": ("금리 (ECOS)", fetch_rates_ecos),
+}
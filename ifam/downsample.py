@@ -0,0 +1,82 @@
+# =============================================================================
+# ifam/downsample.py - 차트용 시계열 다운샘플링 (서버에서 점 개수를 화면 해상도 수준으로)
+#  - lttb: Largest-Triangle-Three-Buckets, 모양(급등락)을 보존하는 대표점 선택
+#  - minmax: 구간별 최솟값/최댓값 2점 (가장 빠름, 극값 보존)
+#  - 둘 다 원본 행의 위치(index)를 돌려주므로 날짜/값은 원본에서 그대로 꺼낸다
+# =============================================================================
+
+import numpy as np
+
+from .perf import timed
+
+
+def lttb_indices(x, y, n_out):
+    """
+    LTTB 대표점 위치 (첫/마지막 점 포함 n_out개, x는 오름차순 숫자 배열).
+    가운데 n_out-2개 구간마다, 직전 선택점과 다음 구간 평균점이 만드는
+    삼각형 넓이가 가장 큰 점을 고른다.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    # 다음 구간 평균점 (마지막 구간의 '다음'은 마지막 점)
+    nxt_lo = edges[1:]
+    nxt_hi = np.append(edges[2:], n)
+    csum_x = np.concatenate([[0.0], np.cumsum(x)])
+    csum_y = np.concatenate([[0.0], np.cumsum(y)])
+    avg_x = (csum_x[nxt_hi] - csum_x[nxt_lo]) / (nxt_hi - nxt_lo)
+    avg_y = (csum_y[nxt_hi] - csum_y[nxt_lo]) / (nxt_hi - nxt_lo)
+
+    idx = np.empty(n_out, dtype=np.int64)
+    idx[0] = 0
+    idx[-1] = n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        area = np.abs(
+            (x[a] - avg_x[i]) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y[i] - y[a])
+        )
+        a = lo + int(np.argmax(area))
+        idx[i + 1] = a
+    return idx
+
+
+def minmax_indices(y, n_out):
+    """n_out/2개 구간마다 최솟값/최댓값 위치 (시간 순서 유지, 첫/마지막 점 포함)"""
+    n = len(y)
+    if n_out >= n or n_out < 4:
+        return np.arange(n)
+
+    n_buckets = n_out // 2
+    size = -(-n // n_buckets)
+    padded = np.full(n_buckets * size, np.nan)
+    padded[:n] = y
+    blocks = padded.reshape(n_buckets, size)
+    valid = ~np.all(np.isnan(blocks), axis=1)
+    offsets = np.arange(n_buckets)[valid] * size
+    lo = offsets + np.nanargmin(blocks[valid], axis=1)
+    hi = offsets + np.nanargmax(blocks[valid], axis=1)
+    return np.unique(np.concatenate([[0, n - 1], lo, hi]))
+
+
+@timed("downsample")
+def downsample(dates, values, n_out, method="lttb"):
+    """
+    (날짜, 값) 시계열을 최대 n_out개 점으로 줄임. 결측은 먼저 제외.
+    반환: (dates, values) - 원본 점의 부분집합
+    """
+    values = np.asarray(values, dtype=np.float64)
+    keep = ~np.isnan(values)
+    dates = np.asarray(dates)[keep]
+    values = values[keep]
+    if len(values) <= n_out:
+        return dates, values
+
+    if method == "minmax":
+        idx = minmax_indices(values, n_out)
+    else:
+        x = dates.astype("datetime64[ns]").astype(np.int64).astype(np.float64)
+        idx = lttb_indices(x, values, n_out)
+    return dates[idx], values[idx]
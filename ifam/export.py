@@ -0,0 +1,118 @@
+# =============================================================================
+# ifam/export.py - 데이터 내보내기 (CSV / Parquet / Excel, 클릭했을 때만 생성)
+#  - 입력은 FrameStore view (기간/카테고리 필터 결과) → 전체 프레임 복사본을 만들지 않음
+#  - CSV: EXPORT_CHUNK_ROWS 행씩 끊어서 bytes로 흘려보냄 (한 덩어리 문자열 없음)
+#  - Parquet: 같은 단위의 row group으로 기록 (pyarrow는 쓸 때만 import, 없으면 형식 목록에서 제외)
+#  - Excel: openpyxl write-only 모드로 INDICATORS 카테고리별 시트에 행 단위 기록
+#  - 파일형 결과는 SpooledTemporaryFile (작으면 메모리, 크면 임시 파일)
+# =============================================================================
+
+import tempfile
+from importlib.util import find_spec
+
+import numpy as np
+import pandas as pd
+
+from .config import INDICATORS
+from .perf import timed
+
+EXPORT_CHUNK_ROWS = 5000
+EXPORT_SPOOL_BYTES = 8 * 1024 * 1024
+
+# 형식 → (표시 이름, MIME, 확장자)
+EXPORT_FORMATS = {
+    "csv": ("CSV", "text/csv", "csv"),
+    "parquet": ("Parquet", "application/vnd.apache.parquet", "parquet"),
+    "xlsx": (
+        "Excel (카테고리별 시트)",
+        "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        "xlsx",
+    ),
+}
+
+
+def available_formats():
+    """지금 환경에서 만들 수 있는 형식 (pyarrow가 없으면 Parquet 제외)"""
+    return [f for f in EXPORT_FORMATS if f != "parquet" or find_spec("pyarrow") is not None]
+
+
+def _chunks(view, chunk_rows):
+    for start in range(0, len(view), chunk_rows):
+        yield view.rows(slice(start, start + chunk_rows))
+
+
+def iter_csv(view, chunk_rows=EXPORT_CHUNK_ROWS, encoding="utf-8-sig"):
+    """CSV를 chunk_rows 행 단위 bytes 조각으로 생성 (첫 조각에 BOM + 헤더)"""
+    header = pd.DataFrame(columns=["날짜", *view.columns]).to_csv(index=False, lineterminator="\n")
+    yield header.encode(encoding)
+    encoding = "utf-8" if encoding == "utf-8-sig" else encoding  # BOM은 맨 앞에 1번만
+    for part in _chunks(view, chunk_rows):
+        frame = part.to_frame()
+        frame["날짜"] = frame["날짜"].dt.strftime("%Y-%m-%d")
+        yield frame.to_csv(index=False, header=False, lineterminator="\n").encode(encoding)
+
+
+def write_parquet(view, fileobj, chunk_rows=EXPORT_CHUNK_ROWS):
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ValueError("Parquet 내보내기에는 pyarrow가 필요합니다 (pip install pyarrow)")
+
+    writer = None
+    try:
+        for part in _chunks(view, chunk_rows):
+            table = pa.Table.from_pandas(part.to_frame(), preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(fileobj, table.schema, compression="zstd")
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def write_xlsx(view, fileobj, chunk_rows=EXPORT_CHUNK_ROWS):
+    """INDICATORS 카테고리별 시트 (날짜 + 해당 카테고리 지표), write-only로 행 단위 기록"""
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+
+    wb = Workbook(write_only=True)
+    for category, info in INDICATORS.items():
+        columns = [c for c in info["columns"] if c in view.offsets]
+        if not columns:
+            continue
+        ws = wb.create_sheet(category)
+        ws.append(["날짜", *columns])
+        for part in _chunks(view.select(columns), chunk_rows):
+            dates = part.dates.astype("datetime64[s]").tolist()
+            values = part.values.astype(np.float64)
+            for date, row in zip(dates, values.tolist()):
+                cell = WriteOnlyCell(ws, value=date)
+                cell.number_format = "yyyy-mm-dd"
+                ws.append([cell, *(None if v != v else v for v in row)])  # NaN → 빈 칸
+    wb.save(fileobj)
+
+
+@timed("open_export")
+def open_export(view, fmt):
+    """view를 fmt 형식 파일로 만들어 처음 위치로 되감은 file-like로 반환"""
+    spool = tempfile.SpooledTemporaryFile(max_size=EXPORT_SPOOL_BYTES)
+    if fmt == "csv":
+        for chunk in iter_csv(view):
+            spool.write(chunk)
+    elif fmt == "parquet":
+        write_parquet(view, spool)
+    elif fmt == "xlsx":
+        write_xlsx(view, spool)
+    else:
+        raise ValueError(f"지원하지 않는 내보내기 형식: {fmt}")
+    spool.seek(0)
+    return spool
+
+
+def export_filename(view, fmt):
+    """data_20250101_20251205.csv 형식 (view 기간 기준)"""
+    if len(view) == 0:
+        return f"data.{EXPORT_FORMATS[fmt][2]}"
+    start, end = pd.Timestamp(view.dates[0]), pd.Timestamp(view.dates[-1])
+    return f"data_{start:%Y%m%d}_{end:%Y%m%d}.{EXPORT_FORMATS[fmt][2]}"
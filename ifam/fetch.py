@@ -0,0 +1,272 @@
+# =============================================================================
+# ifam/fetch.py - 크롤러 HTTP 계층 (live / record / replay + 재시도)
+#  - 모든 크롤러는 requests.get 대신 http_get()을 거친다
+#  - live:   실제 요청 (연결 오류/타임아웃/5xx는 지수 백오프로 FETCH_RETRIES번 재시도)
+#  - record: 실제 요청 + 원본 응답(bytes)을 fixture 폴더에 저장
+#  - replay: 네트워크 없이 fixture로 응답, 지연(latency)/실패(failure_rate) 주입 가능
+#    → 네트워크 없는 머신에서 수집 파이프라인 전체(동시 크롤링, 재시도 포함)를 벤치/회귀 확인
+#
+# fixture 폴더 구조
+#   index.json   [{"url", "params", "status", "encoding", "file", "recorded_at"}, ...]
+#   <file>       응답 본문 원본 bytes
+#   replay는 (url, params)가 같은 항목 → 없으면 같은 url의 가장 최근 항목 순으로 찾는다
+#   (환율처럼 날짜 파라미터가 매일 바뀌는 요청도 예전 녹화로 재생)
+#
+# 환경변수 (대시보드/배치 공통, 코드에서는 fetch_mode()로 일시 변경)
+#   IFAM_HTTP_MODE=live|record|replay   IFAM_HTTP_FIXTURES=<폴더>
+#   IFAM_HTTP_LATENCY_MS=200            IFAM_HTTP_FAILURE_RATE=0.2
+#
+# 사용법 (저장소 루트에서):
+#   python -m ifam.fetch --record                         # 현재 사이트 응답 녹화
+#   python -m ifam.fetch --latency-ms 300 --failure-rate 0.3   # 녹화본으로 수집 재생
+# =============================================================================
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+from urllib.parse import urlsplit
+
+from .config import PROJECT_ROOT
+
+FETCH_TIMEOUT = 10
+FETCH_RETRIES = 2  # 첫 시도 외 재시도 횟수
+FETCH_BACKOFF = 0.3  # 재시도 대기 (초, 시도마다 2배)
+FETCH_FIXTURE_DIR = os.path.join(PROJECT_ROOT, "data", "http_fixtures")
+FETCH_REDACT_ENV = ("ECOS_API_KEY",)  # URL에 들어가는 비밀값 → 녹화/조회 시 자리표시자로 바꿈
+
+_config = {
+    "mode": os.environ.get("IFAM_HTTP_MODE", "live"),
+    "fixture_dir": os.environ.get("IFAM_HTTP_FIXTURES", FETCH_FIXTURE_DIR),
+    "latency_ms": float(os.environ.get("IFAM_HTTP_LATENCY_MS", 0)),
+    "failure_rate": float(os.environ.get("IFAM_HTTP_FAILURE_RATE", 0)),
+    "backoff": FETCH_BACKOFF,
+}
+_lock = threading.Lock()
+_index_cache = {}
+_stats = Counter()
+_rng = random.Random()
+
+
+class ReplayMiss(Exception):
+    """replay 모드에서 해당 요청의 녹화본이 없음"""
+
+
+@contextmanager
+def fetch_mode(mode, fixture_dir=None, latency_ms=0.0, failure_rate=0.0, backoff=None, seed=None):
+    """with 블록 동안 HTTP 모드 변경 (벤치/회귀 확인용, 프로세스 전체에 적용)"""
+    saved = dict(_config)
+    _config.update(
+        mode=mode,
+        fixture_dir=fixture_dir or saved["fixture_dir"],
+        latency_ms=latency_ms,
+        failure_rate=failure_rate,
+        backoff=saved["backoff"] if backoff is None else backoff,
+    )
+    if seed is not None:
+        _rng.seed(seed)
+    try:
+        yield
+    finally:
+        _config.clear()
+        _config.update(saved)
+
+
+def fetch_stats():
+    """호출 / 실패 / 재시도 / 녹화 / 재생 횟수 (프로세스 누적)"""
+    with _lock:
+        return dict(_stats)
+
+
+def reset_fetch_stats():
+    with _lock:
+        _stats.clear()
+
+
+def _count(name):
+    with _lock:
+        _stats[name] += 1
+
+
+# -----------------------------------------------------------------------------
+# fixture 저장소
+# -----------------------------------------------------------------------------
+
+
+def _load_index(fixture_dir):
+    path = os.path.join(fixture_dir, "index.json")
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return []
+    cached = _index_cache.get(path)
+    if cached is None or cached[0] != mtime:
+        with open(path, encoding="utf-8") as f:
+            cached = _index_cache[path] = (mtime, json.load(f))
+    return cached[1]
+
+
+def _redact(url):
+    for name in FETCH_REDACT_ENV:
+        secret = os.environ.get(name)
+        if secret:
+            url = url.replace(secret, "{" + name + "}")
+    return url
+
+
+def _normalize_params(params):
+    return {str(k): str(v) for k, v in sorted((params or {}).items())} or None
+
+
+def find_fixture(url, params=None, fixture_dir=None):
+    """(url, params) 녹화 항목. 정확히 같은 요청 → 같은 url의 최근 녹화 순, 없으면 None"""
+    entries = _load_index(fixture_dir or _config["fixture_dir"])
+    url, params = _redact(url), _normalize_params(params)
+    same_url = [e for e in entries if e["url"] == url]
+    exact = [e for e in same_url if e.get("params") == params]
+    candidates = exact or same_url
+    if not candidates:
+        return None
+    return max(candidates, key=lambda e: e.get("recorded_at") or "")
+
+
+def record_fixture(url, params, response, fixture_dir=None):
+    """응답 원본을 fixture 폴더에 저장하고 index.json에 추가 (같은 요청은 덮어씀)"""
+    fixture_dir = fixture_dir or _config["fixture_dir"]
+    os.makedirs(fixture_dir, exist_ok=True)
+    url, params = _redact(url), _normalize_params(params)
+    parts = urlsplit(url)
+    digest = hashlib.blake2b(
+        json.dumps([url, params], ensure_ascii=False).encode("utf-8"), digest_size=4
+    ).hexdigest()
+    name = f"{parts.hostname}_{digest}.body"
+    with open(os.path.join(fixture_dir, name), "wb") as f:
+        f.write(response.content)
+
+    entry = {
+        "url": url,
+        "params": params,
+        "status": response.status_code,
+        "encoding": response.encoding,
+        "file": name,
+        "recorded_at": datetime.now().isoformat(timespec="seconds"),
+    }
+    with _lock:
+        entries = [
+            e for e in _load_index(fixture_dir)
+            if not (e["url"] == url and e.get("params") == params)
+        ]
+        entries.append(entry)
+        path = os.path.join(fixture_dir, "index.json")
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(entries, f, ensure_ascii=False, indent=1)
+        os.replace(path + ".tmp", path)
+    _count("recorded")
+    return entry
+
+
+def _replay_response(url, params):
+    import requests
+
+    entry = find_fixture(url, params)
+    if entry is None:
+        raise ReplayMiss(f"녹화본 없음: {url} {params or ''}")
+    with open(os.path.join(_config["fixture_dir"], entry["file"]), "rb") as f:
+        body = f.read()
+
+    res = requests.models.Response()
+    res._content = body
+    res.status_code = entry.get("status", 200)
+    res.encoding = entry.get("encoding")
+    res.url = url
+    res.headers["X-Ifam-Replay"] = entry["file"]
+    return res
+
+
+# -----------------------------------------------------------------------------
+# 요청
+# -----------------------------------------------------------------------------
+
+
+def _attempt(url, params, timeout):
+    import requests
+
+    mode = _config["mode"]
+    if mode != "replay":
+        res = requests.get(url, params=params, timeout=timeout)
+        if mode == "record" and res.status_code < 500:
+            record_fixture(url, params, res)
+        return res
+
+    latency = _config["latency_ms"] / 1000
+    if latency:
+        time.sleep(latency * _rng.uniform(0.5, 1.5))
+    if _config["failure_rate"] and _rng.random() < _config["failure_rate"]:
+        _count("injected_failures")
+        raise requests.ConnectionError(f"주입된 실패: {url}")
+    _count("replayed")
+    return _replay_response(url, params)
+
+
+def http_get(url, params=None, timeout=FETCH_TIMEOUT):
+    """
+    requests.get 대체. 연결 오류/타임아웃/5xx는 FETCH_RETRIES번까지 지수 백오프로 재시도,
+    마지막 시도의 예외는 그대로 올린다 (크롤러는 기존처럼 except로 빈 결과 처리).
+    """
+    import requests
+
+    for attempt in range(FETCH_RETRIES + 1):
+        _count("attempts")
+        try:
+            res = _attempt(url, params, timeout)
+            if res.status_code < 500 or attempt == FETCH_RETRIES:
+                return res
+        except (requests.ConnectionError, requests.Timeout):
+            if attempt == FETCH_RETRIES:
+                _count("failed")
+                raise
+        _count("retries")
+        time.sleep(_config["backoff"] * 2**attempt)
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m ifam.fetch", description="크롤러 응답 녹화 / 재생 (오프라인 수집 확인)"
+    )
+    parser.add_argument("--record", action="store_true", help="실제 요청 + 응답 녹화")
+    parser.add_argument("--fixtures", default=FETCH_FIXTURE_DIR, help="fixture 폴더")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="재생 지연 (평균)")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="재생 실패 주입 확률")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    # python -m 실행 시 이 파일은 __main__ → 크롤러가 쓰는 ifam.fetch 모듈의 설정을 바꿔야 함
+    from . import fetch
+    from .crawlers import fetch_realtime_data_with_history
+
+    mode = "record" if args.record else "replay"
+    t0 = time.perf_counter()
+    with fetch.fetch_mode(mode, args.fixtures, args.latency_ms, args.failure_rate, seed=args.seed):
+        data = fetch_realtime_data_with_history()
+    elapsed = time.perf_counter() - t0
+
+    for name, vals in data.items():
+        print(f"  {name:<16} 전일 {vals.get('prev')!s:>12} | 당일 {vals.get('current')!s:>12}")
+    print(f"{mode}: 지표 {len(data)}개 | {elapsed:.2f}s | {fetch.fetch_stats()}")
+    return 0 if data else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
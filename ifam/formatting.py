@@ -0,0 +1,227 @@
+# =============================================================================
+# ifam/formatting.py - 값/변동 표시용 HTML 조각 (대시보드 카드, 리포트 공용) + JSON 직렬화
+# =============================================================================
+
+import math
+
+import pandas as pd
+
+# 대시보드 / 정적 리포트 공용 스타일
+DASHBOARD_CSS = """
+    .main-header {
+        background: linear-gradient(90deg, #0f3460 0%, #1a1a2e 100%);
+        padding: 1.5rem 2rem;
+        border-radius: 15px;
+        margin-bottom: 2rem;
+        border: 1px solid #27ae60;
+    }
+    .main-header h1 { color: #ffffff; font-size: 2rem; margin: 0; }
+    .main-header p { color: #aaaaaa; margin: 0.5rem 0 0 0; font-size: 0.9rem; }
+    .metric-card {
+        background: linear-gradient(145deg, #16213e 0%, #1a1a2e 100%);
+        border-radius: 12px;
+        padding: 1.2rem;
+        border: 1px solid #0f3460;
+        margin-bottom: 1rem;
+    }
+    .metric-card:hover { border-color: #27ae60; }
+    .metric-title { color: #888888; font-size: 0.85rem; margin-bottom: 0.5rem; }
+    .metric-value { color: #ffffff; font-size: 1.5rem; font-weight: 700; margin-bottom: 0.3rem; }
+    .metric-change-up { color: #00d26a; font-size: 0.9rem; font-weight: 600; }
+    .metric-change-down { color: #ff6b6b; font-size: 0.9rem; font-weight: 600; }
+    .metric-change-neutral { color: #888888; font-size: 0.9rem; }
+    .category-header {
+        display: flex;
+        align-items: center;
+        gap: 0.5rem;
+        padding: 0.8rem 1rem;
+        background: linear-gradient(90deg, #0f3460 0%, transparent 100%);
+        border-radius: 8px;
+        margin: 1.5rem 0 1rem 0;
+        border-left: 4px solid;
+    }
+    .category-header h3 { color: #ffffff; margin: 0; font-size: 1.1rem; }
+    .alert-box {
+        background: linear-gradient(90deg, rgba(233, 69, 96, 0.2) 0%, transparent 100%);
+        border-left: 4px solid #e94560;
+        padding: 1rem 1.5rem;
+        border-radius: 0 8px 8px 0;
+        margin-bottom: 1rem;
+    }
+    .alert-box h4 { color: #e94560; margin: 0 0 0.5rem 0; }
+    .alert-item {
+        background: rgba(233,69,96,0.1);
+        padding: 0.8rem;
+        border-radius: 8px;
+        border: 1px solid;
+        margin-bottom: 0.5rem;
+    }
+    .insight-box {
+        background: linear-gradient(145deg, #1a3a5c 0%, #16213e 100%);
+        border-radius: 12px;
+        padding: 1.5rem;
+        border: 1px solid #3498db;
+        margin: 1rem 0;
+    }
+    .insight-box h4 { color: #3498db; margin: 0 0 0.8rem 0; }
+    .insight-box p { color: #ffffff; margin: 0.3rem 0; line-height: 1.6; }
+    .prediction-box {
+        background: linear-gradient(145deg, #1a4a3c 0%, #16213e 100%);
+        border-radius: 12px;
+        padding: 1.5rem;
+        border: 1px solid #27ae60;
+        margin: 1rem 0;
+    }
+    .prediction-box h4 { color: #27ae60; margin: 0 0 0.8rem 0; }
+    .signal-buy {
+        background: linear-gradient(145deg, #1a4a3c 0%, #16213e 100%);
+        border: 2px solid #00d26a;
+        border-radius: 12px;
+        padding: 1rem;
+        text-align: center;
+    }
+    .signal-sell {
+        background: linear-gradient(145deg, #4a1a1a 0%, #16213e 100%);
+        border: 2px solid #ff6b6b;
+        border-radius: 12px;
+        padding: 1rem;
+        text-align: center;
+    }
+    .signal-hold {
+        background: linear-gradient(145deg, #3a3a1a 0%, #16213e 100%);
+        border: 2px solid #f39c12;
+        border-radius: 12px;
+        padding: 1rem;
+        text-align: center;
+    }
+    .summary-card {
+        background: linear-gradient(145deg, #1a2a4a 0%, #16213e 100%);
+        border-radius: 12px;
+        padding: 1.5rem;
+        border: 1px solid #3498db;
+        margin: 0.5rem 0;
+    }
+    .manual-section {
+        background: linear-gradient(145deg, #1a2a3a 0%, #16213e 100%);
+        border-radius: 12px;
+        padding: 1.5rem;
+        border: 1px solid #3498db;
+        margin: 1rem 0;
+    }
+    .manual-section h4 { color: #3498db; margin: 0 0 1rem 0; }
+    .example-box {
+        background: rgba(39, 174, 96, 0.1);
+        border-left: 4px solid #27ae60;
+        padding: 1rem;
+        margin: 0.5rem 0;
+        border-radius: 0 8px 8px 0;
+    }
+    .tip-box {
+        background: rgba(241, 196, 15, 0.1);
+        border-left: 4px solid #f1c40f;
+        padding: 1rem;
+        margin: 0.5rem 0;
+        border-radius: 0 8px 8px 0;
+    }
+    .correlation-strong { color: #00d26a; font-weight: bold; }
+    .correlation-moderate { color: #f39c12; font-weight: bold; }
+    .correlation-weak { color: #888888; }
+"""
+
+
+def format_value(value, fmt, unit=""):
+    if pd.isna(value) or value is None:
+        return "N/A"
+    try:
+        return f"{fmt.format(value)} {unit}"
+    except Exception:
+        return str(value)
+
+
+def get_change_html(change, change_pct, direction, is_rate=False, is_periodic=False):
+    if change is None:
+        return '<span class="metric-change-neutral">-</span>'
+
+    arrow = "▲" if direction == "up" else ("▼" if direction == "down" else "―")
+    css = (
+        "metric-change-up"
+        if direction == "up"
+        else ("metric-change-down" if direction == "down" else "metric-change-neutral")
+    )
+
+    if is_rate:
+        return f'<span class="{css}">{arrow} {abs(change)*100:.1f}bp</span>'
+    elif is_periodic:
+        return f'<span class="{css}">{arrow} {abs(change):.2f}</span>'
+    return f'<span class="{css}">{arrow} {abs(change_pct):.2f}%</span>'
+
+
+def create_metric_card(title, value, change_html, note=""):
+    note_html = f'<div style="color: #666; font-size: 0.75rem;">{note}</div>' if note else ""
+    return f"""
+    <div class="metric-card">
+        <div class="metric-title">{title}</div>
+        <div class="metric-value">{value}</div>
+        <div>{change_html}</div>
+        {note_html}
+    </div>
+    """
+
+
+def create_alert_item(alert):
+    """급변동 알림 1건 카드 (check_alerts 결과 항목)"""
+    direction = "▲" if alert["direction"] == "up" else "▼"
+    color = "#00d26a" if alert["direction"] == "up" else "#ff6b6b"
+
+    prev_str = format_value(
+        alert.get("previous"),
+        alert.get("fmt", "{:,.2f}"),
+        alert.get("unit", ""),
+    )
+    curr_str = format_value(
+        alert.get("current"),
+        alert.get("fmt", "{:,.2f}"),
+        alert.get("unit", ""),
+    )
+
+    # 변동성 기준 알림이면 z-score 표시
+    z_str = f" (z {abs(alert['z']):.1f})" if alert.get("z") is not None else ""
+
+    return f"""
+    <div class="alert-item" style="border-color: {color};">
+        <div style="color: #888; font-size: 0.8rem;">
+            {alert['icon']} {alert['category']}
+        </div>
+        <div style="color: #fff; font-weight: bold; margin-top: 2px;">
+            {alert['indicator']}
+        </div>
+        <div style="display:flex; justify-content:space-between; align-items:center; margin-top: 6px;">
+            <div style="color: {color}; font-weight: bold; font-size: 0.95rem;">
+                {direction} {abs(alert['change_pct']):.2f}%{z_str}
+            </div>
+            <div style="text-align: right; font-size: 0.75rem; line-height: 1.3;">
+                <div style="color:#aaaaaa;">전일: <span style="color:#ffffff;">{prev_str}</span></div>
+                <div style="color:#aaaaaa;">현재: <span style="color:#ffffff;">{curr_str}</span></div>
+            </div>
+        </div>
+    </div>
+    """
+
+
+def to_jsonable(obj):
+    """numpy 스칼라 / NaN / Timestamp / Period 등을 JSON 기본 타입으로 변환"""
+    if isinstance(obj, dict):
+        return {str(k): to_jsonable(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [to_jsonable(v) for v in obj]
+    if obj is None or isinstance(obj, (str, bool, int)):
+        return obj
+    if isinstance(obj, float):
+        if math.isnan(obj) or math.isinf(obj):
+            return None
+        return obj
+    if hasattr(obj, "item") and getattr(obj, "ndim", 1) == 0:  # numpy 스칼라
+        return to_jsonable(obj.item())
+    if hasattr(obj, "isoformat"):
+        return obj.isoformat()
+    return str(obj)
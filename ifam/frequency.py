@@ -0,0 +1,175 @@
+# =============================================================================
+# ifam/frequency.py - 혼합 주기(일간/주간/월간) 처리
+#  - 영업일 그리드에는 관측값만 둠 (결측 칸을 채워 두지 않음, 월간 LNG도 고시된 칸만)
+#    → 최신/직전 값 비교(요약, 알림 스캔, 시그널)에서만 asof_fill / asof_row로 직전 관측을 끌어옴
+# =============================================================================
+
+import numpy as np
+import pandas as pd
+
+from .bizdays import KR_BUSDAYCAL
+from .config import ASOF_FILL_LIMIT, COLUMN_FREQ
+from .perf import timed
+
+
+def asof_fill(values, dates, limit=ASOF_FILL_LIMIT):
+    """
+    (행[, 열]) 배열의 행마다 마지막 관측값 - 그 행 날짜부터 limit영업일 전까지의 관측만 (limit=0이면 그 행 그대로).
+    반환: (as-of 값, 값을 가져온 행 위치 - 관측이 없으면 -1)
+    """
+    values = np.asarray(values, dtype=float)
+    days = np.asarray(dates, dtype="datetime64[D]")
+    shape = (-1,) + (1,) * (values.ndim - 1)
+    rows = np.arange(len(values)).reshape(shape)
+    src = np.where(np.isnan(values), -1, rows)
+    np.maximum.accumulate(src, axis=0, out=src)
+    # 행마다 as-of로 볼 수 있는 가장 이른 행 (날짜가 limit영업일 전 이후)
+    first = np.searchsorted(days, _asof_start(days, limit)).reshape(shape)
+    src = np.where(src >= first, src, -1)
+    filled = np.take_along_axis(values, np.maximum(src, 0), axis=0)
+    return np.where(src >= 0, filled, np.nan), src
+
+
+def asof_row(df, row=-1, limit=ASOF_FILL_LIMIT):
+    """df의 행 위치 row 기준 열별 as-of 값 (Series, 그 행 날짜부터 limit영업일 전까지의 마지막 관측)"""
+    row = row % len(df)
+    days = df["날짜"].to_numpy(dtype="datetime64[D]")
+    lo = int(np.searchsorted(days, _asof_start(days[row], limit)))
+    return df.iloc[lo : row + 1].ffill().iloc[-1]
+
+
+def _asof_start(days, limit):
+    return np.busday_offset(days, -max(limit, 0), roll="forward", busdaycal=KR_BUSDAYCAL)
+
+
+@timed("build_frequency_index")
+def build_frequency_index(df):
+    """
+    일간이 아닌 지표(COLUMN_FREQ 기준, 월간 LNG 등)별로
+    기간(주/월/분기)마다 마지막 관측값의 위치를 미리 계산해 둔다.
+
+    반환 형식:
+    {
+      '탱크로리용': {
+        'freq': 'M',
+        'periods': PeriodIndex(['2025-11', '2025-12'], freq='M'),
+        'dates': 기간 내 마지막 관측일 (datetime64 배열),
+        'values': 기간 마지막 관측값 (float 배열),
+        'rows': df 내 행 위치 (int 배열),
+        'obs_rows' / 'obs_values' / 'obs_dates': 기간과 무관한 전체 관측 (기준일 자르기용),
+      },
+      ...
+    }
+    """
+    index = {}
+    dates = pd.DatetimeIndex(df["날짜"])
+
+    for col, freq in COLUMN_FREQ.items():
+        if freq == "D" or col not in df.columns:
+            continue
+
+        values = df[col].to_numpy(dtype=float)
+        obs_rows = np.flatnonzero(~np.isnan(values))
+        periods = dates[obs_rows].to_period(freq)
+
+        # 기간이 바뀌기 직전 행 = 해당 기간의 마지막 관측
+        is_last = np.ones(len(obs_rows), dtype=bool)
+        is_last[:-1] = periods.asi8[1:] != periods.asi8[:-1]
+        rows = obs_rows[is_last]
+
+        index[col] = {
+            "freq": freq,
+            "periods": periods[is_last],
+            "dates": dates[rows].values,
+            "values": values[rows],
+            "rows": rows,
+            "obs_rows": obs_rows,
+            "obs_values": values[obs_rows],
+            "obs_dates": dates[obs_rows].values,
+        }
+    return index
+
+
+def frequency_index_asof(freq_index, row):
+    """
+    build_frequency_index 결과를 df 행 위치 row(포함)까지로 자른 것
+    (= build_frequency_index(df.iloc[:row + 1])와 같은 결과).
+    전체 기간 인덱스를 한 번만 만들고 과거 기준일별 요약(리포트 백필)에 재사용.
+    """
+    asof = {}
+    for col, entry in freq_index.items():
+        n = int(np.searchsorted(entry["rows"], row, side="right"))
+        k = int(np.searchsorted(entry["obs_rows"], row, side="right"))
+        periods = entry["periods"][:n]
+        dates = entry["dates"][:n]
+        values = entry["values"][:n]
+        rows = entry["rows"][:n]
+
+        # row가 기간 중간이면 그 기간의 '마지막 관측'은 row 이전 마지막 관측
+        if k > 0 and (n == 0 or entry["obs_rows"][k - 1] > rows[-1]):
+            j = k - 1
+            periods = periods.append(entry["periods"][n : n + 1])
+            dates = np.append(dates, entry["obs_dates"][j])
+            values = np.append(values, entry["obs_values"][j])
+            rows = np.append(rows, entry["obs_rows"][j])
+
+        asof[col] = {
+            "freq": entry["freq"],
+            "periods": periods,
+            "dates": dates,
+            "values": values,
+            "rows": rows,
+            "obs_rows": entry["obs_rows"][:k],
+            "obs_values": entry["obs_values"][:k],
+            "obs_dates": entry["obs_dates"][:k],
+        }
+    return asof
+
+
+def get_period_data(freq_index, col):
+    """freq_index에서 최신/직전 기간 값을 O(1)로 조회"""
+    entry = freq_index.get(col)
+    if entry is None or len(entry["rows"]) == 0:
+        return {
+            "value": None,
+            "previous": None,
+            "change": None,
+            "date": None,
+            "prev_period": None,
+            "curr_period": None,
+        }
+
+    latest = entry["values"][-1]
+    if len(entry["rows"]) >= 2:
+        prev = entry["values"][-2]
+        return {
+            "value": latest,
+            "previous": prev,
+            "change": latest - prev,
+            "date": pd.Timestamp(entry["dates"][-1]),
+            "prev_period": entry["periods"][-2],
+            "curr_period": entry["periods"][-1],
+        }
+    return {
+        "value": latest,
+        "previous": None,
+        "change": None,
+        "date": pd.Timestamp(entry["dates"][-1]),
+        "prev_period": None,
+        "curr_period": entry["periods"][-1],
+    }
+
+
+def format_period_note(freq, prev_period, curr_period):
+    """기간 비교 메모: 월간 '(11월→12월)', 주간 '(12/01주→12/08주)', 분기 '(3Q→4Q)'"""
+    if prev_period is None or curr_period is None:
+        return ""
+    if freq == "M":
+        return f"({prev_period.month:02d}월→{curr_period.month:02d}월)"
+    if freq == "W":
+        return (
+            f"({prev_period.start_time:%m/%d}주→{curr_period.start_time:%m/%d}주)"
+        )
+    if freq == "Q":
+        return f"({prev_period.quarter}Q→{curr_period.quarter}Q)"
+    return ""
@@ -0,0 +1,71 @@
+# =============================================================================
+# ifam/grid.py - 데이터 표 페이지 단위 조회 (서버에서 정렬/페이지 자르기) + 주간/월간 집계
+#  - 브라우저에는 현재 페이지 행만 보냄 (히스토리/지표가 늘어도 전송량은 page_size로 고정)
+#  - 날짜 정렬은 이미 정렬된 인덱스를 뒤집어 자르기만 하고, 지표 값 정렬만 argsort
+#  - 집계(resample)는 FrameStore로 만들어 두고 service에서 버전 단위로 캐시
+# =============================================================================
+
+import numpy as np
+import pandas as pd
+
+from .perf import timed
+from .store import FrameStore
+
+GRID_PAGE_SIZES = [25, 50, 100, 250]
+
+# 표시 이름 → pandas resample 규칙 (주간은 금요일 마감 주, 월간은 월말 기준)
+RESAMPLE_RULES = {"일간": None, "주간": "W-FRI", "월간": "ME"}
+RESAMPLE_HOW = {"평균": "mean", "기말": "last"}
+
+
+@timed("resample_store")
+def resample_store(store, rule, how="mean"):
+    """
+    일간 FrameStore → 주간/월간 집계 FrameStore (결측은 집계에서 제외, 빈 기간은 제거).
+    각 기간의 날짜는 달력상 기말이 아니라 실제 마지막 영업일 (진행 중인 기간도 기간 필터에 걸리도록).
+    """
+    frame = store.to_frame().set_index("날짜", drop=False)
+    grouped = frame.resample(rule)
+    result = grouped.last() if how == "last" else grouped[list(store.columns)].mean()
+    result["날짜"] = grouped["날짜"].max()
+    result = result.dropna(subset=list(store.columns), how="all")
+    return FrameStore.from_frame(result.reset_index(drop=True))
+
+
+def page_count(n_rows, page_size):
+    return max(1, -(-n_rows // page_size))
+
+
+def sort_order(view, sort_by="날짜", descending=True):
+    """정렬된 행 위치. 날짜는 slice 뒤집기만, 지표는 안정 정렬 (결측은 항상 맨 뒤)"""
+    n = len(view)
+    if sort_by == "날짜":
+        return np.arange(n - 1, -1, -1) if descending else np.arange(n)
+
+    values = view.column(sort_by)
+    missing = np.isnan(values)
+    keys = -values if descending else values
+    order = np.argsort(keys, kind="stable")
+    return np.concatenate([order[~missing[order]], order[missing[order]]])
+
+
+@timed("grid_page")
+def grid_page(view, page=0, page_size=50, sort_by="날짜", descending=True):
+    """
+    page번째(0부터) 페이지 DataFrame. 해당 행만 블록에서 꺼내고 날짜는 문자열로 표시.
+    """
+    page = min(max(page, 0), page_count(len(view), page_size) - 1)
+    if sort_by == "날짜":
+        # 정렬 없이 연속 구간만 자른다
+        n = len(view)
+        if descending:
+            hi = n - page * page_size
+            rows = np.arange(hi - 1, max(hi - page_size, 0) - 1, -1)
+        else:
+            rows = np.arange(page * page_size, min((page + 1) * page_size, n))
+    else:
+        rows = sort_order(view, sort_by, descending)[page * page_size : (page + 1) * page_size]
+
+    frame = pd.DataFrame(view.values[rows], columns=list(view.columns))
+    frame.insert(0, "날짜", pd.DatetimeIndex(view.dates[rows]).strftime("%Y-%m-%d"))
+    return frame
@@ -0,0 +1,199 @@
+# =============================================================================
+# ifam/loader.py - 데이터 로딩 (엑셀 히스토리 + 크롤링 검증/병합, 영업일 정렬)
+#  - 로딩할 때마다 바뀐 값을 수정 이력(revisions)에 남기고, load_store_asof()로 과거 시점 재현
+# =============================================================================
+
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from .bizdays import (
+    KR_BUSDAYCAL,
+    business_days,
+    latest_business_day,
+    previous_business_day,
+)
+from .cache import memoize
+from .config import DATA_COLUMNS, DATA_PATH, REVISIONS_PATH
+from .crawlers import CRAWL_SOURCES, fetch_realtime_data_with_history
+from .perf import perf_stage, timed
+from .revisions import read_revisions, record_revisions
+from .store import FrameStore, date_slice
+from .validate import quarantine, validate_overlay
+
+
+def build_realtime_overlay(realtime_map, today, yesterday):
+    """
+    크롤링 map({'달러환율': {'current': .., 'prev': ..}, ...})을
+    영업일 인덱스(전일/당일 2행)의 DataFrame으로 변환.
+    """
+    rows = {pd.Timestamp(yesterday): {}, pd.Timestamp(today): {}}
+    for col, vals in realtime_map.items():
+        if col not in DATA_COLUMNS or col == "날짜":
+            continue
+        if vals.get("prev") is not None:
+            rows[pd.Timestamp(yesterday)][col] = vals["prev"]
+        if vals.get("current") is not None:
+            rows[pd.Timestamp(today)][col] = vals["current"]
+    return pd.DataFrame.from_dict(rows, orient="index", dtype=float)
+
+
+@timed("align_to_business_days")
+def align_to_business_days(df, overlay=None):
+    """
+    히스토리(df)와 크롤링 값(overlay)을 영업일 그리드로 정렬.
+
+    1) 주말/휴일에 찍힌 행은 직전 영업일로 당겨서 병합 (해당 영업일 값이 우선, 빈 칸만 채움)
+    2) overlay 값이 있는 칸은 히스토리를 덮어씀 (열 단위)
+    3) 영업일 그리드로 reindex - 모든 지표가 관측값만 (결측 칸은 채우지 않음)
+       - 일간: 상관/회귀/변동성에 복사값의 0 변동이 섞이지 않음,
+         최신/직전 비교는 frequency.asof_row / asof_fill로 그때만 직전 관측을 끌어옴
+       - 주간·월간(LNG 등): frequency.build_frequency_index가 실제 고시된 칸만 기간 관측으로 봄
+         (채워 두면 고시가 없는 달도 '변동 0'인 새 기간으로 잡힘)
+    """
+    value_cols = [c for c in DATA_COLUMNS if c != "날짜"]
+
+    if df is not None and len(df) > 0:
+        df = df.dropna(subset=["날짜"]).sort_values("날짜", kind="stable")
+        snapped = np.busday_offset(
+            df["날짜"].values.astype("datetime64[D]"),
+            0,
+            roll="backward",
+            busdaycal=KR_BUSDAYCAL,
+        )
+        values = df[value_cols].set_axis(pd.DatetimeIndex(snapped), axis=0)
+        values = values.groupby(level=0, sort=True).first().dropna(how="all")
+    else:
+        values = pd.DataFrame(columns=value_cols, dtype=float)
+
+    if overlay is not None and len(overlay) > 0:
+        values = overlay.combine_first(values)
+
+    values = values.reindex(columns=value_cols)
+    if len(values) == 0:
+        return pd.DataFrame(columns=DATA_COLUMNS)
+
+    grid = business_days(values.index.min(), values.index.max())
+    values = values.reindex(grid)
+
+    values.index.name = "날짜"
+    return values.reset_index()
+
+
+@timed("read_history")
+def read_history(path=DATA_PATH):
+    """엑셀 히스토리(Data 시트) 로드. 파일이 없거나 읽지 못하면 None"""
+    try:
+        with perf_stage("load_data.excel"):
+            base_df = pd.read_excel(
+                path,
+                sheet_name="Data",
+                skiprows=4,
+                usecols="B:AE",
+                engine="openpyxl",
+            )
+        base_df.columns = DATA_COLUMNS
+        base_df["날짜"] = pd.to_datetime(base_df["날짜"], errors="coerce")
+        base_df = base_df.dropna(subset=["날짜"])
+        base_df = base_df.sort_values("날짜").reset_index(drop=True)
+
+        numeric_cols = [c for c in base_df.columns if c != "날짜"]
+        for col in numeric_cols:
+            base_df[col] = pd.to_numeric(base_df[col], errors="coerce")
+        return base_df
+    except Exception:
+        return None
+
+
+@timed("load_data", cached=True)
+@memoize(ttl=600)
+def load_data(path=DATA_PATH, crawl=True):
+    """
+    1) 엑셀 파일(path)에서 히스토리 로드 (가능하면)
+    2) fetch_realtime_data_with_history()로 오늘/전일(영업일) 데이터 로드 (crawl=False면 생략)
+    3) 오늘/전일 값 검증 (validate_overlay) - 히스토리와 맞지 않는 값은 격리하고 병합에서 제외
+    4) 엑셀/크롤링 값 중 바뀐 칸을 수정 이력에 기록 (record_revisions)
+    5) 영업일 그리드로 정렬하면서 오늘/전일 값을 열 단위로 덮어써서 최종 df 반환
+    엑셀도 없고 크롤링도 실패하면 None
+    """
+    base_df = read_history(path)
+
+    realtime_map = fetch_realtime_data_with_history() if crawl else {}
+
+    if not realtime_map and base_df is None:
+        return None
+
+    # 주말/휴일에는 직전 영업일을 '당일'로 본다
+    calendar_today = datetime.today().date()
+    today = latest_business_day(calendar_today)
+    yesterday = previous_business_day(today)
+
+    if base_df is not None and len(base_df) > 0:
+        base_df = base_df.iloc[date_slice(base_df["날짜"], end=calendar_today)]
+
+    overlay = (
+        build_realtime_overlay(realtime_map, today, yesterday) if realtime_map else None
+    )
+    if overlay is not None:
+        # 히스토리와 맞지 않는 크롤링 값은 덮어쓰지 않고 격리
+        overlay, suspects = validate_overlay(base_df, overlay)
+        quarantine(suspects)
+
+    # 엑셀을 먼저 기록 → 같은 시각이면 크롤링 값이 나중 이력으로 이김 (병합 우선순위와 동일)
+    # 기본 엑셀이 아닌 파일(벤치/임시 사본)은 이력에 섞지 않음
+    if path == DATA_PATH:
+        added = record_revisions(base_df, "excel", overlay=overlay) + record_revisions(
+            overlay, "crawl"
+        )
+        if added:
+            load_store_asof.clear()
+
+    return _drop_empty_rows(align_to_business_days(base_df, overlay))
+
+
+def _drop_empty_rows(df):
+    """핵심 지표가 전부 NaN인 행 제거"""
+    key_cols = ["달러환율", "육지 SMP", "두바이유"]
+    existing_keys = [c for c in key_cols if c in df.columns]
+    if existing_keys:
+        mask = df[existing_keys].notna().any(axis=1)
+        df = df[mask].reset_index(drop=True)
+    return df
+
+
+@timed("load_store", cached=True)
+@memoize(ttl=600)
+def load_store(path=DATA_PATH, crawl=True):
+    """load_data() 결과를 FrameStore로 변환해 프로세스 전체(모든 세션/배치/API)가 공유"""
+    df = load_data(path, crawl)
+    if df is None or len(df) == 0:
+        return None
+    return FrameStore.from_frame(df)
+
+
+@timed("load_store_asof", cached=True)
+@memoize(ttl=600, maxsize=16)
+def load_store_asof(when=None, path=REVISIONS_PATH):
+    """
+    수정 이력에서 when 시점(수집 시각 기준, None이면 최신)에 알고 있던 값만으로
+    load_store()와 같은 FrameStore 재구성. 백테스트/과거 화면 재현용
+    (이후에 수정·추가된 값은 섞이지 않음). 그 시점 이력이 없으면 None
+    """
+    frame = read_revisions(path).asof(when)
+    if len(frame) == 0:
+        return None
+    df = _drop_empty_rows(align_to_business_days(frame))
+    return FrameStore.from_frame(df) if len(df) else None
+
+
+def refresh_sources(sources=None):
+    """
+    선택한 크롤링 소스(CRAWL_SOURCES 키, None이면 전부)의 캐시만 비우고 병합 데이터를 다시 만들게 함.
+    엑셀 히스토리는 load_data가 다시 읽는다. 분석 캐시는 데이터 버전 키라 내용이 같으면 그대로 재사용.
+    """
+    for source in CRAWL_SOURCES if sources is None else sources:
+        CRAWL_SOURCES[source][1].clear()
+    fetch_realtime_data_with_history.clear()
+    load_data.clear()
+    load_store.clear()
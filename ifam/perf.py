@@ -0,0 +1,137 @@
+# =============================================================================
+# ifam/perf.py - 성능 계측 (IFAM_PERF=1 환경변수 또는 URL ?perf=1 일 때만 기록, 평소엔 분기 1번)
+#  - Streamlit/pandas 없이 동작 (결과 크기는 nbytes/memory_usage 덕 타이핑으로 추정)
+# =============================================================================
+
+import contextvars
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+PERF_ENV_ENABLED = os.environ.get("IFAM_PERF", "") == "1"
+PERF_LOG_PATH = os.environ.get("IFAM_PERF_LOG", "")  # 지정 시 JSON lines로 계속 추가 기록
+
+_perf_run = contextvars.ContextVar("perf_run", default=None)
+_perf_log_lock = threading.Lock()
+
+
+def perf_begin(enabled):
+    """스크립트 실행 1회분 계측 시작. enabled=False면 이후 계측 호출은 전부 그냥 통과"""
+    run = (
+        {"id": f"{time.time_ns():x}", "records": [], "stack": []} if enabled else None
+    )
+    _perf_run.set(run)
+    return run
+
+
+def perf_context():
+    """
+    스레드 풀 작업용 context 복사본 (pool.submit(perf_context().run, fn, ...)).
+    ContextVar는 풀 스레드로 넘어가지 않으므로 현재 계측 run을 이어받게 하고,
+    작업마다 스택만 따로 둠 (records는 공유 - list.append는 스레드 안전, 스택은 동시 push/pop 불가)
+    """
+    ctx = contextvars.copy_context()
+    run = ctx.get(_perf_run)
+    if run is not None:
+        ctx.run(_perf_run.set, {**run, "stack": list(run["stack"])})
+    return ctx
+
+
+def payload_size(obj, _depth=0):
+    """결과 객체 크기(bytes) 추정 - DataFrame/ndarray는 실제 버퍼 크기, 컨테이너는 재귀 합"""
+    if obj is None:
+        return 0
+    if hasattr(obj, "memory_usage") and hasattr(obj, "columns"):  # DataFrame
+        return int(obj.memory_usage(index=True, deep=False).sum())
+    if hasattr(obj, "nbytes") and not isinstance(obj, (int, float)):  # ndarray, Series, FrameStore
+        return int(obj.nbytes)
+    if _depth < 3 and isinstance(obj, dict):
+        return sys.getsizeof(obj) + sum(
+            payload_size(v, _depth + 1) for v in obj.values()
+        )
+    if _depth < 3 and isinstance(obj, (list, tuple)):
+        return sys.getsizeof(obj) + sum(payload_size(v, _depth + 1) for v in obj)
+    return sys.getsizeof(obj)
+
+
+def _perf_emit(run, rec):
+    run["records"].append(rec)
+    if PERF_LOG_PATH:
+        line = json.dumps(rec, ensure_ascii=False, default=str)
+        with _perf_log_lock, open(PERF_LOG_PATH, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+
+@contextmanager
+def perf_stage(stage):
+    """구간 계측 (with perf_stage("chart.heatmap"): ...). 계측 꺼져 있으면 None"""
+    run = _perf_run.get()
+    if run is None:
+        yield None
+        return
+
+    rec = {
+        "run": run["id"],
+        "stage": stage,
+        "depth": len(run["stack"]),
+        "cache": None,
+        "bytes": None,
+    }
+    run["stack"].append(rec)
+    t0 = time.perf_counter()
+    try:
+        yield rec
+    finally:
+        rec["ms"] = round((time.perf_counter() - t0) * 1000, 3)
+        rec["ts"] = datetime.now().isoformat(timespec="milliseconds")
+        run["stack"].pop()
+        _perf_emit(run, rec)
+
+
+def timed(stage, cached=False):
+    """
+    함수 단위 계측 데코레이터 (소요 시간 + 결과 크기).
+    cached=True면 캐시 데코레이터(memoize / st.cache_data) 바깥에 붙여 hit/miss를 기록
+    (memoize는 miss를 직접 표시, st.cache_data는 안쪽에 cache_probe를 붙임).
+    """
+
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if _perf_run.get() is None:
+                return fn(*args, **kwargs)
+            with perf_stage(stage) as rec:
+                if cached:
+                    rec["cache"] = "hit"
+                result = fn(*args, **kwargs)
+                rec["bytes"] = payload_size(result)
+            return result
+
+        if hasattr(fn, "clear"):
+            wrapper.clear = fn.clear
+        return wrapper
+
+    return decorator
+
+
+def mark_cache_miss():
+    """캐시 안쪽에서 실제 계산이 일어났음을(=miss) 가장 안쪽 계측 구간에 표시"""
+    run = _perf_run.get()
+    if run is not None and run["stack"]:
+        run["stack"][-1]["cache"] = "miss"
+
+
+def cache_probe(fn):
+    """st.cache_data 안쪽에 붙여서 함수 본문이 실행되면(=miss) 바깥 timed 기록에 표시"""
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        mark_cache_miss()
+        return fn(*args, **kwargs)
+
+    return wrapper
@@ -0,0 +1,135 @@
+# =============================================================================
+# ifam/regimes.py - 구조 변화(국면 전환) 탐지 (PELT, 구간 비용은 누적합으로 O(1))
+#  - 상관/회귀는 학습 기간 동안 관계가 하나라고 가정 → SMP/REC/금리처럼 국면이 바뀌면 섞인다
+#  - 지표별 수준(level)을 표준화해서 평균이 옮겨 간 시점을 찾음
+#      구간 비용  L2 (Σx² - (Σx)²/n, 누적합 2개로 구간마다 O(1))
+#      벌점       REGIME_PENALTY × log(n) (표준화된 값 기준이라 지표 단위와 무관)
+#      최소 구간  REGIME_MIN_SIZE 관측 (일시적 급등락은 국면으로 보지 않음)
+#    PELT 가지치기로 후보 시점을 줄여 관측치 수에 거의 선형
+#  - 지표별 계산은 서로 독립 → 관측치가 REGIME_POOL_MIN_POINTS 이상이면 프로세스 풀에 나눠 실행
+#    (실제 히스토리는 지표당 수십 ms라 프로세스 기동 비용이 더 큼 → 순차 실행)
+#  - 결과는 service.cached_regimes에서 데이터 버전 단위로 캐시
+#      예측 분석 학습 기간 "최근 국면" (latest_break) / 지표 차트의 변화 시점 표시
+# =============================================================================
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+import pandas as pd
+
+from .config import KEY_INDICATORS, REGIME_MIN_SIZE, REGIME_PENALTY
+from .perf import timed
+
+REGIME_POOL_MIN_POINTS = 50_000  # 전체 관측치가 이보다 적으면 순차 실행
+REGIME_MAX_WORKERS = 4
+
+
+def pelt(x, penalty, min_size=REGIME_MIN_SIZE):
+    """
+    1차원 시계열 x의 평균 변화점 (L2 비용 PELT). 반환: 새 구간이 시작되는 위치 (오름차순, 0 제외)
+    """
+    n = len(x)
+    if n < 2 * min_size:
+        return np.empty(0, dtype=np.intp)
+    cs = np.concatenate([[0.0], np.cumsum(x)])
+    cs2 = np.concatenate([[0.0], np.cumsum(x * x)])
+
+    # best[t]: x[:t]를 나누는 최소 비용, prev[t]: 그때 마지막 구간의 시작 위치
+    best = np.full(n + 1, np.inf)
+    best[0] = -penalty
+    prev = np.zeros(n + 1, dtype=np.intp)
+    candidates = np.empty(0, dtype=np.intp)
+    for t in range(min_size, n + 1):
+        if np.isfinite(best[t - min_size]):
+            candidates = np.append(candidates, t - min_size)
+        length = t - candidates
+        total = cs[t] - cs[candidates]
+        cost = best[candidates] + (cs2[t] - cs2[candidates]) - total * total / length
+        k = np.argmin(cost)
+        best[t] = cost[k] + penalty
+        prev[t] = candidates[k]
+        # 지금 최적보다 나쁜 후보는 이후 어떤 t에서도 최적이 될 수 없음
+        candidates = candidates[cost <= best[t]]
+
+    breaks = []
+    t = prev[n]
+    while t > 0:
+        breaks.append(t)
+        t = prev[t]
+    return np.array(breaks[::-1], dtype=np.intp)
+
+
+def _detect(job):
+    """프로세스 풀 작업 단위: (관측값, 벌점 계수, 최소 구간) → 변화점 위치"""
+    x, penalty, min_size = job
+    std = x.std()
+    if len(x) == 0 or std == 0:
+        return np.empty(0, dtype=np.intp)
+    z = (x - x.mean()) / std
+    return pelt(z, penalty * np.log(len(z)), min_size)
+
+
+def _run_jobs(jobs, workers):
+    if workers is None:
+        workers = (
+            min(len(jobs), os.cpu_count() or 1, REGIME_MAX_WORKERS)
+            if sum(len(x) for x, _, _ in jobs) >= REGIME_POOL_MIN_POINTS
+            else 1
+        )
+    if workers > 1:
+        # spawn: Streamlit 서버처럼 스레드가 도는 프로세스에서 fork하지 않도록
+        try:
+            with ProcessPoolExecutor(
+                workers, mp_context=multiprocessing.get_context("spawn")
+            ) as pool:
+                return list(pool.map(_detect, jobs))
+        except (OSError, BrokenProcessPool):
+            pass  # 프로세스를 못 띄우는 환경이면 순차 실행
+    return [_detect(job) for job in jobs]
+
+
+@timed("detect_regimes")
+def detect_regimes(
+    store, columns=None, penalty=REGIME_PENALTY, min_size=REGIME_MIN_SIZE, workers=None
+):
+    """
+    지표별 구조 변화 시점 + 구간 요약 (columns 기본값 KEY_INDICATORS, 결측은 빼고 관측치 기준).
+    반환: {지표: {'breaks': datetime64 배열 (새 국면 시작일),
+                  'segments': [{'start', 'end', 'mean', 'std', 'n'}, ...]}}
+    """
+    columns = [c for c in (columns or KEY_INDICATORS) if c in store.offsets]
+    series = []
+    for col in columns:
+        values = store.column(col).astype(np.float64)
+        observed = ~np.isnan(values)
+        series.append((store.dates[observed], values[observed]))
+
+    positions = _run_jobs([(x, penalty, min_size) for _, x in series], workers)
+
+    result = {}
+    for col, (dates, x), breaks in zip(columns, series, positions):
+        edges = np.concatenate([[0], breaks, [len(x)]]).astype(np.intp)
+        segments = [
+            {
+                "start": pd.Timestamp(dates[lo]),
+                "end": pd.Timestamp(dates[hi - 1]),
+                "mean": float(x[lo:hi].mean()),
+                "std": float(x[lo:hi].std()),
+                "n": int(hi - lo),
+            }
+            for lo, hi in zip(edges[:-1], edges[1:])
+            if hi > lo
+        ]
+        result[col] = {"breaks": dates[breaks], "segments": segments}
+    return result
+
+
+def latest_break(regimes, columns):
+    """columns 중 가장 최근 구조 변화 시점 (모든 지표가 현재 국면에 있는 시작일, 없으면 None)"""
+    latest = [
+        regimes[c]["breaks"][-1] for c in columns if c in regimes and len(regimes[c]["breaks"])
+    ]
+    return pd.Timestamp(max(latest)) if latest else None
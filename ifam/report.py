@@ -0,0 +1,417 @@
+# =============================================================================
+# ifam/report.py - 데일리 리포트 배치 생성 (정적 HTML / Excel)
+#  - 대시보드를 열어 알림 박스/지표 카드를 캡처하던 아침 루틴을 대체
+#  - load → get_summary → check_alerts → 주간 트렌드 → 투자 시그널을 Streamlit 없이 실행
+#  - 과거 기간 백필: 프레임은 1번만 로드하고, 롤링 평균/표준편차와 혼합 주기 인덱스도
+#    전체 기간에 대해 1번 계산한 뒤 기준일별로는 해당 행만 꺼내 쓴다
+#
+# 사용법 (저장소 루트에서):
+#   python -m ifam.report                                  # 최신 영업일 (reports/)
+#   python -m ifam.report --date 2026-10-16 --format html
+#   python -m ifam.report --start 2026-09-01 --end 2026-09-30 --no-crawl
+# =============================================================================
+
+import argparse
+import os
+import re
+import sys
+import time
+from datetime import datetime
+
+import pandas as pd
+
+from .alerts import build_vol_state, sigma_at
+from .config import ALERT_MODE, DATA_PATH, PROJECT_ROOT
+from .formatting import (
+    DASHBOARD_CSS,
+    create_alert_item,
+    create_metric_card,
+    format_value,
+    get_change_html,
+)
+from .frequency import asof_row, build_frequency_index, frequency_index_asof
+from .loader import load_data
+from .perf import timed
+from .signals import (
+    ANALYSIS_COLUMNS,
+    MARKET_SUMMARY_INDICATORS,
+    SIGNAL_COLUMNS,
+    analysis_points_from_stats,
+    market_summary_from_stats,
+    signals_from_stats,
+)
+from .store import date_slice
+from .summary import check_alerts, get_summary
+
+REPORT_DIR = os.path.join(PROJECT_ROOT, "reports")
+
+# 대시보드와 같은 기간 (투자 시그널 30일 / 주간 트렌드 7일 / 종합 분석 90일)
+SIGNAL_DAYS = 30
+MARKET_DAYS = 7
+ANALYSIS_DAYS = 90
+
+
+# =============================================================================
+# 리포트 계산
+# =============================================================================
+
+
+@timed("prepare_report_context")
+def prepare_report_context(df, alert_mode=ALERT_MODE):
+    """
+    기준일과 무관한 계산을 전체 기간에 대해 한 번만 수행.
+    롤링 창은 행 수 기준이라 df.tail(days)와 같은 구간을 본다 (결측은 평균/표준편차에서 제외).
+    변동성 기준 알림이면 EWMA 상태도 전체 기간에 대해 한 번만 만든다.
+    """
+    market_cols = [c for c in MARKET_SUMMARY_INDICATORS if c in df.columns]
+    signal_window = df[SIGNAL_COLUMNS].rolling(SIGNAL_DAYS, min_periods=1)
+    return {
+        "df": df,
+        "dates": df["날짜"].to_numpy(),
+        "freq_index": build_frequency_index(df),
+        "vol_state": build_vol_state(df) if alert_mode == "adaptive" else None,
+        "signal_mean": signal_window.mean(),
+        "signal_std": signal_window.std(),
+        "market_mean": df[market_cols].rolling(MARKET_DAYS, min_periods=1).mean(),
+        "analysis_mean": (
+            df[ANALYSIS_COLUMNS].rolling(ANALYSIS_DAYS, min_periods=1).mean()
+        ),
+    }
+
+
+def build_daily_report(ctx, pos):
+    """
+    df 행 위치 pos를 기준일로 한 리포트 데이터.
+    대시보드가 df.iloc[:pos + 1]에 대해 계산하는 것과 같은 결과를 롤링 통계에서 꺼내 만든다.
+    """
+    df = ctx["df"]
+    n = pos + 1
+    latest = asof_row(df, pos)
+
+    summary = get_summary(
+        df.iloc[:n], freq_index=frequency_index_asof(ctx["freq_index"], pos)
+    )
+
+    market = None
+    if n >= MARKET_DAYS:
+        # 직전 구간: 데이터가 2주치 이상이면 바로 앞 7행, 아니면 처음 7행
+        prev_pos = pos - MARKET_DAYS if n >= MARKET_DAYS * 2 else MARKET_DAYS - 1
+        market = market_summary_from_stats(
+            latest,
+            ctx["market_mean"].iloc[pos],
+            ctx["market_mean"].iloc[prev_pos],
+        )
+
+    signals = []
+    if n >= SIGNAL_DAYS:
+        signals = signals_from_stats(
+            latest, ctx["signal_mean"].iloc[pos], ctx["signal_std"].iloc[pos]
+        )
+
+    return {
+        "date": pd.Timestamp(latest["날짜"]),
+        "summary": summary,
+        "alerts": check_alerts(
+            summary,
+            sigma=sigma_at(ctx["vol_state"], pos) if ctx["vol_state"] is not None else None,
+        ),
+        "market_summary": market,
+        "signals": signals,
+        "analysis_points": analysis_points_from_stats(
+            latest, ctx["analysis_mean"].iloc[pos]
+        ),
+    }
+
+
+def report_positions(dates, date=None, start=None, end=None):
+    """기준일(들)에 해당하는 df 행 위치. 휴일/주말이면 직전 영업일 행"""
+    if start is not None or end is not None:
+        sl = date_slice(dates, start, end)
+        return list(range(max(sl.start, 1), sl.stop))
+    if date is None:
+        return [len(dates) - 1]
+    pos = date_slice(dates, end=date).stop - 1
+    return [pos] if pos >= 1 else []
+
+
+# =============================================================================
+# 출력 (HTML / Excel)
+# =============================================================================
+
+REPORT_PAGE_CSS = """
+    body { background: #0e1117; color: #fafafa; font-family: "Noto Sans KR", sans-serif;
+           max-width: 1200px; margin: 0 auto; padding: 2rem; }
+    .grid { display: grid; grid-template-columns: repeat(4, 1fr); gap: 0.8rem; }
+    .grid-5 { display: grid; grid-template-columns: repeat(5, 1fr); gap: 0.8rem; }
+    .signal-buy, .signal-sell, .signal-hold { margin-bottom: 0.8rem; }
+    h2 { color: #ffffff; font-size: 1.3rem; margin-top: 2rem; }
+    li { margin: 0.3rem 0; }
+"""
+
+SIGNAL_STYLE = {
+    "BUY": ("signal-buy", "🟢", "매수 적기"),
+    "SELL": ("signal-sell", "🔴", "매도 고려"),
+}
+
+
+def _markdown_bold(text):
+    return re.sub(r"\*\*(.+?)\*\*", r"<b>\1</b>", text)
+
+
+def render_html(report):
+    """대시보드와 같은 카드 스타일의 단일 HTML 문서"""
+    day = report["date"]
+    parts = [
+        f"""
+    <div class="main-header">
+        <h1>🌱 데일리 지표 리포트</h1>
+        <p>📅 기준일: {day:%Y년 %m월 %d일} | 생성: {datetime.now():%Y-%m-%d %H:%M} | 인프라프론티어자산운용(주)</p>
+    </div>
+    """
+    ]
+
+    alerts = report["alerts"]
+    if alerts:
+        parts.append(
+            f'<div class="alert-box"><h4>🚨 급변동 알림 ({len(alerts)}건) - 기준일 대비</h4></div>'
+        )
+        parts.append(
+            '<div class="grid">' + "".join(create_alert_item(a) for a in alerts) + "</div>"
+        )
+
+    market = report["market_summary"]
+    if market:
+        parts.append("<h2>📊 주간 시장 트렌드</h2>")
+        cards = []
+        for data_m in market.values():
+            trend = data_m["trend"]
+            color = "#00d26a" if trend == "상승" else ("#ff6b6b" if trend == "하락" else "#888")
+            arrow = "↑" if trend == "상승" else ("↓" if trend == "하락" else "→")
+            cards.append(
+                f"""
+                <div class="summary-card">
+                    <div style="color: #888; font-size: 0.8rem;">{data_m['name']}</div>
+                    <div style="color: #fff; font-size: 1.3rem; font-weight: bold;">{data_m['format'].format(data_m['current'])} {data_m['unit']}</div>
+                    <div style="color: {color};">{arrow} {trend} ({data_m['change_pct']:+.1f}%)</div>
+                </div>
+                """
+            )
+        parts.append('<div class="grid-5">' + "".join(cards) + "</div>")
+
+    for category, data_c in report["summary"].items():
+        parts.append(
+            f"""
+        <div class="category-header" style="border-color: {data_c['color']};">
+            <span style="font-size: 1.5rem;">{data_c['icon']}</span>
+            <h3>{category}</h3>
+        </div>
+        """
+        )
+        is_rate = category in ["금리", "스왑"]
+        cards = []
+        for col_name, ind in data_c["indicators"].items():
+            change_html = get_change_html(
+                ind["change"],
+                ind["change_pct"],
+                ind["direction"],
+                is_rate,
+                ind.get("is_periodic", False),
+            )
+            cards.append(
+                create_metric_card(
+                    col_name,
+                    format_value(ind["value"], ind["format"], ind["unit"]),
+                    change_html,
+                    ind.get("note", ""),
+                )
+            )
+        parts.append('<div class="grid">' + "".join(cards) + "</div>")
+
+    parts.append("<h2>🔔 투자 의사결정 시그널</h2>")
+    if report["signals"]:
+        for signal in report["signals"]:
+            css_class, icon, label = SIGNAL_STYLE.get(
+                signal["signal"], ("signal-hold", "🟡", "관망")
+            )
+            parts.append(
+                f"""
+            <div class="{css_class}">
+                <div style="font-size: 2rem;">{icon}</div>
+                <div style="color: #fff; font-size: 1.2rem; font-weight: bold;">{signal['category']} - {signal['indicator']}</div>
+                <div style="color: #fff; font-size: 1.5rem; font-weight: bold;">{label}</div>
+                <div style="color: #aaa; margin-top: 0.5rem;">{signal['reason']}</div>
+                <div style="color: #888; font-size: 0.8rem;">신호 강도: {signal['strength']}</div>
+            </div>
+            """
+            )
+    else:
+        parts.append("<p>현재 특별한 투자 시그널이 없습니다.</p>")
+
+    parts.append("<h2>📋 종합 시장 분석</h2>")
+    if report["analysis_points"]:
+        parts.append(
+            "<ul>"
+            + "".join(f"<li>{_markdown_bold(p)}</li>" for p in report["analysis_points"])
+            + "</ul>"
+        )
+    else:
+        parts.append("<p>시장이 전반적으로 안정적입니다.</p>")
+
+    return f"""<!DOCTYPE html>
+<html lang="ko">
+<head>
+<meta charset="utf-8">
+<title>데일리 지표 리포트 {day:%Y-%m-%d}</title>
+<style>{DASHBOARD_CSS}{REPORT_PAGE_CSS}</style>
+</head>
+<body>
+{"".join(parts)}
+</body>
+</html>
+"""
+
+
+ALERT_SHEET_COLUMNS = ["카테고리", "지표", "방향", "변동률(%)", "이전", "현재", "단위"]
+SIGNAL_SHEET_COLUMNS = ["분야", "지표", "시그널", "강도", "근거"]
+
+
+def report_tables(report):
+    """Excel 시트별 표 {시트명: DataFrame}"""
+    indicators = [
+        {
+            "카테고리": category,
+            "지표": col_name,
+            "값": ind["value"],
+            "이전": ind["previous"],
+            "변동": ind["change"],
+            "변동률(%)": None if ind.get("is_periodic") else ind["change_pct"],
+            "단위": ind["unit"],
+            "비고": ind.get("note", ""),
+        }
+        for category, data_c in report["summary"].items()
+        for col_name, ind in data_c["indicators"].items()
+    ]
+    alerts = [
+        {
+            "카테고리": a["category"],
+            "지표": a["indicator"],
+            "방향": a["direction"],
+            "변동률(%)": a["change_pct"],
+            "이전": a["previous"],
+            "현재": a["current"],
+            "단위": a["unit"],
+        }
+        for a in report["alerts"]
+    ]
+    market = [
+        {
+            "지표": m["name"],
+            "현재": m["current"],
+            "7일 평균": m["avg"],
+            "직전 7일 평균": m["prev_avg"],
+            "변동률(%)": m["change_pct"],
+            "추세": m["trend"],
+            "단위": m["unit"],
+        }
+        for m in (report["market_summary"] or {}).values()
+    ]
+    signals = [
+        {
+            "분야": s["category"],
+            "지표": s["indicator"],
+            "시그널": s["signal"],
+            "강도": s["strength"],
+            "근거": s["reason"],
+        }
+        for s in report["signals"]
+    ]
+    analysis = [{"내용": p.replace("**", "")} for p in report["analysis_points"]]
+    return {
+        "지표현황": pd.DataFrame(indicators),
+        "급변동알림": pd.DataFrame(alerts, columns=ALERT_SHEET_COLUMNS),
+        "주간트렌드": pd.DataFrame(market),
+        "투자시그널": pd.DataFrame(signals, columns=SIGNAL_SHEET_COLUMNS),
+        "종합분석": pd.DataFrame(analysis, columns=["내용"]),
+    }
+
+
+def write_report(report, out_dir, formats=("html", "xlsx")):
+    """기준일 리포트를 out_dir/daily_report_YYYYMMDD.{html,xlsx}로 저장, 경로 목록 반환"""
+    os.makedirs(out_dir, exist_ok=True)
+    stem = os.path.join(out_dir, f"daily_report_{report['date']:%Y%m%d}")
+    paths = []
+    if "html" in formats:
+        with open(f"{stem}.html", "w", encoding="utf-8") as f:
+            f.write(render_html(report))
+        paths.append(f"{stem}.html")
+    if "xlsx" in formats:
+        with pd.ExcelWriter(f"{stem}.xlsx", engine="openpyxl") as writer:
+            overview = {
+                "항목": ["기준일", "생성 시각"],
+                "값": [f"{report['date']:%Y-%m-%d}", f"{datetime.now():%Y-%m-%d %H:%M}"],
+            }
+            pd.DataFrame(overview).to_excel(writer, sheet_name="개요", index=False)
+            for sheet, table in report_tables(report).items():
+                table.to_excel(writer, sheet_name=sheet, index=False)
+        paths.append(f"{stem}.xlsx")
+    return paths
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m ifam.report", description="데일리 지표 리포트 (HTML / Excel) 생성"
+    )
+    parser.add_argument("--date", help="기준일 YYYY-MM-DD (기본: 최신 영업일)")
+    parser.add_argument("--start", help="백필 시작일 YYYY-MM-DD")
+    parser.add_argument("--end", help="백필 종료일 YYYY-MM-DD (기본: 최신)")
+    parser.add_argument("--out", default=REPORT_DIR, help="출력 폴더 (기본: reports/)")
+    parser.add_argument(
+        "--format", nargs="+", choices=["html", "xlsx"], default=["html", "xlsx"]
+    )
+    parser.add_argument("--data", default=DATA_PATH, help="엑셀 히스토리 경로")
+    parser.add_argument(
+        "--no-crawl", action="store_true", help="크롤링 없이 엑셀 히스토리만 사용"
+    )
+    parser.add_argument(
+        "--alert-mode",
+        choices=["fixed", "adaptive"],
+        default=ALERT_MODE,
+        help="급변동 알림 기준 (고정 임계값 / 변동성 대비 z-score)",
+    )
+    args = parser.parse_args(argv)
+
+    t0 = time.perf_counter()
+    df = load_data(args.data, crawl=not args.no_crawl)
+    if df is None or len(df) < 2:
+        print("❌ 엑셀 파일도 없고, 실시간 데이터도 불러오지 못했습니다.", file=sys.stderr)
+        return 1
+    t_load = time.perf_counter() - t0
+
+    ctx = prepare_report_context(df, args.alert_mode)
+    positions = report_positions(ctx["dates"], args.date, args.start, args.end)
+    if not positions:
+        print("해당 기간에 리포트를 만들 데이터가 없습니다.", file=sys.stderr)
+        return 1
+
+    t1 = time.perf_counter()
+    for pos in positions:
+        report = build_daily_report(ctx, pos)
+        for path in write_report(report, args.out, args.format):
+            print(path)
+
+    elapsed = time.perf_counter() - t1
+    print(
+        f"리포트 {len(positions)}건 | 데이터 로드 {t_load:.1f}s | "
+        f"생성 {elapsed:.2f}s ({elapsed / len(positions) * 1000:.0f} ms/건)",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,292 @@
+# =============================================================================
+# ifam/revisions.py - 값 수정 이력 (관측일 × 수집 시각) + 시점(as-of) 조회
+#  - load_data()는 전일/당일을 크롤링 값으로 덮어쓰고, 엑셀도 나중에 고쳐질 수 있음
+#    → 최종 df만으로는 "그날 아침 화면에 보였던 값"을 재현할 수 없다
+#  - load_data()가 돌 때마다 엑셀/크롤링 값 중 바뀐 칸만 REVISIONS_PATH sqlite에 추가
+#    (같은 칸 = 관측일 + 지표, 값이 지워지면 NULL로 기록)
+#  - 조회는 RevisionLog: (관측일, 지표, 수집 시각) 순으로 정렬한 컬럼형 배열
+#      관측일 구간  searchsorted
+#      시점 조회    칸마다 수집 시각 <= when 인 마지막 이력 (reduceat으로 전체 칸을 한 번에)
+#    → 시그널/회귀 백테스트에서 나중에 수정된 값이 섞이지 않음 (loader.load_store_asof)
+#  - 같은 칸은 가장 나중에 수집된 값이 이김 (같은 로딩 안에서는 크롤링이 엑셀보다 나중에 기록,
+#    크롤링 값은 병합된 최신 값과 비교 → 엑셀 수정이 크롤링 값을 이기지 않음)
+#
+# 사용법 (저장소 루트에서):
+#   python -m ifam.revisions                                  # 이력 요약
+#   python -m ifam.revisions --asof "2026-09-01 09:00"         # 그 시점에 알던 최근 5행
+#   python -m ifam.revisions --cell 2026-08-29 달러환율        # 한 칸의 수정 이력
+# =============================================================================
+
+import argparse
+import os
+import sqlite3
+import sys
+import threading
+from contextlib import closing
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from .cache import memoize
+from .config import DATA_COLUMNS, REVISIONS_PATH
+from .perf import timed
+
+VALUE_COLUMNS = [c for c in DATA_COLUMNS if c != "날짜"]
+REVISION_SOURCES = ("excel", "crawl")
+
+_COL_INDEX = {c: i for i, c in enumerate(VALUE_COLUMNS)}
+_SOURCE_CODE = {s: i for i, s in enumerate(REVISION_SOURCES)}
+
+REVISIONS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS revisions (
+    date TEXT NOT NULL,
+    indicator TEXT NOT NULL,
+    value REAL,
+    source TEXT NOT NULL,
+    ingested_at TEXT NOT NULL
+);
+"""
+_db_lock = threading.Lock()
+
+
+def _to_seconds(when):
+    return np.datetime64(pd.Timestamp(when).to_datetime64(), "s")
+
+
+def _to_day(value):
+    return np.datetime64(pd.Timestamp(value).to_datetime64(), "D")
+
+
+class RevisionLog:
+    """
+    수정 이력 전체를 (관측일, 지표, 수집 시각) 순으로 정렬해 둔 읽기 전용 컬럼형 배열.
+
+    - dates: datetime64[D] 관측일, cols: VALUE_COLUMNS 위치, values: float64 (NaN = 삭제)
+    - sources: REVISION_SOURCES 위치, ingested: datetime64[s] 수집 시각
+    - starts: 칸(관측일, 지표)별 이력 구간의 시작 위치 (같은 칸의 이력은 연속, 수집 시각 순)
+    """
+
+    __slots__ = ("dates", "cols", "values", "sources", "ingested", "starts")
+
+    def __init__(self, dates, cols, values, sources, ingested):
+        dates = np.asarray(dates, dtype="datetime64[D]")
+        cols = np.asarray(cols, dtype=np.int16)
+        ingested = np.asarray(ingested, dtype="datetime64[s]")
+        # 안정 정렬 → 수집 시각이 같으면 기록 순서 유지
+        order = np.lexsort((ingested, cols, dates))
+
+        self.dates = dates[order]
+        self.cols = cols[order]
+        self.values = np.asarray(values, dtype=np.float64)[order]
+        self.sources = np.asarray(sources, dtype=np.int8)[order]
+        self.ingested = ingested[order]
+
+        cell = self.dates.astype(np.int64) * len(VALUE_COLUMNS) + self.cols
+        self.starts = np.flatnonzero(np.r_[True, cell[1:] != cell[:-1]]) if len(cell) else cell
+        for arr in (self.dates, self.cols, self.values, self.sources, self.ingested, self.starts):
+            arr.flags.writeable = False
+
+    def __len__(self):
+        return len(self.dates)
+
+    @property
+    def n_cells(self):
+        return len(self.starts)
+
+    def _pick(self, when=None, start=None, end=None, source=None):
+        """칸마다 조건(수집 시각 <= when, source)을 만족하는 마지막 이력의 위치"""
+        lo = 0 if start is None else int(np.searchsorted(self.dates, _to_day(start), "left"))
+        hi = len(self) if end is None else int(np.searchsorted(self.dates, _to_day(end), "right"))
+        if hi <= lo:
+            return np.empty(0, dtype=np.intp)
+
+        # 관측일이 1순위 정렬 키라 lo/hi는 칸 경계와 일치
+        a, b = np.searchsorted(self.starts, [lo, hi])
+        valid = np.ones(hi - lo, dtype=bool)
+        if when is not None:
+            valid &= self.ingested[lo:hi] <= _to_seconds(when)
+        if source is not None:
+            valid &= self.sources[lo:hi] == _SOURCE_CODE[source]
+        pos = np.where(valid, np.arange(lo, hi), -1)
+        last = np.maximum.reduceat(pos, self.starts[a:b] - lo)
+        return last[last >= 0]
+
+    def asof(self, when=None, start=None, end=None, source=None):
+        """
+        when 시점(수집 시각 기준, None이면 최신)에 알고 있던 값의 DataFrame.
+        read_history()와 같은 형태 (날짜 + 지표 열, 관측일 오름차순, 값이 하나도 없는 행 제외).
+        """
+        idx = self._pick(when, start, end, source)
+        days, row = np.unique(self.dates[idx], return_inverse=True)
+        block = np.full((len(days), len(VALUE_COLUMNS)), np.nan)
+        block[row, self.cols[idx]] = self.values[idx]
+
+        frame = pd.DataFrame(block, columns=VALUE_COLUMNS)
+        frame.insert(0, "날짜", days.astype("datetime64[ns]"))
+        return frame[~np.isnan(block).all(axis=1)].reset_index(drop=True)
+
+    def cell_history(self, date, indicator):
+        """한 칸(관측일, 지표)의 수정 이력 (수집 시각 오름차순)"""
+        day = _to_day(date)
+        lo = int(np.searchsorted(self.dates, day, "left"))
+        hi = int(np.searchsorted(self.dates, day, "right"))
+        rows = lo + np.flatnonzero(self.cols[lo:hi] == _COL_INDEX[indicator])
+        return pd.DataFrame(
+            {
+                "value": self.values[rows],
+                "source": [REVISION_SOURCES[s] for s in self.sources[rows]],
+                "ingested_at": self.ingested[rows].astype("datetime64[ns]"),
+            }
+        )
+
+    def revised_cells(self):
+        """수정된 적이 있는 칸 수 (이력이 2개 이상)"""
+        return int(np.count_nonzero(np.diff(np.r_[self.starts, len(self)]) > 1))
+
+
+EMPTY_LOG = RevisionLog([], [], [], [], [])
+
+
+# =============================================================================
+# 저장 (sqlite)
+# =============================================================================
+
+
+def _connect(path, readonly=False):
+    """readonly면 파일을 만들지 않음 (없으면 sqlite3.Error) - 조회(API ?asof= 등)는 부작용 없이"""
+    if readonly:
+        return closing(sqlite3.connect(f"file:{os.path.abspath(path)}?mode=ro", uri=True, timeout=10))
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    conn = sqlite3.connect(path, timeout=10)
+    conn.executescript(REVISIONS_SCHEMA)
+    return closing(conn)
+
+
+@memoize(ttl=600, maxsize=2)
+def read_revisions(path=REVISIONS_PATH):
+    """저장된 수정 이력 전체 → RevisionLog (파일이 없거나 읽지 못하면 빈 이력)"""
+    try:
+        with _db_lock, _connect(path, readonly=True) as conn:
+            rows = conn.execute(
+                "SELECT date, indicator, value, source, ingested_at FROM revisions ORDER BY rowid"
+            ).fetchall()
+    except (sqlite3.Error, OSError):
+        return EMPTY_LOG
+    if not rows:
+        return EMPTY_LOG
+
+    raw = pd.DataFrame(rows, columns=["date", "indicator", "value", "source", "ingested_at"])
+    raw = raw[raw["indicator"].isin(_COL_INDEX) & raw["source"].isin(_SOURCE_CODE)]
+    return RevisionLog(
+        pd.to_datetime(raw["date"]).to_numpy(),
+        raw["indicator"].map(_COL_INDEX).to_numpy(),
+        pd.to_numeric(raw["value"]).to_numpy(np.float64),
+        raw["source"].map(_SOURCE_CODE).to_numpy(),
+        pd.to_datetime(raw["ingested_at"]).to_numpy(),
+    )
+
+
+@timed("record_revisions")
+def record_revisions(frame, source, path=REVISIONS_PATH, ingested_at=None, overlay=None):
+    """
+    frame(날짜 열 또는 날짜 index × 지표)에서 최신 이력과 다른 칸만 기록. 반환: 추가된 이력 수 (저장 실패 시 0)
+    최신 시점 조회가 load_data()의 병합 결과(크롤링 우선)와 항상 같도록:
+      excel: 빈 칸도 삭제로 기록. 엑셀의 최신 이력과 다르거나,
+             이번 overlay(크롤링)가 덮지 않는 칸인데 출처와 무관한 최신 값과 다르면 기록
+             → 전일/당일 창을 벗어난 날짜의 예전 크롤링 값을 엑셀 값이 다시 이김
+      crawl: 값이 있는 칸만, 출처와 무관한 최신 값과 비교
+             → 크롤링이 덮는 칸의 엑셀 값이 고쳐져도 크롤링 값을 다시 기록
+    """
+    if frame is None or len(frame) == 0:
+        return 0
+    new = frame.set_index("날짜") if "날짜" in frame.columns else frame
+    new = new.reindex(columns=VALUE_COLUMNS)
+    new.index = pd.DatetimeIndex(new.index).normalize()
+    new = new[new.index.notna() & ~new.index.duplicated()]
+    if len(new) == 0:
+        return 0
+
+    log = read_revisions(path)
+    a = new.to_numpy(np.float64)
+
+    def differs(basis):
+        prev = (
+            log.asof(start=new.index.min(), end=new.index.max(), source=basis)
+            .set_index("날짜")
+            .reindex(index=new.index, columns=VALUE_COLUMNS)
+            .to_numpy(np.float64)
+        )
+        return (a != prev) & ~(np.isnan(a) & np.isnan(prev))
+
+    if source == "excel":
+        covered = np.zeros_like(a, dtype=bool)
+        if overlay is not None and len(overlay):
+            cover = overlay.reindex(columns=VALUE_COLUMNS)
+            cover.index = pd.DatetimeIndex(cover.index).normalize()
+            covered = cover.notna().reindex(index=new.index, fill_value=False).to_numpy(bool)
+        changed = differs("excel") | (differs(None) & ~covered)
+    else:
+        changed = differs(None) & ~np.isnan(a)
+    r, c = np.nonzero(changed)
+    if len(r) == 0:
+        return 0
+
+    stamp = (ingested_at or datetime.now()).isoformat(timespec="seconds")
+    days = new.index.strftime("%Y-%m-%d")
+    rows = [
+        (days[i], VALUE_COLUMNS[j], None if np.isnan(a[i, j]) else float(a[i, j]), source, stamp)
+        for i, j in zip(r, c)
+    ]
+    try:
+        with _db_lock, _connect(path) as conn, conn:
+            conn.executemany("INSERT INTO revisions VALUES (?, ?, ?, ?, ?)", rows)
+    except (sqlite3.Error, OSError):
+        return 0
+    read_revisions.clear()
+    return len(rows)
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m ifam.revisions", description="값 수정 이력 / 시점 조회"
+    )
+    parser.add_argument("--path", default=REVISIONS_PATH, help="이력 sqlite 경로")
+    parser.add_argument("--asof", default=None, help="이 시점에 알고 있던 데이터 (예: 2026-09-01 09:00)")
+    parser.add_argument("--tail", type=int, default=5, help="--asof 출력 행 수")
+    parser.add_argument("--cell", nargs=2, metavar=("DATE", "INDICATOR"), help="한 칸의 수정 이력")
+    args = parser.parse_args(argv)
+
+    log = read_revisions(args.path)
+    if len(log) == 0:
+        print(f"이력이 없습니다: {args.path}")
+        return 1
+
+    if args.cell:
+        date, indicator = args.cell
+        if indicator not in _COL_INDEX:
+            print(f"알 수 없는 지표: {indicator}")
+            return 2
+        print(log.cell_history(date, indicator).to_string(index=False))
+        return 0
+
+    if args.asof:
+        frame = log.asof(args.asof)
+        print(frame.tail(args.tail).set_index("날짜").dropna(axis=1, how="all").T.to_string())
+        return 0
+
+    print(
+        f"이력 {len(log):,}건 | 칸 {log.n_cells:,}개 (수정된 칸 {log.revised_cells():,}개)"
+        f" | 관측일 {log.dates[0]} ~ {log.dates[-1]}"
+        f" | 수집 {log.ingested.min()} ~ {log.ingested.max()}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
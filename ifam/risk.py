@@ -0,0 +1,305 @@
+# =============================================================================
+# ifam/risk.py - 변동성 / VaR / 최대낙폭 + 시나리오 충격 (헤지 판단용)
+#  - 모든 일간 지표를 (행=영업일, 열=지표) 블록 하나로 한 번에 계산 (지표별 루프 없음)
+#      변동: 가격은 %, 금리/스왑은 bp (알림과 같은 척도)
+#      이동 변동성: 변동·변동² 누적합의 차이 → 창 길이와 무관하게 행마다 O(1)
+#      VaR: 최근 RISK_WINDOW일 변동의 분위수 (역사적) / 평균 ± z·표준편차 (정규)
+#      최대낙폭: 수준(결측은 직전 값)의 누적 최고점 대비 (가격 %, 금리 bp)
+#  - 상태(누적합, 누적 최고점)는 프로세스에서 공유하고 바뀐 행부터만 이어서 계산
+#    (alerts.vol_state_for와 같은 방식, 새로고침마다 새 행 수 × 지표 수)
+#  - 시나리오: 지표 충격(국고채 +100bp, 달러 +10% 등)을 SCENARIO_TARGETS에 과거 베타로 전파하고
+#    SMP / REC / 조달금리를 simulation.calculate_project_cashflow에 넣어 현금흐름 변화를 계산
+# =============================================================================
+
+import threading
+
+import numpy as np
+import pandas as pd
+
+from .alerts import DAILY_COLUMNS, RATE_CATEGORIES
+from .causality import daily_changes
+from .config import (
+    INDICATORS,
+    RISK_ANNUALIZE,
+    RISK_VAR_ALPHA,
+    RISK_VOL_WINDOW,
+    RISK_WINDOW,
+    SCENARIO_BASE_RATE,
+    SCENARIO_HORIZON,
+    SCENARIO_LOOKBACK,
+    SCENARIO_TARGETS,
+)
+from .perf import timed
+from .simulation import calculate_project_cashflow
+
+_CATEGORY = {
+    col_name: category for category, info in INDICATORS.items() for col_name in info["columns"]
+}
+
+
+def _is_rate(columns):
+    return np.array([_CATEGORY.get(c) in RATE_CATEGORIES for c in columns])
+
+
+def risk_moves(values, columns):
+    """수준 블록 → 일간 변동 (가격 %, 금리/스왑 bp), 첫 행은 NaN"""
+    return daily_changes(values, columns) * np.where(_is_rate(columns), 100.0, 1.0)
+
+
+def _ffill(values, seed=None):
+    """열별 직전 값으로 결측 채우기 (seed: 블록 앞 행의 값, 이어서 계산할 때)"""
+    if seed is not None:
+        values = np.vstack([seed, values])
+    idx = np.where(np.isnan(values), 0, np.arange(len(values))[:, None])
+    np.maximum.accumulate(idx, axis=0, out=idx)
+    filled = np.take_along_axis(values, idx, axis=0)
+    return filled[1:] if seed is not None else filled
+
+
+# =============================================================================
+# 누적 상태 (프로세스 공유, 바뀐 행부터만 갱신)
+# =============================================================================
+
+
+def build_risk_state(store):
+    """
+    일간 지표별 리스크 누적 상태.
+
+    {
+      'columns', 'is_rate', 'dates', 'values': 입력 블록(갱신 시 비교용),
+      'moves': 일간 변동, 'csum' / 'csum2' / 'count': 변동 / 변동² / 관측 수 누적합,
+      'level': 결측을 직전 값으로 채운 수준, 'peak': 누적 최고점
+    }
+    """
+    columns = [c for _, c in DAILY_COLUMNS if c in store.offsets]
+    k = len(columns)
+    state = {
+        "columns": columns,
+        "is_rate": _is_rate(columns),
+        "dates": np.empty(0, dtype="datetime64[ns]"),
+        "values": np.empty((0, k)),
+        **{name: np.empty((0, k)) for name in ("moves", "csum", "csum2", "count", "level", "peak")},
+    }
+    return update_risk_state(state, store)
+
+
+def update_risk_state(state, store):
+    """state를 store에 맞게 갱신. 기존 행과 처음 달라지는 행부터만 다시 계산"""
+    columns = state["columns"]
+    dates = np.asarray(store.dates, dtype="datetime64[ns]")
+    values = store.select(columns).values.astype(np.float64)
+
+    common = min(len(dates), len(state["dates"]))
+    same = (dates[:common] == state["dates"][:common]) & np.all(
+        (values[:common] == state["values"][:common])
+        | (np.isnan(values[:common]) & np.isnan(state["values"][:common])),
+        axis=1,
+    )
+    start = common if same.all() else int(np.argmin(same))
+    n, k = values.shape
+
+    new = {"dates": dates, "values": values}
+    for name in ("moves", "csum", "csum2", "count", "level", "peak"):
+        new[name] = np.empty((n, k))
+        new[name][:start] = state[name][:start]
+
+    if start < n:
+        lo = max(start - 1, 0)
+        moves = risk_moves(values[lo:], columns)[start - lo :]
+        observed = ~np.isnan(moves)
+        x = np.where(observed, moves, 0.0)
+        prev = start - 1
+        new["moves"][start:] = moves
+        for name, inc in (("csum", x), ("csum2", x * x), ("count", observed)):
+            new[name][start:] = np.cumsum(inc, axis=0) + (new[name][prev] if start else 0.0)
+
+        seed = new["level"][prev] if start else None
+        new["level"][start:] = _ffill(values[start:], seed)
+        running = np.fmax.accumulate(new["level"][start:], axis=0)
+        new["peak"][start:] = np.fmax(running, new["peak"][prev]) if start else running
+    return {**state, **new}
+
+
+_risk_state = {"state": None}
+_risk_state_lock = threading.Lock()
+
+
+def risk_state_for(store):
+    """프로세스 공유 리스크 상태를 store 기준으로 갱신해서 반환 (처음 한 번만 전체 계산)"""
+    with _risk_state_lock:
+        state = _risk_state["state"]
+        columns = [c for _, c in DAILY_COLUMNS if c in store.offsets]
+        if state is None or state["columns"] != columns:
+            state = build_risk_state(store)
+        else:
+            state = update_risk_state(state, store)
+        _risk_state["state"] = state
+        return state
+
+
+# =============================================================================
+# 지표 (전 지표 벡터 연산)
+# =============================================================================
+
+
+def rolling_vol(state, window=RISK_VOL_WINDOW, annualize=True):
+    """이동 변동성 (행, 지표) - 창 안 관측이 절반 미만이면 NaN, annualize면 연율화"""
+    def lagged(a):
+        out = np.zeros_like(a)
+        out[window:] = a[:-window]
+        return out
+
+    n = state["count"] - lagged(state["count"])
+    s1 = state["csum"] - lagged(state["csum"])
+    s2 = state["csum2"] - lagged(state["csum2"])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        var = (s2 - s1 * s1 / n) / (n - 1)
+    vol = np.sqrt(np.where(n >= max(2, window // 2), np.maximum(var, 0.0), np.nan))
+    return vol * np.sqrt(RISK_ANNUALIZE) if annualize else vol
+
+
+def drawdown(level, peak, is_rate):
+    """누적 최고점 대비 하락 (가격 %, 금리/스왑 bp)"""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(is_rate, (level - peak) * 100, (level / peak - 1) * 100)
+
+
+@timed("risk_table")
+def risk_table(state, window=RISK_WINDOW, alpha=RISK_VAR_ALPHA, vol_window=RISK_VOL_WINDOW):
+    """
+    지표별 리스크 요약 DataFrame (최근 window 영업일 기준, 1일 VaR는 손실을 양수로).
+    하락 VaR = 보유(롱) 손실, 상승 VaR = 매도/차입(숏) 손실 - 환율·금리는 방향에 따라 골라 봄
+    """
+    from scipy import stats
+
+    columns = state["columns"]
+    is_rate = state["is_rate"]
+    recent = state["moves"][-window:]
+    z = stats.norm.ppf(alpha)
+
+    with np.errstate(invalid="ignore"):
+        q_low, q_high = np.nanquantile(recent, [1 - alpha, alpha], axis=0)
+        mean = np.nanmean(recent, axis=0)
+        std = np.nanstd(recent, axis=0, ddof=1)
+
+    # 기간 최대낙폭: 기간 안에서 최고점을 다시 잡음 / 전체: 누적 상태의 최고점
+    level = state["level"][-window:]
+    window_dd = drawdown(level, np.fmax.accumulate(level, axis=0), is_rate)
+    full_dd = drawdown(state["level"][-1], state["peak"][-1], is_rate)
+    # 이동 변동성은 마지막 행만 필요 → 누적합 꼬리(vol_window + 1행)만 사용
+    tail = {name: state[name][-(vol_window + 1) :] for name in ("csum", "csum2", "count")}
+    with np.errstate(invalid="ignore"):
+        worst = np.nanargmin(np.where(np.isnan(window_dd), np.inf, window_dd), axis=0)
+
+    dates = state["dates"][-window:]
+    return pd.DataFrame(
+        {
+            "지표": columns,
+            "단위": np.where(is_rate, "bp", "%"),
+            "현재값": state["level"][-1],
+            "변동성(연율)": rolling_vol(tail, vol_window)[-1],
+            "하락 VaR(역사적)": -q_low,
+            "상승 VaR(역사적)": q_high,
+            "하락 VaR(정규)": z * std - mean,
+            "상승 VaR(정규)": z * std + mean,
+            "최대낙폭(기간)": np.nanmin(window_dd, axis=0),
+            "최대낙폭 일자": pd.DatetimeIndex(dates[worst]).strftime("%Y-%m-%d"),
+            "현재 낙폭(전체)": full_dd,
+            "관측": (~np.isnan(recent)).sum(axis=0),
+        }
+    )
+
+
+# =============================================================================
+# 시나리오 충격 → SMP / REC / 조달금리 → 현금흐름
+# =============================================================================
+
+
+def horizon_changes(values, columns, horizon):
+    """horizon 영업일 변동 (가격 %, 금리/스왑 bp)"""
+    values = np.asarray(values, dtype=np.float64)
+    out = np.full_like(values, np.nan)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out[horizon:] = np.where(
+            _is_rate(columns),
+            (values[horizon:] - values[:-horizon]) * 100,
+            (values[horizon:] / values[:-horizon] - 1) * 100,
+        )
+    out[~np.isfinite(out)] = np.nan
+    return out
+
+
+def scenario_betas(store, factors, targets, horizon=SCENARIO_HORIZON, lookback=SCENARIO_LOOKBACK):
+    """
+    targets의 horizon일 변동을 factors의 horizon일 변동에 함께 회귀한 베타 (factor, target).
+    모든 target을 lstsq 한 번으로. 반환: (베타 배열, 관측 수)
+    """
+    view = store.select(list(factors) + list(targets)).rows(slice(-(lookback + horizon), None))
+    changes = horizon_changes(view.values, view.columns, horizon)
+    complete = changes[~np.isnan(changes).any(axis=1)]
+    if len(complete) < len(factors) + 30:
+        return np.zeros((len(factors), len(targets))), len(complete)
+    X = np.column_stack([np.ones(len(complete)), complete[:, : len(factors)]])
+    coef = np.linalg.lstsq(X, complete[:, len(factors) :], rcond=None)[0]
+    return coef[1:], len(complete)
+
+
+@timed("run_scenario")
+def run_scenario(store, shocks, project, horizon=SCENARIO_HORIZON, lookback=SCENARIO_LOOKBACK):
+    """
+    shocks {지표: 충격 (가격 %, 금리/스왑 bp)}를 SCENARIO_TARGETS에 전파하고 현금흐름 비교.
+    project: calculate_project_cashflow 인자 중 SMP/REC/base_rate를 뺀 나머지
+             (capacity_mw, cf, rec_weight, debt, spread, opex_per_mw)
+    반환: {'levels': 지표별 현재/충격 후 DataFrame, 'betas': {target: {factor: 베타}},
+           'n_obs', 'base': 현금흐름 dict, 'shocked': 현금흐름 dict}
+    """
+    shocks = {c: float(v) for c, v in shocks.items() if c in store.offsets and v}
+    targets = [c for c in SCENARIO_TARGETS if c in store.offsets]
+    columns = list(dict.fromkeys([*shocks, *targets]))
+    latest = _ffill(store.select(columns).values.astype(np.float64))[-1]
+    current = dict(zip(columns, latest))
+
+    factors = list(shocks)
+    propagated = [t for t in targets if t not in shocks]
+    betas, n_obs = (
+        scenario_betas(store, factors, propagated, horizon, lookback)
+        if factors and propagated
+        else (np.zeros((len(factors), len(propagated))), 0)
+    )
+    moves = dict(shocks)
+    moves.update(zip(propagated, np.array([shocks[f] for f in factors]) @ betas if factors else []))
+
+    shocked = {}
+    rows = []
+    for col, rate in zip(columns, _is_rate(columns)):
+        move = moves.get(col, 0.0)
+        shocked[col] = current[col] + move / 100 if rate else current[col] * (1 + move / 100)
+        rows.append(
+            {
+                "지표": col,
+                "구분": "직접 충격" if col in shocks else "베타 전파",
+                "현재": current[col],
+                "충격 후": shocked[col],
+                "변동": move,
+                "단위": "bp" if rate else "%",
+            }
+        )
+
+    def cashflow(levels):
+        return calculate_project_cashflow(
+            levels.get("육지 SMP", 0.0),
+            levels.get("육지 가격", 0.0),
+            base_rate=levels.get(SCENARIO_BASE_RATE, 0.0),
+            **project,
+        )
+
+    return {
+        "levels": pd.DataFrame(rows),
+        "betas": {
+            t: {f: float(betas[i, j]) for i, f in enumerate(factors)}
+            for j, t in enumerate(propagated)
+        },
+        "n_obs": n_obs,
+        "base": cashflow(current),
+        "shocked": cashflow(shocked),
+    }
@@ -0,0 +1,142 @@
+# =============================================================================
+# ifam/service.py - 분석 결과 캐시 (데이터 버전 단위, 대시보드/배치/API 공용)
+#  - _df는 키에서 빼고 FrameStore.version으로 키를 잡아 매 호출마다 df 해싱 비용을 없앰
+# =============================================================================
+
+import numpy as np
+
+from .alerts import latest_sigma, scan_alerts, vol_state_for
+from .analytics import (
+    build_regression_model,
+    calculate_correlation_matrix,
+    calculate_lagged_correlation,
+    find_optimal_lag,
+    predict_future,
+)
+from .cache import memoize
+from .causality import fit_var
+from .config import ALERT_MODE, CHART_DOWNSAMPLE, CHART_MAX_POINTS
+from .downsample import downsample
+from .grid import resample_store
+from .perf import timed
+from .regimes import detect_regimes
+from .risk import risk_state_for, risk_table, rolling_vol, run_scenario
+from .signals import (
+    generate_analysis_points,
+    generate_investment_signals,
+    generate_market_summary,
+)
+from .summary import check_alerts, get_summary
+
+
+@timed("cached_overview", cached=True)
+@memoize(maxsize=16)
+def cached_overview(_df, version, mode=ALERT_MODE):
+    summary = get_summary(_df)
+    # 변동성 기준: 프로세스 공유 EWMA 상태를 새 행만큼 갱신 → 알림 판단은 지표 수만큼
+    sigma = latest_sigma(vol_state_for(_df)) if mode == "adaptive" else None
+    return summary, check_alerts(summary, sigma=sigma)
+
+
+@timed("cached_alert_scan", cached=True)
+@memoize(maxsize=16)
+def cached_alert_scan(_df, version, mode="fixed"):
+    return scan_alerts(_df, mode=mode)
+
+
+@timed("cached_chart_series", cached=True)
+@memoize(maxsize=512)
+def cached_chart_series(
+    _store, version, column, days, max_points=CHART_MAX_POINTS, method=CHART_DOWNSAMPLE
+):
+    """
+    (지표, 기간) 단위 차트 시계열. 최근 days일 view에서 결측을 빼고 max_points개 이하로 줄인다.
+    반환: {'dates', 'values', 'raw_points'}
+    """
+    view = _store.recent(days)
+    values = view.column(column)
+    dates, sampled = downsample(view.dates, values, max_points, method)
+    return {
+        "dates": dates,
+        "values": sampled,
+        "raw_points": int((~np.isnan(values)).sum()),
+    }
+
+
+@timed("cached_resample", cached=True)
+@memoize(maxsize=8)
+def cached_resample(_store, version, rule, how="mean"):
+    """주간/월간 집계 FrameStore (데이터 버전당 규칙별 1번만 계산)"""
+    return resample_store(_store, rule, how)
+
+
+@timed("cached_market_summary", cached=True)
+@memoize(maxsize=16)
+def cached_market_summary(_df, version, days=7):
+    return generate_market_summary(_df, days=days)
+
+
+@timed("cached_signals", cached=True)
+@memoize(maxsize=16)
+def cached_signals(_df, version, days=30):
+    return generate_investment_signals(_df, days=days), generate_analysis_points(_df)
+
+
+@timed("cached_correlation_matrix", cached=True)
+@memoize(maxsize=64)
+def cached_correlation_matrix(_df, version, columns, days):
+    return calculate_correlation_matrix(_df, columns, days)
+
+
+@timed("cached_lagged_correlation", cached=True)
+@memoize(maxsize=64)
+def cached_lagged_correlation(_df, version, leading_col, lagging_col, max_lag):
+    lag_df = calculate_lagged_correlation(_df, leading_col, lagging_col, max_lag)
+    return lag_df, find_optimal_lag(lag_df)
+
+
+@timed("cached_var", cached=True)
+@memoize(maxsize=32)
+def cached_var(_store, version, columns, max_lag, window):
+    """VAR / Granger 검정 ((지표 목록, 최대 시차, 기간) 단위). 반환: (결과, 오류)"""
+    return fit_var(_store, columns, max_lag, window)
+
+
+@timed("cached_regimes", cached=True)
+@memoize(maxsize=8)
+def cached_regimes(_store, version, columns=None):
+    """지표별 구조 변화 시점 / 국면 구간 (데이터 버전당 1번, 지표가 많으면 프로세스 풀)"""
+    return detect_regimes(_store, columns)
+
+
+@timed("cached_risk_table", cached=True)
+@memoize(maxsize=16)
+def cached_risk_table(_store, version, window, alpha):
+    """지표별 변동성 / VaR / 최대낙폭 (누적 상태는 프로세스 공유, 새 행만 이어서 계산)"""
+    return risk_table(risk_state_for(_store), window, alpha)
+
+
+@timed("cached_rolling_vol", cached=True)
+@memoize(maxsize=8)
+def cached_rolling_vol(_store, version, window):
+    """전 지표 이동 변동성 (연율). 반환: (날짜, (행, 지표) 배열, 지표 목록)"""
+    state = risk_state_for(_store)
+    return state["dates"], rolling_vol(state, window), state["columns"]
+
+
+@timed("cached_scenario", cached=True)
+@memoize(maxsize=64)
+def cached_scenario(_store, version, shocks, project):
+    """시나리오 충격 → 지표 전파 / 현금흐름 비교 ((충격, 프로젝트 조건) 단위)"""
+    return run_scenario(_store, shocks, project)
+
+
+@timed("cached_regression", cached=True)
+@memoize(maxsize=32)
+def cached_regression(_df, version, target_col, feature_cols, train_days, start=None):
+    model_info, _, _, error = build_regression_model(
+        _df, target_col, feature_cols, train_days, start
+    )
+    if model_info is None:
+        return None, None, error
+    return model_info, predict_future(model_info, _df, feature_cols), error
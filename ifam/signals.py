@@ -0,0 +1,224 @@
+# =============================================================================
+# ifam/signals.py - 투자 시그널 / 시장 요약
+# =============================================================================
+
+import pandas as pd
+
+from .frequency import asof_row
+from .perf import timed
+
+# 시그널 / 종합 분석에 쓰는 지표
+SIGNAL_COLUMNS = ["육지 SMP", "육지 가격", "국고채 (3년)", "달러환율"]
+ANALYSIS_COLUMNS = ["육지 SMP", "국고채 (3년)"]
+
+MARKET_SUMMARY_INDICATORS = {
+    "달러환율": {"name": "달러/원 환율", "unit": "원", "format": "{:,.1f}"},
+    "육지 SMP": {"name": "SMP (육지)", "unit": "원/kWh", "format": "{:,.1f}"},
+    "육지 가격": {"name": "REC 가격", "unit": "원", "format": "{:,.0f}"},
+    "두바이유": {"name": "두바이유", "unit": "$/배럴", "format": "{:,.1f}"},
+    "국고채 (3년)": {"name": "국고채 3년", "unit": "%", "format": "{:,.2f}"},
+}
+
+
+@timed("generate_investment_signals")
+def generate_investment_signals(df, days=30):
+    if len(df) < days:
+        return []
+
+    recent = df.tail(days)[SIGNAL_COLUMNS]
+    return signals_from_stats(asof_row(df), recent.mean(), recent.std())
+
+
+def signals_from_stats(latest, avg, std):
+    """
+    최신 행(latest)과 최근 구간 지표별 평균(avg)/표준편차(std)로 시그널 생성.
+    리포트 백필은 전체 기간 롤링 통계를 한 번 계산해 날짜별 행만 넘긴다.
+    """
+    signals = []
+
+    # SMP
+    smp_current = latest.get("육지 SMP")
+    smp_avg = avg.get("육지 SMP")
+    smp_std = std.get("육지 SMP")
+
+    if pd.notna(smp_current) and pd.notna(smp_avg):
+        if smp_current < smp_avg - smp_std:
+            signals.append(
+                {
+                    "category": "신재생에너지",
+                    "indicator": "SMP",
+                    "signal": "BUY",
+                    "reason": f"SMP가 30일 평균 대비 저점 (현재: {smp_current:.1f}, 평균: {smp_avg:.1f})",
+                    "strength": "STRONG"
+                    if smp_current < smp_avg - 2 * smp_std
+                    else "MODERATE",
+                }
+            )
+        elif smp_current > smp_avg + smp_std:
+            signals.append(
+                {
+                    "category": "신재생에너지",
+                    "indicator": "SMP",
+                    "signal": "SELL",
+                    "reason": f"SMP가 30일 평균 대비 고점 (현재: {smp_current:.1f}, 평균: {smp_avg:.1f})",
+                    "strength": "STRONG"
+                    if smp_current > smp_avg + 2 * smp_std
+                    else "MODERATE",
+                }
+            )
+
+    # REC
+    rec_current = latest.get("육지 가격")
+    rec_avg = avg.get("육지 가격")
+    rec_std = std.get("육지 가격")
+
+    if pd.notna(rec_current) and pd.notna(rec_avg) and rec_std > 0:
+        if rec_current < rec_avg - rec_std:
+            signals.append(
+                {
+                    "category": "신재생에너지",
+                    "indicator": "REC",
+                    "signal": "BUY",
+                    "reason": f"REC 가격 저점 매수 기회 (현재: {rec_current:,.0f}, 평균: {rec_avg:,.0f})",
+                    "strength": "STRONG"
+                    if rec_current < rec_avg - 2 * rec_std
+                    else "MODERATE",
+                }
+            )
+
+    # 금리
+    rate_current = latest.get("국고채 (3년)")
+    rate_avg = avg.get("국고채 (3년)")
+
+    if pd.notna(rate_current) and pd.notna(rate_avg):
+        if rate_current > rate_avg + 0.1:
+            signals.append(
+                {
+                    "category": "인프라",
+                    "indicator": "금리",
+                    "signal": "HOLD",
+                    "reason": f"금리 상승 중 - 신규 차입 주의 (현재: {rate_current:.2f}%, 평균: {rate_avg:.2f}%)",
+                    "strength": "MODERATE",
+                }
+            )
+        elif rate_current < rate_avg - 0.1:
+            signals.append(
+                {
+                    "category": "인프라",
+                    "indicator": "금리",
+                    "signal": "BUY",
+                    "reason": f"금리 하락 - 차입 적기 (현재: {rate_current:.2f}%, 평균: {rate_avg:.2f}%)",
+                    "strength": "MODERATE",
+                }
+            )
+
+    # 환율
+    fx_current = latest.get("달러환율")
+    fx_avg = avg.get("달러환율")
+    fx_std = std.get("달러환율")
+
+    if pd.notna(fx_current) and pd.notna(fx_avg) and fx_std > 0:
+        if fx_current > fx_avg + fx_std:
+            signals.append(
+                {
+                    "category": "해외투자",
+                    "indicator": "환율",
+                    "signal": "HOLD",
+                    "reason": f"원화 약세 - 해외 신규 투자 주의 (현재: {fx_current:,.0f}원)",
+                    "strength": "MODERATE",
+                }
+            )
+        elif fx_current < fx_avg - fx_std:
+            signals.append(
+                {
+                    "category": "해외투자",
+                    "indicator": "환율",
+                    "signal": "BUY",
+                    "reason": f"원화 강세 - 해외 투자 적기 (현재: {fx_current:,.0f}원)",
+                    "strength": "MODERATE",
+                }
+            )
+
+    return signals
+
+
+@timed("generate_market_summary")
+def generate_market_summary(df, days=7):
+    if len(df) < days:
+        return None
+
+    cols = [c for c in MARKET_SUMMARY_INDICATORS if c in df.columns]
+    recent = df.tail(days)[cols]
+    prev_period = df.iloc[-(days * 2) : -days] if len(df) >= days * 2 else df.head(days)
+    return market_summary_from_stats(
+        asof_row(df)[cols], recent.mean(), prev_period[cols].mean()
+    )
+
+
+def market_summary_from_stats(current, avg, prev_avg):
+    """최신 값(current), 최근 구간 평균(avg), 직전 구간 평균(prev_avg)으로 주간 트렌드 요약"""
+    summary = {}
+    for col, info in MARKET_SUMMARY_INDICATORS.items():
+        if col not in avg:
+            continue
+        current_avg = avg[col]
+        prev_avg_col = prev_avg[col]
+        current_last = current[col]
+
+        if pd.notna(current_avg) and pd.notna(prev_avg_col) and prev_avg_col != 0:
+            change_pct = (current_avg - prev_avg_col) / prev_avg_col * 100
+            trend = (
+                "상승"
+                if change_pct > 0.5
+                else ("하락" if change_pct < -0.5 else "보합")
+            )
+
+            summary[col] = {
+                "name": info["name"],
+                "current": current_last,
+                "avg": current_avg,
+                "prev_avg": prev_avg_col,
+                "change_pct": change_pct,
+                "trend": trend,
+                "unit": info["unit"],
+                "format": info["format"],
+            }
+    return summary
+
+
+@timed("generate_analysis_points")
+def generate_analysis_points(df, days=90):
+    recent = df.tail(days)[ANALYSIS_COLUMNS]
+    return analysis_points_from_stats(asof_row(df), recent.mean())
+
+
+def analysis_points_from_stats(latest_row, avg):
+    """최신 행과 최근 90일 평균(avg)으로 종합 시장 분석 문구 생성"""
+    analysis_points = []
+
+    smp_current = latest_row.get("육지 SMP")
+    smp_avg_90d = avg.get("육지 SMP")
+    if pd.notna(smp_current) and pd.notna(smp_avg_90d):
+        smp_vs_avg = (smp_current / smp_avg_90d - 1) * 100
+        if smp_vs_avg > 10:
+            analysis_points.append(
+                f"⚡ SMP가 90일 평균 대비 **{smp_vs_avg:.1f}% 높음** - 신재생 발전 수익성 양호"
+            )
+        elif smp_vs_avg < -10:
+            analysis_points.append(
+                f"⚡ SMP가 90일 평균 대비 **{abs(smp_vs_avg):.1f}% 낮음** - 수익성 주의"
+            )
+
+    rate_current = latest_row.get("국고채 (3년)")
+    rate_avg_90d = avg.get("국고채 (3년)")
+    if pd.notna(rate_current) and pd.notna(rate_avg_90d):
+        if rate_current > rate_avg_90d + 0.2:
+            analysis_points.append(
+                f"📊 금리 상승 추세 ({rate_current:.2f}%) - PF 조달비용 상승 예상"
+            )
+        elif rate_current < rate_avg_90d - 0.2:
+            analysis_points.append(
+                f"📊 금리 하락 추세 ({rate_current:.2f}%) - 리파이낸싱 적기"
+            )
+
+    return analysis_points
@@ -0,0 +1,46 @@
+# =============================================================================
+# ifam/simulation.py - 신재생에너지 수익성 시뮬레이터 (발전 수익 / PF 이자 반영 현금흐름)
+# =============================================================================
+
+
+def calculate_renewable_revenue(smp, rec_price, capacity_mw, cf=0.15, rec_weight=1.0):
+    annual_generation = capacity_mw * 1000 * 24 * 365 * cf / 1000
+    smp_revenue = annual_generation * smp * 1000
+    rec_count = annual_generation * rec_weight
+    rec_revenue = rec_count * rec_price
+    total_revenue = smp_revenue + rec_revenue
+
+    return {
+        "annual_generation_mwh": annual_generation,
+        "smp_revenue": smp_revenue,
+        "rec_revenue": rec_revenue,
+        "total_revenue": total_revenue,
+        "revenue_per_mw": total_revenue / capacity_mw if capacity_mw > 0 else 0,
+    }
+
+
+def calculate_project_cashflow(
+    smp,
+    rec_price,
+    capacity_mw,
+    cf=0.15,
+    rec_weight=1.0,
+    debt=0.0,
+    base_rate=0.0,
+    spread=0.0,
+    opex_per_mw=0.0,
+):
+    """
+    연간 현금흐름 (원): 발전 수익 - 운영비 - PF 이자 (조달금리 = base_rate + spread, %).
+    금리/환율 시나리오가 이자비용과 SMP/REC를 거쳐 현금흐름에 주는 영향을 보기 위한 단순 모형
+    """
+    revenue = calculate_renewable_revenue(smp, rec_price, capacity_mw, cf, rec_weight)
+    interest = debt * (base_rate + spread) / 100
+    opex = opex_per_mw * capacity_mw
+    return {
+        **revenue,
+        "opex": opex,
+        "interest": interest,
+        "funding_rate": base_rate + spread,
+        "cash_flow": revenue["total_revenue"] - opex - interest,
+    }
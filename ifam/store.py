@@ -0,0 +1,132 @@
+# =============================================================================
+# ifam/store.py - 날짜 인덱스 슬라이스 + 컬럼형 데이터 컨테이너 (세션/프로세스 간 공유용, 읽기 전용)
+# =============================================================================
+
+import hashlib
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+
+from .config import INDICATORS
+
+
+def date_slice(dates, start=None, end=None):
+    """
+    정렬된 날짜 배열(Series/Index/ndarray)에서 [start, end] (양끝 포함) 구간의 행 slice.
+    boolean mask 대신 searchsorted로 O(log n)에 위치를 찾고, df.iloc[...]로 쓰면 복사 없이 view.
+    """
+    values = dates.to_numpy() if isinstance(dates, (pd.Series, pd.Index)) else np.asarray(dates)
+    unit = np.datetime_data(values.dtype)[0]
+
+    lo = 0
+    hi = len(values)
+    if start is not None:
+        lo = int(np.searchsorted(values, np.datetime64(pd.Timestamp(start), unit), side="left"))
+    if end is not None:
+        hi = int(np.searchsorted(values, np.datetime64(pd.Timestamp(end), unit), side="right"))
+    return slice(lo, max(lo, hi))
+
+
+def recent_slice(dates, days):
+    """마지막 날짜 기준 최근 days일 구간 slice (days가 None/0이면 전체)"""
+    if not days or len(dates) == 0:
+        return slice(0, len(dates))
+    last = dates.iloc[-1] if isinstance(dates, pd.Series) else dates[-1]
+    return date_slice(dates, start=pd.Timestamp(last) - timedelta(days=days))
+
+
+class FrameStore:
+    """
+    히스토리 프레임을 float64 2차원 블록 + datetime64 인덱스로 보관하는 읽기 전용 컨테이너.
+
+    - values: (행=영업일, 열=지표) float64 블록, 열 단위로 연속(Fortran order)
+      (요약/알림 임계값 판단이 load_data() 결과와 같도록 float64 유지, float32는 Arrow 전송에서만)
+    - dates: datetime64[ns] 정렬 인덱스
+    - offsets: {지표명: 블록 내 열 위치}
+    - version: 블록 내용 해시 (분석 결과 캐시 키로 사용)
+
+    기간 슬라이스(window)와 연속된 열 묶음(select/category)은 복사 없이 view를 돌려주고,
+    값을 바꿀 때는 with_column()으로 새 객체를 만든다 (copy-on-write).
+    """
+
+    __slots__ = ("dates", "values", "columns", "offsets", "version")
+
+    def __init__(self, dates, values, columns):
+        values = np.asfortranarray(values, dtype=np.float64)
+        dates = np.asarray(dates, dtype="datetime64[ns]")
+        values.flags.writeable = False
+        dates.flags.writeable = False
+
+        self.dates = dates
+        self.values = values
+        self.columns = tuple(columns)
+        self.offsets = {c: i for i, c in enumerate(self.columns)}
+        self.version = hashlib.blake2b(
+            values.T.tobytes() + dates.tobytes(), digest_size=8
+        ).hexdigest()
+
+    @classmethod
+    def from_frame(cls, df, date_col="날짜"):
+        columns = [c for c in df.columns if c != date_col]
+        return cls(df[date_col].to_numpy(), df[columns].to_numpy(np.float64), columns)
+
+    def __len__(self):
+        return len(self.dates)
+
+    @property
+    def nbytes(self):
+        return self.values.nbytes + self.dates.nbytes
+
+    def _view(self, dates, values, columns):
+        obj = object.__new__(FrameStore)
+        obj.dates = dates
+        obj.values = values
+        obj.columns = tuple(columns)
+        obj.offsets = {c: i for i, c in enumerate(obj.columns)}
+        obj.version = None
+        return obj
+
+    def column(self, name):
+        """단일 지표 1차원 view"""
+        return self.values[:, self.offsets[name]]
+
+    def rows(self, row_slice):
+        """행 위치 slice → view"""
+        return self._view(self.dates[row_slice], self.values[row_slice], self.columns)
+
+    def window(self, start=None, end=None):
+        """start~end (양끝 포함) 기간 view"""
+        return self.rows(date_slice(self.dates, start, end))
+
+    def recent(self, days):
+        """마지막 날짜 기준 최근 days일 view (None이면 전체)"""
+        return self.rows(recent_slice(self.dates, days))
+
+    def select(self, columns):
+        """열 선택. 블록 내에서 연속된 열이면 view, 아니면 해당 열만 복사"""
+        idx = [self.offsets[c] for c in columns]
+        if idx and idx == list(range(idx[0], idx[0] + len(idx))):
+            values = self.values[:, idx[0] : idx[0] + len(idx)]
+        else:
+            values = self.values[:, idx]
+            values.flags.writeable = False
+        return self._view(self.dates, values, columns)
+
+    def category(self, category):
+        """INDICATORS 카테고리 단위 열 선택 (DATA_COLUMNS 순서상 연속 → view)"""
+        cols = [c for c in INDICATORS[category]["columns"] if c in self.offsets]
+        return self.select(cols)
+
+    def with_column(self, name, values):
+        """name 열을 values로 바꾼 새 FrameStore (원본은 그대로)"""
+        block = np.array(self.values, dtype=np.float64, order="F")
+        block[:, self.offsets[name]] = values
+        return FrameStore(self.dates, block, self.columns)
+
+    def to_frame(self, date_col="날짜"):
+        """pandas DataFrame으로 노출 (블록은 복사 없이 공유, 수정 시 pandas가 복사)"""
+        frame = pd.DataFrame(self.values, columns=list(self.columns), copy=False)
+        # ndarray를 그대로 insert하면 날짜 열이 세션마다 복사됨 → Series로 감싸 버퍼 공유
+        frame.insert(0, date_col, pd.Series(self.dates, copy=False))
+        return frame
@@ -0,0 +1,133 @@
+# =============================================================================
+# ifam/summary.py - 요약/알림 관련 함수
+# =============================================================================
+
+import pandas as pd
+
+from .config import ALERT_RULES, ALERT_THRESHOLDS, COLUMN_FREQ, INDICATORS
+from .frequency import asof_row, build_frequency_index, format_period_note, get_period_data
+from .perf import timed
+
+
+@timed("get_summary")
+def get_summary(df, freq_index=None):
+    if df is None or len(df) < 2:
+        return {}
+
+    # 일간 지표는 그리드에 결측이 남아 있음 → 행별 as-of 값으로 비교
+    latest = asof_row(df, -1)
+    previous = asof_row(df, -2)
+    summary = {}
+    if freq_index is None:
+        freq_index = build_frequency_index(df)
+
+    for category, info in INDICATORS.items():
+        is_rate = category in ["금리", "스왑"]
+        summary[category] = {
+            "icon": info["icon"],
+            "color": info["color"],
+            "indicators": {},
+        }
+
+        for col_name, col_info in info["columns"].items():
+            freq = COLUMN_FREQ.get(col_name, "D")
+            if freq != "D":
+                period_info = get_period_data(freq_index, col_name)
+                current = period_info["value"]
+                prev = period_info["previous"]
+                change = period_info["change"]
+
+                if change is not None:
+                    direction = "up" if change > 0 else ("down" if change < 0 else "neutral")
+                    change_pct = change
+                else:
+                    direction = "neutral"
+                    change_pct = None
+
+                note = format_period_note(
+                    freq, period_info["prev_period"], period_info["curr_period"]
+                )
+
+                summary[category]["indicators"][col_name] = {
+                    "value": current,
+                    "previous": prev,
+                    "change": change,
+                    "change_pct": change_pct,
+                    "direction": direction,
+                    "unit": col_info["unit"],
+                    "format": col_info["format"],
+                    "note": note,
+                    "is_periodic": True,
+                }
+            else:
+                current = latest.get(col_name)
+                prev = previous.get(col_name)
+
+                if pd.notna(current) and pd.notna(prev) and prev != 0:
+                    change = current - prev
+                    change_pct = (change / prev) * 100 if not is_rate else change * 100
+                    direction = "up" if change > 0 else ("down" if change < 0 else "neutral")
+                else:
+                    change, change_pct, direction = None, None, "neutral"
+
+                summary[category]["indicators"][col_name] = {
+                    "value": current,
+                    "previous": prev,
+                    "change": change,
+                    "change_pct": change_pct,
+                    "direction": direction,
+                    "unit": col_info["unit"],
+                    "format": col_info["format"],
+                    "note": "",
+                }
+    return summary
+
+
+@timed("check_alerts")
+def check_alerts(summary, sigma=None, rules=None):
+    """
+    급변동 알림 목록.
+
+    - 기본: ALERT_RULES의 지표별 고정 임계값 (금리/스왑은 bp로 비교)
+    - sigma({지표: 직전까지의 EWMA 표준편차})를 주면 변동성 기준
+      (|변동| >= z × sigma 이고 floor 이상), sigma가 없는 지표는 고정 기준
+      → alerts.vol_state_for(df) / latest_sigma()로 미리 계산해 두므로 여기서는 지표 수만큼만 계산
+    """
+    rules = ALERT_RULES if rules is None else rules
+    alerts = []
+    for category, data in summary.items():
+        is_rate = category in ["금리", "스왑"]
+
+        for col_name, ind in data["indicators"].items():
+            if ind["change_pct"] is None:
+                continue
+
+            rule = rules.get(col_name) or {"threshold": ALERT_THRESHOLDS.get(category, 5.0)}
+            scale = 100 if is_rate else 1
+            check_val = abs(ind["change"]) * 100 if is_rate else abs(ind["change_pct"])
+
+            vol = sigma.get(col_name) if sigma and rule.get("adaptive", True) else None
+            if vol:
+                z = ind["change_pct"] / vol
+                fired = abs(z) >= rule["z"] and check_val >= rule["floor"] * scale
+            else:
+                z = None
+                fired = check_val >= rule["threshold"] * scale
+
+            if fired:
+                alerts.append(
+                    {
+                        "category": category,
+                        "indicator": col_name,
+                        "change_pct": ind["change_pct"],
+                        "direction": ind["direction"],
+                        "icon": data["icon"],
+                        "current": ind.get("value"),
+                        "previous": ind.get("previous"),
+                        "fmt": ind.get("format", "{:,.2f}"),
+                        "unit": ind.get("unit", ""),
+                        "rule": "fixed" if z is None else "adaptive",
+                        "z": z,
+                    }
+                )
+    return alerts
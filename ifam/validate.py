@@ -0,0 +1,226 @@
+# =============================================================================
+# ifam/validate.py - 크롤링 값 검증 + 격리 (병합 전에 히스토리와 비교)
+#  - 파서는 float이면 뭐든 받음 → 열 인덱스가 밀리면 거래량이 가격 열에 들어가도 그대로 병합됨
+#  - 병합 직전 전일/당일 overlay 값을 지표 전체에 대해 한 번에 검사 (행 2개 × 지표 벡터 연산)
+#      범위     INDICATORS의 range 밖
+#      MAD      직전 VALIDATION_WINDOW개 관측의 일간 변동 대비 robust z-score (중앙값/MAD)
+#      스프레드 두바이-브렌트처럼 함께 움직이는 지표 차이가 최근 중앙값에서 크게 벗어남
+#  - 걸린 값은 overlay에서 빼고(히스토리를 덮어쓰지 않음) QUARANTINE_PATH sqlite에 기록
+# =============================================================================
+
+import os
+import sqlite3
+import threading
+import warnings
+from contextlib import closing
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+from .alerts import RATE_CATEGORIES
+from .cache import memoize
+from .config import (
+    COLUMN_FREQ,
+    INDICATORS,
+    QUARANTINE_PATH,
+    VALIDATION_MAD_Z,
+    VALIDATION_MIN_MOVE,
+    VALIDATION_MIN_MOVE_OVERRIDES,
+    VALIDATION_SPREADS,
+    VALIDATION_WINDOW,
+)
+from .perf import timed
+
+# 지표별 검증 기준 (INDICATORS 순서)
+_META = {
+    col_name: {
+        "range": col_info.get("range", (-np.inf, np.inf)),
+        "is_rate": category in RATE_CATEGORIES,
+        # 월간 등 비일간 지표는 일간 변동 분포가 없으므로 범위 검사만
+        "min_move": VALIDATION_MIN_MOVE_OVERRIDES.get(
+            col_name, VALIDATION_MIN_MOVE.get(category, 10.0)
+        )
+        if COLUMN_FREQ.get(col_name, "D") == "D"
+        else None,
+    }
+    for category, info in INDICATORS.items()
+    for col_name, col_info in info["columns"].items()
+}
+
+QUARANTINE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS quarantine (
+    date TEXT NOT NULL,
+    indicator TEXT NOT NULL,
+    value REAL NOT NULL,
+    reference REAL,
+    reasons TEXT NOT NULL,
+    detected_at TEXT NOT NULL,
+    UNIQUE (date, indicator, value)
+);
+"""
+_db_lock = threading.Lock()
+
+
+def _moves(current, previous, is_rate):
+    """변동: 금리/스왑은 %p 차이, 나머지는 % 변화율"""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(is_rate, current - previous, (current - previous) / np.abs(previous) * 100)
+
+
+def robust_baseline(values, is_rate):
+    """
+    (행=관측일, 열=지표) 블록의 일간 변동 중앙값 / robust 표준편차 (1.4826 × MAD), 열별.
+    결측 행은 건너뛰고 직전 관측값과 비교.
+    """
+    filled = pd.DataFrame(values).ffill().to_numpy()
+    moves = _moves(values[1:], filled[:-1], is_rate)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)  # 전부 결측인 열
+        center = np.nanmedian(moves, axis=0)
+        sigma = 1.4826 * np.nanmedian(np.abs(moves - center), axis=0)
+    return center, sigma
+
+
+@timed("validate_overlay")
+def validate_overlay(history, overlay):
+    """
+    크롤링 overlay(영업일 index × 지표)를 history(날짜 열 포함 엑셀 히스토리, None 가능)와 비교해 검증.
+    반환: (의심 값을 뺀 overlay, 격리 기록 list[dict])
+    """
+    columns = [c for c in overlay.columns if c in _META]
+    if not columns or len(overlay) == 0:
+        return overlay, []
+
+    # 히스토리가 없으면 범위 검사만
+    overlay = overlay.sort_index()
+    if history is not None and len(history) > 0:
+        ref = history[history["날짜"] < overlay.index[0]].set_index("날짜")
+        ref_values = ref.reindex(columns=columns).dropna(how="all").to_numpy(dtype=np.float64)
+    else:
+        ref_values = np.empty((0, len(columns)))
+    recent = ref_values[-VALIDATION_WINDOW:]
+
+    lo = np.array([_META[c]["range"][0] for c in columns], dtype=np.float64)
+    hi = np.array([_META[c]["range"][1] for c in columns], dtype=np.float64)
+    is_rate = np.array([_META[c]["is_rate"] for c in columns])
+    min_move = np.array(
+        [np.inf if _META[c]["min_move"] is None else _META[c]["min_move"] for c in columns]
+    )
+    center, sigma = robust_baseline(recent, is_rate)
+    last = (
+        pd.DataFrame(ref_values).ffill().to_numpy()[-1]
+        if len(ref_values)
+        else np.full(len(columns), np.nan)
+    )
+
+    pos = {c: i for i, c in enumerate(columns)}
+    pairs = [(pos[a], pos[b], tol) for a, b, tol in VALIDATION_SPREADS if a in pos and b in pos]
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        spread_center = [np.nanmedian(recent[:, a] - recent[:, b]) for a, b, _ in pairs]
+
+    clean = overlay.copy()
+    records = []
+    for date, row in zip(overlay.index, overlay[columns].to_numpy(dtype=np.float64)):
+        present = ~np.isnan(row)
+        reasons = [[] for _ in columns]
+
+        out_of_range = present & ((row < lo) | (row > hi))
+
+        move = _moves(row, last, is_rate)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            z = (move - center) / sigma
+        # 변동이 전혀 없던 지표(MAD 0)는 움직이기만 해도 z=inf, 기준이 없으면(NaN) 판단 안 함
+        z = np.where(sigma == 0, np.where(move == center, 0.0, np.inf), z)
+        jump = present & ~np.isnan(move) & (np.abs(z) > VALIDATION_MAD_Z) & (np.abs(move) >= min_move)
+
+        for i in np.flatnonzero(out_of_range):
+            reasons[i].append(f"범위 {lo[i]:g}~{hi[i]:g} 밖")
+        for i in np.flatnonzero(jump):
+            reasons[i].append(f"변동 {move[i]:+.2f}{'%p' if is_rate[i] else '%'} (robust z {z[i]:+.1f})")
+
+        # 스프레드: 이 행에 없는 쪽은 직전 값으로 계산, 한쪽이 이미 걸렸으면 원인이 분명하므로 생략
+        current = np.where(present, row, last)
+        flagged = out_of_range | jump
+        for (a, b, tol), ref_spread in zip(pairs, spread_center):
+            if flagged[a] or flagged[b]:
+                continue
+            spread = current[a] - current[b]
+            if np.isnan(ref_spread) or np.isnan(spread) or abs(spread - ref_spread) <= tol:
+                continue
+            for i in (a, b):
+                if present[i]:
+                    reasons[i].append(
+                        f"{columns[a]}-{columns[b]} 스프레드 {spread:+.2f} (최근 중앙값 {ref_spread:+.2f})"
+                    )
+
+        suspect = np.array([bool(r) for r in reasons])
+        for i in np.flatnonzero(suspect):
+            records.append(
+                {
+                    "date": pd.Timestamp(date).strftime("%Y-%m-%d"),
+                    "indicator": columns[i],
+                    "value": float(row[i]),
+                    "reference": None if np.isnan(last[i]) else float(last[i]),
+                    "reasons": " / ".join(reasons[i]),
+                }
+            )
+            clean.loc[date, columns[i]] = np.nan
+
+        # 다음 행(당일)은 통과한 전일 값 기준으로 비교
+        last = np.where(present & ~suspect, row, last)
+
+    return clean.dropna(how="all"), records
+
+
+# =============================================================================
+# 격리 기록 (sqlite)
+# =============================================================================
+
+
+def _connect(path, readonly=False):
+    """readonly면 파일을 만들지 않음 (없으면 sqlite3.Error) - 대시보드 조회는 부작용 없이"""
+    if readonly:
+        return closing(sqlite3.connect(f"file:{os.path.abspath(path)}?mode=ro", uri=True, timeout=10))
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    conn = sqlite3.connect(path, timeout=10)
+    conn.executescript(QUARANTINE_SCHEMA)
+    return closing(conn)
+
+
+def quarantine(records, path=QUARANTINE_PATH):
+    """격리 기록 저장 (같은 날짜/지표/값은 1번만). 저장 실패해도 로딩은 계속"""
+    if not records:
+        return 0
+    detected_at = datetime.now().isoformat(timespec="seconds")
+    rows = [
+        (r["date"], r["indicator"], r["value"], r["reference"], r["reasons"], detected_at)
+        for r in records
+    ]
+    try:
+        with _db_lock, _connect(path) as conn, conn:
+            before = conn.total_changes
+            conn.executemany(
+                "INSERT OR IGNORE INTO quarantine VALUES (?, ?, ?, ?, ?, ?)", rows
+            )
+            added = conn.total_changes - before
+        recent_quarantine.clear()
+        return added
+    except (sqlite3.Error, OSError):
+        return 0
+
+
+@memoize(ttl=60, maxsize=4)
+def recent_quarantine(days=7, path=QUARANTINE_PATH):
+    """최근 days일 동안 격리된 값 (기준일 내림차순 DataFrame, 기록이 없으면 빈 DataFrame)"""
+    columns = ["date", "indicator", "value", "reference", "reasons", "detected_at"]
+    since = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
+    try:
+        with _db_lock, _connect(path, readonly=True) as conn:
+            rows = conn.execute(
+                "SELECT * FROM quarantine WHERE date >= ? ORDER BY date DESC, indicator", (since,)
+            ).fetchall()
+    except (sqlite3.Error, OSError):
+        rows = []
+    return pd.DataFrame(rows, columns=columns)